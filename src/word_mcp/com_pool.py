@@ -1,36 +1,265 @@
 """
 COM process pool for word-mcp.
 
-This module provides a semaphore-limited COM instance pool to prevent resource
-exhaustion under concurrent load. Instead of creating unlimited Word COM instances
-(one per operation), the pool limits concurrent instances to a configurable maximum
-(default: 3).
+This module provides a reusable Word COM instance pool to prevent resource
+exhaustion under concurrent load and to avoid paying WINWORD.EXE startup and
+teardown cost on every operation. Instead of creating one Word COM instance per
+operation, the pool keeps up to a configurable maximum (default: 3) of warm
+instances and hands them out to callers.
 
 Key design:
-- threading.Semaphore (NOT asyncio) for concurrency limiting since MCP tools are sync
+- queue.SimpleQueue of slot tokens (NOT asyncio) since MCP tools are sync; a
+  caller holds a token while it has an instance checked out, which bounds
+  concurrent checkouts to pool_size
+- Idle instances are kept on a stack and the most recently used one is handed
+  out first; a new instance is spawned (lazily) only when none is idle, so
+  sequential calls keep reusing one warm instance
+- Instances are recycled (quit and respawned) after max_uses checkouts to bound
+  COM handle leaks inside long-lived WINWORD.EXE processes
+- Instances left idle for idle_timeout seconds are quit by a timer, so a quiet
+  server does not hold WINWORD.EXE memory indefinitely
+- Saved documents can be kept open on their instance between calls
+  (open_document / keep_document), keyed by path and checked against the
+  file's mtime and size, so consecutive COM operations on one file skip
+  Documents.Open. Word locks files it has open: anything else writing the file
+  calls release_document() first, and kept documents close after
+  DOCUMENT_IDLE_TIMEOUT seconds without use
+- gc.collect() only every gc_interval releases (and after quitting instances),
+  and only on Windows where synchronous COM handle release matters
+- Each instance is put in fast mode once, at spawn: as-you-type checks,
+  autoformat, background repagination, background saves and AutoRecover
+  saves are switched off (_FASTMODE_OPTIONS). Word persists its Options for
+  the user, so the original values are recorded and written back just
+  before the instance quits; if the server is killed, they stay off until
+  the next clean shutdown restores them or the user turns them back on
+- Instances are early-bound: the first spawn generates (or loads) pywin32's
+  makepy wrapper for Word's type library, so property and method names are
+  resolved to DISPIDs once rather than by a GetIDsOfNames round trip on
+  every access. If that fails, instances stay late-bound
 - Context manager interface compatible with existing WordApplication pattern
+- COM is initialized once per calling thread in the multithreaded apartment,
+  so pooled instances can be handed between worker threads without
+  cross-apartment marshalling
 - Lifecycle tracking for observability (active instances, total created, failures)
-- Emergency cleanup for graceful shutdown
+- Emergency cleanup for graceful shutdown, bounded by a timeout: each instance
+  is quit on its own thread, and WINWORD.EXE processes that do not exit in
+  time are terminated by PID (recorded with psutil at spawn); an atexit hook
+  runs it if the server exits without its normal shutdown
 """
 
+import atexit
+import logging
+import os
+import sys
 import threading
+import queue
 import gc
+import time
+from collections import OrderedDict
 from contextlib import contextmanager
-from typing import Dict
-import win32com.client
+from typing import Dict, Final, Iterable, List, Optional, Set, Tuple
+
+import psutil
+
+# Must be set before pythoncom is first imported: makes the implicit
+# CoInitializeEx for the importing thread use the multithreaded apartment
+sys.coinit_flags = 0  # COINIT_MULTITHREADED
+
+import pythoncom
+from win32com.client import DispatchEx as _DispatchEx, gencache as _gencache
 
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Word constants
+WD_ALERTS_NONE: Final[int] = 0
+WD_DO_NOT_SAVE_CHANGES: Final[int] = 0
+
+# Seconds close_all() waits for instances to quit before killing them
+SHUTDOWN_TIMEOUT: Final[float] = 5.0
+# Seconds a terminated WINWORD.EXE gets to exit before it is killed
+KILL_GRACE_PERIOD: Final[float] = 2.0
+# Seconds an idle instance is kept warm before it is quit
+IDLE_TIMEOUT: Final[float] = 600.0
+# Saved documents kept open across calls, and seconds one stays open unused
+DOCUMENT_CACHE_SIZE: Final[int] = 4
+DOCUMENT_IDLE_TIMEOUT: Final[float] = 30.0
+
+# Word Options that add per-edit work (as-you-type checks, autoformat,
+# background repagination, background and AutoRecover saves), with the value
+# each is set to while an instance is pooled
+_FASTMODE_OPTIONS: Final = (
+    ("CheckSpellingAsYouType", False),
+    ("CheckGrammarAsYouType", False),
+    ("AutoFormatAsYouTypeReplaceHyperlinks", False),
+    ("Pagination", False),
+    ("BackgroundSave", False),
+    ("SaveInterval", 0),
+)
+# Word.Application properties likewise set for the life of an instance
+_FASTMODE_APP_SETTINGS: Final = (
+    ("CheckLanguage", False),
+)
+
+
+# Set when generating the makepy wrapper failed; later spawns stay late-bound
+_early_binding_failed = False
+
+
+def _early_bound(app):
+    """
+    Wrap a late-bound Word.Application in its makepy (early-bound) class.
+
+    Early-bound wrappers resolve member names to DISPIDs from the generated
+    module instead of asking Word with GetIDsOfNames on each access. Once the
+    module is in pywin32's gen_py cache, DispatchEx already returns the
+    early-bound class and this is a no-op.
+    """
+    global _early_binding_failed
+    if _early_binding_failed or getattr(type(app), "CLSID", None) is not None:
+        return app
+    try:
+        return _gencache.EnsureDispatch(app)
+    except Exception as e:
+        _early_binding_failed = True
+        logger.warning("com_early_binding_failed", error=str(e))
+        return app
+
+
+def file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _winword_pids() -> Set[int]:
+    """PIDs of all running WINWORD.EXE processes."""
+    pids = set()
+    for proc in psutil.process_iter(["name"]):
+        name = proc.info["name"]
+        if name and name.lower() == "winword.exe":
+            pids.add(proc.pid)
+    return pids
+
+
+def _kill_processes(pids: Iterable[int], grace: float = KILL_GRACE_PERIOD):
+    """
+    Terminate WINWORD.EXE processes, killing those still alive after grace seconds.
+
+    PIDs that have exited (or been reused by another program) are skipped.
+    """
+    procs = []
+    for pid in pids:
+        try:
+            proc = psutil.Process(pid)
+            if (proc.name() or "").lower() != "winword.exe":
+                continue
+            proc.terminate()
+            procs.append(proc)
+        except psutil.Error:
+            continue
+
+    if not procs:
+        return
+
+    gone, alive = psutil.wait_procs(procs, timeout=grace)
+    for proc in alive:
+        try:
+            proc.kill()
+        except psutil.Error:
+            pass
+
+    logger.warning(
+        "com_instances_killed",
+        terminated=[proc.pid for proc in gone],
+        killed=[proc.pid for proc in alive]
+    )
+
+
+def _enter_fastmode(app) -> List[Tuple[object, str, object]]:
+    """
+    Apply _FASTMODE_OPTIONS and _FASTMODE_APP_SETTINGS to a Word instance.
+
+    Only settings that differ from their fast value are written. A setting
+    that cannot be read or set is skipped.
+
+    Returns:
+        (target, name, original value) for every setting that was changed,
+        to be passed to _exit_fastmode()
+    """
+    changed = []
+    try:
+        targets = [(app.Options, _FASTMODE_OPTIONS), (app, _FASTMODE_APP_SETTINGS)]
+    except Exception as e:
+        logger.debug("com_fastmode_option_failed", error=str(e))
+        return changed
+
+    for target, settings in targets:
+        for name, value in settings:
+            try:
+                original = getattr(target, name)
+                if original != value:
+                    setattr(target, name, value)
+                    changed.append((target, name, original))
+            except Exception as e:
+                logger.debug("com_fastmode_option_failed", option=name, error=str(e))
+    return changed
+
+
+def _exit_fastmode(changed: List[Tuple[object, str, object]]):
+    """Restore the settings recorded by _enter_fastmode()."""
+    for target, name, original in reversed(changed):
+        try:
+            setattr(target, name, original)
+        except Exception as e:
+            logger.warning("com_fastmode_restore_failed", option=name, error=str(e))
+
+
+@contextmanager
+def word_fastmode(app):
+    """
+    Turn off screen updating on a Word instance for a block.
+
+    The pool already keeps its instances' as-you-type, repagination and
+    save options off for their whole life (see _enter_fastmode), so this
+    only touches ScreenUpdating, which Word does not persist.
+
+    Args:
+        app: Word.Application COM object
+
+    Example:
+        with com_pool.get_word_app() as word, word_fastmode(word):
+            doc = word.Documents.Open(abs_path)
+            ...
+    """
+    try:
+        screen_updating = app.ScreenUpdating
+        app.ScreenUpdating = False
+    except Exception:
+        screen_updating = None
+
+    try:
+        yield app
+    finally:
+        if screen_updating is not None:
+            try:
+                app.ScreenUpdating = screen_updating
+            except Exception:
+                pass
+
 
 class COMPool:
     """
-    COM instance pool with semaphore-based concurrency limiting.
+    Reusable COM instance pool with a bounded number of Word instances.
 
     Limits the number of concurrent Word COM instances to prevent resource
-    exhaustion. Provides a context manager interface compatible with the
-    existing WordApplication pattern.
+    exhaustion and keeps idle instances warm between operations. Provides a
+    context manager interface compatible with the existing WordApplication
+    pattern.
 
     Usage:
         with com_pool.get_word_app() as word:
@@ -40,32 +269,306 @@ class COMPool:
             doc.Close()
     """
 
-    def __init__(self, pool_size: int = 3):
+    def __init__(
+        self,
+        pool_size: int = 3,
+        max_uses: int = 50,
+        gc_interval: int = 16,
+        idle_timeout: Optional[float] = IDLE_TIMEOUT
+    ):
         """
         Initialize COM pool with concurrency limit.
 
         Args:
             pool_size: Maximum number of concurrent Word instances (default: 3)
+            max_uses: Number of checkouts after which an instance is quit and
+                      replaced by a fresh one (default: 50)
+            gc_interval: Number of releases between forced garbage collections
+                         (default: 16)
+            idle_timeout: Seconds an idle instance is kept before it is quit,
+                          or None to keep instances until shutdown
+                          (default: IDLE_TIMEOUT)
         """
         self.pool_size = pool_size
-        self._semaphore = threading.Semaphore(pool_size)
-        self._active_instances = []
+        self.max_uses = max_uses
+        self.gc_interval = gc_interval
+        self.idle_timeout = idle_timeout
+        self._ops_since_gc = 0
+
+        # Slot tokens, one per instance that may be checked out at a time.
+        # SimpleQueue: unbounded C-level FIFO without Queue's task tracking
+        # and condition variables, which the slot handoff does not need
+        self._idle = queue.SimpleQueue()
+        self._generation = 0
+        self._refill_slots()
+        # Idle warm instances, most recently returned last
+        self._warm: List[object] = []
+
+        # Keyed by id(app): membership tests on COM objects would go through
+        # COM __eq__ (a cross-process QueryInterface per comparison)
+        self._active_instances: Dict[int, object] = {}
+        self._live_instances: Dict[int, object] = {}
+        self._use_counts: Dict[int, int] = {}
+        # WINWORD.EXE PID per instance, when it could be determined at spawn
+        self._pids: Dict[int, int] = {}
+        # Settings changed per instance (by _enter_fastmode() and
+        # set_user_name()), restored at quit
+        self._fastmode: Dict[int, List[Tuple[object, str, object]]] = {}
+        # Application.UserName last set through set_user_name(), per instance
+        self._user_names: Dict[int, str] = {}
+        # time.monotonic() at which each idle instance was returned to the pool
+        self._idle_since: Dict[int, float] = {}
+        # Pending idle-reaper timer, if any, and the time.monotonic() it fires at
+        self._reaper: Optional[threading.Timer] = None
+        self._reaper_deadline = 0.0
+        # Kept documents by path: (id(app), COM document, file stamp, time kept)
+        self._documents: "OrderedDict[str, Tuple[int, object, Tuple[int, int], float]]" = OrderedDict()
         self._lock = threading.Lock()
+        # Serializes spawns so each new WINWORD.EXE PID is attributed correctly
+        self._spawn_lock = threading.Lock()
+
+        # Per-thread flag: has this thread joined the COM MTA yet?
+        self._com_thread = threading.local()
 
-        # Metrics
+        # Metrics (guarded by _lock)
         self.total_created = 0
         self.total_failed = 0
 
-        logger.debug("com_pool_initialized", pool_size=pool_size)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("com_pool_initialized", pool_size=pool_size, max_uses=max_uses)
+
+    def _spawn(self, visible: bool):
+        """
+        Create a new Word COM instance and register it with the pool.
+
+        Args:
+            visible: Whether Word window should be visible
+
+        Returns:
+            Word.Application COM object
+        """
+        # DispatchEx for isolated instance; its process is the WINWORD.EXE
+        # that was not running before
+        with self._spawn_lock:
+            before = _winword_pids()
+            app = _DispatchEx("Word.Application")
+            new_pids = _winword_pids() - before
+        app = _early_bound(app)
+        app.Visible = visible
+        app.DisplayAlerts = WD_ALERTS_NONE  # prevent automation hangs
+        fastmode = _enter_fastmode(app)
+
+        with self._lock:
+            self._live_instances[id(app)] = app
+            self._fastmode[id(app)] = fastmode
+            self._use_counts[id(app)] = 0
+            if len(new_pids) == 1:
+                self._pids[id(app)] = new_pids.pop()
+            self.total_created += 1
+            total_created = self.total_created
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "com_instance_created",
+                binding=type(app).__name__,
+                live_count=len(self._live_instances),
+                total_created=total_created,
+                pool_size=self.pool_size
+            )
+        return app
+
+    def _close_documents(self, app):
+        """Close any documents left open on an instance without saving, except kept ones."""
+        with self._lock:
+            kept = {
+                os.path.normcase(path)
+                for path, entry in self._documents.items()
+                if entry[0] == id(app)
+            }
+
+        # Bind the collection and read Count once: each property access is
+        # an out-of-process COM call
+        docs = app.Documents
+        if not kept:
+            for _ in range(docs.Count):
+                # Closing shifts the rest down, so always close the first one
+                docs(1).Close(SaveChanges=WD_DO_NOT_SAVE_CHANGES)
+            return
+
+        for index in range(docs.Count, 0, -1):
+            doc = docs(index)
+            if os.path.normcase(doc.FullName) not in kept:
+                doc.Close(SaveChanges=WD_DO_NOT_SAVE_CHANGES)
+
+    def open_document(self, app, path: str):
+        """
+        Open a saved document on a checked-out instance, reusing a kept one.
+
+        A document left open by keep_document() on the same instance is
+        returned as-is if the file is unchanged since (same mtime and size);
+        otherwise any kept copy is closed and the file is opened afresh.
+
+        Args:
+            app: Word.Application from get_word_app()
+            path: Absolute path of the document
+
+        Returns:
+            Word Document COM object
+        """
+        with self._lock:
+            entry = self._documents.pop(path, None)
+        if entry is not None:
+            app_id, com_doc, stamp, _ = entry
+            if app_id == id(app) and stamp == file_stamp(path):
+                return com_doc
+            self._discard_document(com_doc)
+        return app.Documents.Open(path)
+
+    def set_user_name(self, app, author: str):
+        """
+        Set the name Word records as the author of new revisions on an instance.
+
+        Application.UserName is the Office user identity, which Word
+        persists and shares with the user's own Word, so the original name
+        is restored along with the fast-mode settings before the instance
+        quits. The name is only written when it changes, so repeated edits
+        by one author skip the cross-process call.
+
+        Args:
+            app: Word.Application COM object checked out from this pool
+            author: Author name for revisions
+        """
+        key = id(app)
+        with self._lock:
+            current = self._user_names.get(key)
+        if current == author:
+            return
+
+        original = app.UserName if current is None else None
+        app.UserName = author
+        with self._lock:
+            if key not in self._live_instances:
+                return
+            self._user_names[key] = author
+            if current is None and key in self._fastmode:
+                self._fastmode[key].append((app, "UserName", original))
+
+    def keep_document(self, app, path: str, com_doc):
+        """
+        Leave a document open on its instance for the next open_document(path).
+
+        Used in place of Close() once the document is saved. A document with
+        unsaved changes is closed without saving instead. Beyond
+        DOCUMENT_CACHE_SIZE kept documents, the least recently kept is closed.
+
+        Args:
+            app: Word.Application the document is open on
+            path: Absolute path the document was opened with
+            com_doc: Word Document COM object
+        """
+        try:
+            saved = com_doc.Saved
+        except Exception:
+            saved = False
+        stamp = file_stamp(path)
+        if not saved or stamp is None:
+            self._discard_document(com_doc)
+            return
+
+        evicted = []
+        with self._lock:
+            self._documents[path] = (id(app), com_doc, stamp, time.monotonic())
+            while len(self._documents) > DOCUMENT_CACHE_SIZE:
+                evicted.append(self._documents.popitem(last=False)[1][1])
+        for doc in evicted:
+            self._discard_document(doc)
+        self._schedule_reaper()
+
+    def release_document(self, path: str):
+        """
+        Close the kept document for path, if any, so Word no longer locks the file.
+
+        Called before the file is written by anything other than Word, and when
+        the document is closed.
+
+        Args:
+            path: Absolute path of the document
+        """
+        with self._lock:
+            entry = self._documents.pop(path, None)
+        if entry is not None:
+            self._ensure_com_initialized()
+            self._discard_document(entry[1])
+
+    def _discard_document(self, com_doc):
+        """Close a document without saving, logging (not raising) failures."""
+        try:
+            com_doc.Close(SaveChanges=WD_DO_NOT_SAVE_CHANGES)
+        except Exception as e:
+            logger.warning("com_document_close_failed", error=str(e))
+
+    def _quit(self, app):
+        """
+        Quit a Word instance and drop it from pool tracking.
+
+        This is the cold path (recycle, broken instance), so the caller
+        forces COM reference cleanup afterwards.
+        """
+        try:
+            self._restore_options(app)
+            app.Quit()
+        except Exception as e:
+            logger.warning("com_quit_failed", error=str(e))
+        finally:
+            with self._lock:
+                self._live_instances.pop(id(app), None)
+                self._use_counts.pop(id(app), None)
+                self._pids.pop(id(app), None)
+                self._idle_since.pop(id(app), None)
+                self._fastmode.pop(id(app), None)
+                self._user_names.pop(id(app), None)
+                # Its kept documents go with it
+                for path in [path for path, entry in self._documents.items() if entry[0] == id(app)]:
+                    del self._documents[path]
+                live_count = len(self._live_instances)
+
+            del app
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "com_instance_quit",
+                    live_count=live_count,
+                    pool_size=self.pool_size
+                )
+
+    def _ensure_com_initialized(self):
+        """
+        Initialize COM for the calling thread, once per thread.
+
+        Every thread that touches a Word instance joins the multithreaded
+        apartment, so instances spawned on one pool thread can be used from
+        another without marshalling. Threads are never uninitialized: they
+        keep serving pooled work for the life of the process.
+        """
+        if getattr(self._com_thread, "initialized", False):
+            return
+        try:
+            pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+        except pythoncom.com_error as e:
+            # Thread was already initialized into another apartment by
+            # someone else; COM stays usable, just not in the MTA
+            logger.warning("com_thread_init_failed", error=str(e))
+        self._com_thread.initialized = True
 
     @contextmanager
     def get_word_app(self, visible: bool = False):
         """
-        Get a Word COM application instance with semaphore limiting.
+        Get a Word COM application instance from the pool.
 
-        Returns a context manager that acquires a semaphore slot, creates a
-        Word COM instance, and ensures cleanup on exit. Interface is compatible
-        with existing WordApplication context manager.
+        Returns a context manager that takes a pool slot (blocking while
+        pool_size instances are checked out), reuses the most recently used
+        idle Word instance or spawns one, and returns it to the pool on exit.
+        Interface is compatible with existing WordApplication context manager.
 
         Args:
             visible: Whether Word window should be visible (default: False)
@@ -79,119 +582,377 @@ class COMPool:
                 doc.Save()
                 doc.Close()
         """
-        # Acquire semaphore (blocks if pool_size instances already running)
-        self._semaphore.acquire()
+        self._ensure_com_initialized()
+
+        # Take a slot (blocks if pool_size instances are checked out)
+        self._idle.get()
+        generation = self._generation
 
         app = None
         try:
-            # Create Word COM instance (DispatchEx for isolated instance)
-            app = win32com.client.DispatchEx("Word.Application")
-            app.Visible = visible
-            app.DisplayAlerts = 0  # wdAlertsNone - prevent automation hangs
+            with self._lock:
+                if self._warm:
+                    app = self._warm.pop()
+                    self._idle_since.pop(id(app), None)
+
+            if app is None:
+                app = self._spawn(visible)
+            else:
+                app.Visible = visible
 
             # Track active instance
             with self._lock:
-                self._active_instances.append(app)
-                self.total_created += 1
+                self._active_instances[id(app)] = app
                 active_count = len(self._active_instances)
 
-            logger.debug(
-                "com_instance_created",
-                active_count=active_count,
-                total_created=self.total_created,
-                pool_size=self.pool_size
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "com_instance_acquired",
+                    active_count=active_count,
+                    pool_size=self.pool_size
+                )
 
             yield app
 
         except Exception as e:
             with self._lock:
                 self.total_failed += 1
+                total_failed = self.total_failed
             logger.error(
                 "com_instance_creation_failed",
                 error=str(e),
                 error_type=type(e).__name__,
-                total_failed=self.total_failed
+                total_failed=total_failed
             )
             raise
 
         finally:
-            # Cleanup: close documents, quit Word, release COM references
-            if app:
-                try:
-                    # Close any open documents without saving
-                    while app.Documents.Count > 0:
-                        app.Documents(1).Close(SaveChanges=0)  # wdDoNotSaveChanges
-                except Exception as e:
-                    logger.warning("com_document_cleanup_failed", error=str(e))
-
-                try:
-                    app.Quit()
-                except Exception as e:
-                    logger.warning("com_quit_failed", error=str(e))
-
-                finally:
-                    # Remove from active instances
-                    with self._lock:
-                        if app in self._active_instances:
-                            self._active_instances.remove(app)
-                        active_count = len(self._active_instances)
-
-                    # Force COM reference cleanup
-                    del app
-                    gc.collect()
-
-                    logger.debug(
-                        "com_instance_cleaned_up",
-                        active_count=active_count,
-                        pool_size=self.pool_size
-                    )
-
-            # Release semaphore slot
-            self._semaphore.release()
-
-    def close_all(self):
-        """
-        Emergency cleanup: close all active COM instances.
+            # Return the instance to the pool instead of quitting it
+            self._release(app, generation)
+
+    def prewarm(self, count: int = None, visible: bool = False) -> int:
+        """
+        Spawn idle Word instances ahead of the first request.
+
+        Spawns instances until count have been warmed or pool_size are
+        running, so the first tool calls skip the multi-second Word startup.
+        Each spawn holds a slot, so callers are never handed more than
+        pool_size instances at once.
+
+        Args:
+            count: Number of instances to warm (default: pool_size; capped
+                   at pool_size)
+            visible: Whether Word windows should be visible (default: False)
+
+        Returns:
+            Number of instances spawned
+        """
+        if count is None:
+            count = self.pool_size
+        count = min(count, self.pool_size)
+        if count <= 0:
+            return 0
+
+        self._ensure_com_initialized()
+
+        generation = self._generation
+        warmed = 0
+
+        while warmed < count:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+
+            app = None
+            try:
+                with self._lock:
+                    if len(self._live_instances) >= self.pool_size:
+                        break
+                app = self._spawn(visible)
+                warmed += 1
+                with self._lock:
+                    if generation == self._generation:
+                        self._warm.insert(0, app)
+                        self._idle_since[id(app)] = time.monotonic()
+                        app = None
+            except Exception as e:
+                # Word is unavailable: stop
+                logger.warning("com_prewarm_failed", error=str(e), error_type=type(e).__name__)
+                break
+            finally:
+                # close_all() ran meanwhile: it has reset the slots
+                if generation == self._generation:
+                    self._idle.put(None)
+
+            if app is not None:
+                self._quit(app)
+                break
+
+        logger.info("com_pool_prewarmed", warmed=warmed, requested=count)
+        if warmed:
+            self._schedule_reaper()
+        return warmed
+
+    def _release(self, app, generation: int):
+        """
+        Return a checked-out instance to the idle stack and its slot to the queue.
+
+        Lingering documents are closed without saving. Instances that fail
+        cleanup or have reached max_uses are quit, so a fresh instance is
+        spawned lazily on next use.
+
+        Args:
+            app: Word.Application COM object, or None if spawning failed
+            generation: Pool generation at checkout time
+        """
+        with self._lock:
+            if app is not None:
+                self._active_instances.pop(id(app), None)
+
+            # close_all() ran while this instance was checked out: it has
+            # already been quit and the slots have been reset
+            if generation != self._generation:
+                return
+
+            uses = 0
+            if app is not None:
+                uses = self._use_counts.get(id(app), 0) + 1
+                self._use_counts[id(app)] = uses
+
+        kept = False
+        if app is not None:
+            healthy = True
+            try:
+                # Close any documents the caller left open without saving
+                self._close_documents(app)
+            except Exception as e:
+                healthy = False
+                logger.warning("com_document_cleanup_failed", error=str(e))
+
+            with self._lock:
+                # A spawn racing prewarm() can overshoot pool_size: shed the extra
+                if healthy and uses < self.max_uses and len(self._live_instances) <= self.pool_size:
+                    self._warm.append(app)
+                    self._idle_since[id(app)] = time.monotonic()
+                    kept = True
+
+            if not kept:
+                # Broken, worn out or surplus: quit now, respawn lazily on next use
+                self._quit(app)
+
+        self._idle.put(None)
+        if kept:
+            self._schedule_reaper()
+
+        # Force COM reference cleanup right after a quit, otherwise periodically
+        self._maybe_collect(force=app is not None and not kept)
+
+    def _schedule_reaper(self):
+        """
+        Arm the reaper timer for the next idle instance or kept document to expire.
+
+        A timer already armed for a later deadline (e.g. an instance's
+        idle_timeout) is replaced, so a newly kept document is still closed
+        after DOCUMENT_IDLE_TIMEOUT.
+        """
+        with self._lock:
+            deadlines = [entry[3] + DOCUMENT_IDLE_TIMEOUT for entry in self._documents.values()]
+            if self.idle_timeout is not None:
+                deadlines.extend(since + self.idle_timeout for since in self._idle_since.values())
+            if not deadlines:
+                return
+            deadline = min(deadlines)
+            if self._reaper is not None:
+                if self._reaper_deadline <= deadline:
+                    return
+                self._reaper.cancel()
+            self._reaper_deadline = deadline
+            self._reaper = threading.Timer(max(0.0, deadline - time.monotonic()), self._reap_idle)
+            self._reaper.daemon = True
+            self._reaper.start()
+
+    def _reap_idle(self):
+        """
+        Timer callback: close kept documents unused for DOCUMENT_IDLE_TIMEOUT,
+        quit instances idle for idle_timeout, then re-arm.
+        """
+        self._ensure_com_initialized()
+
+        now = time.monotonic()
+        with self._lock:
+            # A timer replaced after it fired must not clear its successor
+            if self._reaper is threading.current_thread():
+                self._reaper = None
+            stale_docs = [
+                path for path, entry in self._documents.items()
+                if now - entry[3] >= DOCUMENT_IDLE_TIMEOUT
+            ]
+            stale_docs = [self._documents.pop(path)[1] for path in stale_docs]
+        while stale_docs:
+            self._discard_document(stale_docs.pop())
+
+        if self.idle_timeout is None:
+            self._schedule_reaper()
+            return
+
+        with self._lock:
+            expired = [
+                app for app in self._warm
+                if now - self._idle_since.get(id(app), now) >= self.idle_timeout
+            ]
+            if expired:
+                expired_ids = {id(app) for app in expired}
+                self._warm = [app for app in self._warm if id(app) not in expired_ids]
+                for app_id in expired_ids:
+                    self._idle_since.pop(app_id, None)
+
+        reaped = len(expired)
+        while expired:
+            self._quit(expired.pop())
+
+        if reaped:
+            logger.info("com_idle_instances_quit", count=reaped, idle_timeout=self.idle_timeout)
+            self._maybe_collect(force=True)
+        self._schedule_reaper()
+
+    def _maybe_collect(self, force: bool = False):
+        """
+        Run gc.collect() every gc_interval releases instead of on every call.
+
+        Only Windows needs synchronous release of COM references (and the file
+        handles Word holds behind them), so this is a no-op elsewhere.
+
+        Args:
+            force: Collect now regardless of the release counter
+        """
+        if sys.platform != "win32":
+            return
+
+        with self._lock:
+            self._ops_since_gc += 1
+            due = force or self._ops_since_gc >= self.gc_interval
+            if due:
+                self._ops_since_gc = 0
+
+        if due:
+            gc.collect()
+
+    def close_all(self, timeout: Optional[float] = SHUTDOWN_TIMEOUT):
+        """
+        Emergency cleanup: close all live COM instances.
 
         Called during server shutdown to ensure no zombie WINWORD.EXE processes
-        remain. Iterates through all tracked instances and attempts cleanup.
+        remain. Drains the idle queue and quits every tracked instance, including
+        any still checked out. Instances are quit concurrently; any that have
+        not finished after timeout seconds (e.g. Word stuck on a dialog) have
+        their process terminated.
+
+        Args:
+            timeout: Seconds to wait for instances to quit, or None to wait
+                     indefinitely (default: SHUTDOWN_TIMEOUT)
         """
+        # Shutdown may run on a thread that never checked out an instance
+        self._ensure_com_initialized()
+
         with self._lock:
-            instances_to_close = list(self._active_instances)
+            # Instances checked out right now must not come back to the pool
+            self._generation += 1
+            if self._reaper is not None:
+                self._reaper.cancel()
+                self._reaper = None
+            self._warm.clear()
+            self._idle_since.clear()
+            # Their instances are quit below, which closes them
+            self._documents.clear()
+
+        # Drain idle slots so no new checkouts start
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+
+        with self._lock:
+            instances_to_close = [
+                (app, self._pids.get(key)) for key, app in self._live_instances.items()
+            ]
             count = len(instances_to_close)
 
         if count == 0:
+            self._refill_slots()
             logger.info("com_pool_shutdown_no_active_instances")
             return
 
         logger.info("com_pool_shutdown_closing_instances", count=count)
 
-        for app in instances_to_close:
-            try:
-                # Close documents without saving
-                while app.Documents.Count > 0:
-                    app.Documents(1).Close(SaveChanges=0)
-            except Exception as e:
-                logger.warning("com_shutdown_document_cleanup_failed", error=str(e))
-
-            try:
-                app.Quit()
-            except Exception as e:
-                logger.warning("com_shutdown_quit_failed", error=str(e))
-
-            finally:
-                try:
-                    del app
-                except Exception:
-                    pass
+        # Plain daemon threads rather than an executor: close_all() also runs
+        # from the atexit hook, after executors stop accepting work
+        threads = {}
+        for app, pid in instances_to_close:
+            thread = threading.Thread(
+                target=self._shutdown_instance, args=(app,), name="word-mcp-com-close", daemon=True
+            )
+            thread.start()
+            threads[thread] = pid
+        del instances_to_close, app
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        # Do not wait for hung quits: their processes are killed below, which
+        # makes the blocked COM calls fail and the threads exit
+        not_done = [thread for thread in threads if thread.is_alive()]
+
+        if not_done:
+            stuck_pids = [threads[thread] for thread in not_done]
+            logger.warning(
+                "com_shutdown_timed_out",
+                count=len(not_done),
+                timeout=timeout,
+                pids=stuck_pids
+            )
+            _kill_processes(pid for pid in stuck_pids if pid is not None)
 
         # Clear tracking
         with self._lock:
             self._active_instances.clear()
+            self._live_instances.clear()
+            self._use_counts.clear()
+            self._pids.clear()
 
-        gc.collect()
-        logger.info("com_pool_shutdown_complete", instances_closed=count)
+        self._refill_slots()
+        self._maybe_collect(force=True)
+        logger.info("com_pool_shutdown_complete", instances_closed=count - len(not_done))
+
+    def _shutdown_instance(self, app):
+        """Close an instance's documents without saving and quit it (close_all worker)."""
+        self._ensure_com_initialized()
+
+        try:
+            # Close documents without saving
+            self._close_documents(app)
+        except Exception as e:
+            logger.warning("com_shutdown_document_cleanup_failed", error=str(e))
+
+        try:
+            self._restore_options(app)
+            app.Quit()
+        except Exception as e:
+            logger.warning("com_shutdown_quit_failed", error=str(e))
+
+    def _restore_options(self, app):
+        """Write back the Word settings an instance's fast mode changed (before it quits)."""
+        with self._lock:
+            fastmode = self._fastmode.pop(id(app), None)
+            self._user_names.pop(id(app), None)
+        if fastmode:
+            _exit_fastmode(fastmode)
+
+    def _refill_slots(self):
+        """Reset the idle queue to pool_size slot tokens."""
+        for _ in range(self.pool_size):
+            self._idle.put(None)
 
     def get_metrics(self) -> Dict:
         """
@@ -199,23 +960,29 @@ class COMPool:
 
         Returns:
             Dictionary with current pool state:
-            - active_count: Number of currently active instances
+            - active_count: Number of currently checked-out instances
+            - live_count: Number of running Word instances (idle + checked out)
             - total_created: Total instances created since server start
-            - total_failed: Total failed instance creation attempts
+            - total_failed: Total failed operations on pooled instances
             - pool_size: Maximum concurrent instances allowed
-            - available_slots: Number of available semaphore slots
+            - available_slots: Number of idle slots that can be taken without blocking
         """
         with self._lock:
             active_count = len(self._active_instances)
+            live_count = len(self._live_instances)
+            total_created = self.total_created
+            total_failed = self.total_failed
 
-        # Calculate available slots (pool_size - active_count)
-        # Note: This is approximate since we can't query Semaphore._value directly
-        available_slots = self.pool_size - active_count
+        # Slots sitting in the idle queue are exactly the ones a caller can
+        # take without blocking (a slot leaves the queue before its instance
+        # is tracked as active, so pool_size - active_count would over-count)
+        available_slots = self._idle.qsize()
 
         return {
             "active_count": active_count,
-            "total_created": self.total_created,
-            "total_failed": self.total_failed,
+            "live_count": live_count,
+            "total_created": total_created,
+            "total_failed": total_failed,
             "pool_size": self.pool_size,
             "available_slots": available_slots
         }
@@ -223,3 +990,10 @@ class COMPool:
 
 # Module-level singleton
 com_pool = COMPool()
+
+
+@atexit.register
+def _close_pool_at_exit():
+    """Quit Word instances still running at interpreter exit (normally none)."""
+    if com_pool.get_metrics()["live_count"]:
+        com_pool.close_all()
@@ -9,15 +9,54 @@ Key behaviors:
 - Multi-document support: multiple documents can be open simultaneously
 - Error-on-overwrite: create_document() raises FileExistsError if target path exists
 - Explicit save only: documents are NOT auto-saved; changes persist only via save_document()
+  (or schedule_save(), which coalesces rapid repeated save requests into one write)
 - Path normalization: all paths converted to absolute using Path.resolve()
+- Thread safety: dict mutations are guarded by one short-held lock, while slow
+  disk I/O (load, save, reload) and the tools that read or edit a document
+  (decorated with document_locked) are serialized per document key only
+- Revisions: every load and every touch() gives a document a new revision
+  number, so callers can cache derived data and detect in-memory edits
+- File bytes: the .docx bytes read at load are kept while the file on disk is
+  unchanged, so ZIP readers (page count, revision scan) avoid re-reading it
 """
 
+import io
 import os
+import functools
+import itertools
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Set, Tuple, Union
 
 from docx import Document
 
+from .com_pool import com_pool
+from .errors import validate_document_size
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds a scheduled save waits for further save requests to coalesce with
+SAVE_COALESCE_DELAY = 0.25
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_path(path: str) -> str:
+    """
+    Resolve a path to its absolute, canonical form (memoized).
+
+    Path.resolve() stats every path component to follow symlinks, so results
+    are cached per input string. Call _resolve_path.cache_clear() when paths
+    may have been re-pointed (save-as, shutdown).
+
+    Args:
+        path: File path (absolute or relative)
+
+    Returns:
+        Absolute path as string
+    """
+    return str(Path(path).resolve())
+
 
 class DocumentManager:
     """
@@ -31,6 +70,23 @@ class DocumentManager:
     def __init__(self):
         self._documents: Dict[str, Document] = {}
         self._untitled_counter: int = 0
+        self._untitled_keys: Set[str] = set()
+
+        # Guards the dicts/sets above; held only for in-memory bookkeeping
+        self._lock = threading.RLock()
+        # Per-document locks so disk I/O on one document does not block others.
+        # Entries outlive close, save-as and close_all: another thread may
+        # still hold or wait on a key's lock, and a replacement lock would
+        # not exclude it
+        self._key_locks: Dict[str, threading.RLock] = {}
+        # Scheduled (coalesced) saves, one timer per document key
+        self._pending_saves: Dict[str, threading.Timer] = {}
+        # Current revision per document key; values are never reused, even
+        # when a key is (e.g. "Untitled-1" after close_all)
+        self._revisions: Dict[str, int] = {}
+        self._revision_counter = itertools.count(1)
+        # File bytes read at load, with the (mtime_ns, size) they were read at
+        self._file_bytes: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
 
     def _next_untitled(self) -> str:
         """
@@ -39,8 +95,11 @@ class DocumentManager:
         Returns:
             Unique untitled key like "Untitled-1", "Untitled-2", etc.
         """
-        self._untitled_counter += 1
-        return f"Untitled-{self._untitled_counter}"
+        with self._lock:
+            self._untitled_counter += 1
+            key = f"Untitled-{self._untitled_counter}"
+            self._untitled_keys.add(key)
+            return key
 
     def _normalize_path(self, path: str) -> str:
         """
@@ -52,7 +111,115 @@ class DocumentManager:
         Returns:
             Absolute path as string
         """
-        return str(Path(path).resolve())
+        return _resolve_path(path)
+
+    def resolve_path(self, path: str) -> str:
+        """
+        Convert a file path to absolute, canonical form, memoized per input string.
+
+        Tools use this instead of Path(path).resolve(), which stats every
+        path component on each call.
+
+        Args:
+            path: File path (absolute or relative)
+
+        Returns:
+            Absolute path as string
+        """
+        return _resolve_path(path)
+
+    def is_untitled(self, path: str) -> bool:
+        """
+        Check whether path is the key of an open, never-saved document.
+
+        A set lookup on the keys this manager issued, in place of a
+        "Untitled-" prefix check; a real file named "Untitled-..." is not
+        untitled.
+
+        Args:
+            path: "Untitled-N" key or file path
+
+        Returns:
+            True if path is an untitled document key
+        """
+        return path in self._untitled_keys
+
+    def _lookup_key(self, path: str) -> str:
+        """
+        Map a caller-supplied path or key to its documents dict key.
+
+        Untitled keys are recognized by membership in the set of keys this
+        manager issued, so a real file named "Untitled-..." is still resolved
+        as a path.
+
+        Args:
+            path: "Untitled-N" key or file path (absolute or relative)
+
+        Returns:
+            Untitled key unchanged, or absolute path as string
+        """
+        if path in self._untitled_keys:
+            return path
+        return self._normalize_path(path)
+
+    def _load(self, key: str, st: os.stat_result) -> Document:
+        """
+        Read a .docx file once and parse it from memory, keeping the bytes.
+
+        Args:
+            key: Absolute path of the file
+            st: os.stat() result for the file, taken before reading
+
+        Returns:
+            Document object
+        """
+        data = Path(key).read_bytes()
+        doc = Document(io.BytesIO(data))
+        with self._lock:
+            self._file_bytes[key] = ((st.st_mtime_ns, st.st_size), data)
+        return doc
+
+    def file_source(self, path: str) -> Union[str, io.BytesIO]:
+        """
+        Get a readable source for an open document's file on disk.
+
+        Returns the bytes read when the document was loaded if the file has
+        not changed since (same mtime and size), so callers such as
+        zipfile.ZipFile skip the disk read; otherwise the path itself.
+
+        Args:
+            path: Key/path of document
+
+        Returns:
+            In-memory copy of the file, or the absolute path
+        """
+        key = self._lookup_key(path)
+        cached = self._file_bytes.get(key)
+        if cached is not None:
+            try:
+                st = os.stat(key)
+            except OSError:
+                return key
+            if cached[0] == (st.st_mtime_ns, st.st_size):
+                return io.BytesIO(cached[1])
+        return key
+
+    def document_lock(self, path: str) -> threading.RLock:
+        """
+        Get the lock serializing disk I/O and tool access for one document.
+
+        Args:
+            path: "Untitled-N" key or file path (absolute or relative)
+
+        Returns:
+            Re-entrant lock dedicated to that document key
+        """
+        key = self._lookup_key(path)
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.RLock()
+            return lock
 
     def create_document(self, path: Optional[str] = None) -> tuple[str, Document]:
         """
@@ -75,15 +242,19 @@ class DocumentManager:
             abs_path = self._normalize_path(path)
 
             # Error-on-overwrite: check if file already exists
-            if Path(abs_path).exists():
+            if os.path.lexists(abs_path):
                 raise FileExistsError(f"File already exists at {abs_path}")
 
-            self._documents[abs_path] = doc
+            with self._lock:
+                self._documents[abs_path] = doc
+                self._revisions[abs_path] = next(self._revision_counter)
             return abs_path, doc
         else:
             # Generate temporary key
-            key = self._next_untitled()
-            self._documents[key] = doc
+            with self._lock:
+                key = self._next_untitled()
+                self._documents[key] = doc
+                self._revisions[key] = next(self._revision_counter)
             return key, doc
 
     def open_document(self, path: str) -> Document:
@@ -100,21 +271,62 @@ class DocumentManager:
 
         Raises:
             FileNotFoundError: If file doesn't exist at path
+            DocumentTooLargeError: If file exceeds the maximum document size
         """
         abs_path = self._normalize_path(path)
 
         # Return cached instance if already open
-        if abs_path in self._documents:
-            return self._documents[abs_path]
+        doc = self._documents.get(abs_path)
+        if doc is not None:
+            return doc
+
+        with self.document_lock(abs_path):
+            # Another thread may have loaded it while we waited
+            doc = self._documents.get(abs_path)
+            if doc is not None:
+                return doc
+
+            # Single stat covers both the existence check and the size limit
+            try:
+                st = os.stat(abs_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"File not found: {abs_path}")
+            validate_document_size(abs_path, st)
+
+            # Load from disk
+            doc = self._load(abs_path, st)
+            with self._lock:
+                self._documents[abs_path] = doc
+                self._revisions[abs_path] = next(self._revision_counter)
+            return doc
+
+    def reload_document(self, path: str) -> Document:
+        """
+        Replace an open document's in-memory state with its file on disk.
 
-        # Check file exists before attempting to open
-        if not Path(abs_path).exists():
-            raise FileNotFoundError(f"File not found: {abs_path}")
+        Used after COM automation has modified and saved the file, so the
+        python-docx object reflects the changes.
 
-        # Load from disk
-        doc = Document(abs_path)
-        self._documents[abs_path] = doc
-        return doc
+        Args:
+            path: Key/path of open document (must be saved to disk)
+
+        Returns:
+            Freshly loaded Document object
+
+        Raises:
+            ValueError: If document is not currently open
+        """
+        key = self._lookup_key(path)
+
+        with self.document_lock(key):
+            if key not in self._documents:
+                raise ValueError(f"Document not open: {path}")
+
+            doc = self._load(key, os.stat(key))
+            with self._lock:
+                self._documents[key] = doc
+                self._revisions[key] = next(self._revision_counter)
+            return doc
 
     def create_from_template(
         self,
@@ -136,12 +348,16 @@ class DocumentManager:
         Raises:
             FileNotFoundError: If template doesn't exist
             FileExistsError: If save_path provided and file already exists
+            DocumentTooLargeError: If template exceeds the maximum document size
         """
         abs_template = self._normalize_path(template_path)
 
-        # Check template exists
-        if not Path(abs_template).exists():
+        # Single stat covers both the existence check and the size limit
+        try:
+            st = os.stat(abs_template)
+        except OSError:
             raise FileNotFoundError(f"Template not found: {abs_template}")
+        validate_document_size(abs_template, st)
 
         # Create document from template
         doc = Document(abs_template)
@@ -150,15 +366,19 @@ class DocumentManager:
             abs_save = self._normalize_path(save_path)
 
             # Error-on-overwrite
-            if Path(abs_save).exists():
+            if os.path.lexists(abs_save):
                 raise FileExistsError(f"File already exists at {abs_save}")
 
-            self._documents[abs_save] = doc
+            with self._lock:
+                self._documents[abs_save] = doc
+                self._revisions[abs_save] = next(self._revision_counter)
             return abs_save, doc
         else:
             # Generate temporary key
-            key = self._next_untitled()
-            self._documents[key] = doc
+            with self._lock:
+                key = self._next_untitled()
+                self._documents[key] = doc
+                self._revisions[key] = next(self._revision_counter)
             return key, doc
 
     def save_document(self, path: str, save_as: Optional[str] = None):
@@ -174,36 +394,145 @@ class DocumentManager:
             ValueError: If document is not currently open
         """
         # Normalize current path
-        current_key = path if path.startswith("Untitled-") else self._normalize_path(path)
+        current_key = self._lookup_key(path)
 
-        if current_key not in self._documents:
-            raise ValueError(f"Document not open: {path}")
+        if save_as is None:
+            # This write supersedes any scheduled save of the same document
+            self._cancel_pending_save(current_key)
+        else:
+            # A scheduled save to the old path was requested first: honor it
+            self.flush_pending_saves(current_key)
+
+        with self.document_lock(current_key):
+            doc = self._documents.get(current_key)
+            if doc is None:
+                raise ValueError(f"Document not open: {path}")
+
+            if save_as is not None:
+                # Save-as: save to new path and re-key
+                abs_new = self._normalize_path(save_as)
+
+                # Create parent directories if needed
+                os.makedirs(os.path.dirname(abs_new), exist_ok=True)
+
+                # Word may hold the target open (and locked) from a COM call
+                com_pool.release_document(abs_new)
+                doc.save(abs_new)
+
+                # Re-key in dictionary (remove old key, add new)
+                with self._lock:
+                    del self._documents[current_key]
+                    self._untitled_keys.discard(current_key)
+                    self._documents[abs_new] = doc
+                    self._revisions.pop(current_key, None)
+                    self._revisions[abs_new] = next(self._revision_counter)
+                    self._file_bytes.pop(current_key, None)
+
+                # A new file now exists; drop resolutions that may point elsewhere
+                _resolve_path.cache_clear()
+            else:
+                # Regular save: save to current path
+                if current_key in self._untitled_keys:
+                    raise ValueError(
+                        f"Cannot save untitled document without path. Use save_as parameter."
+                    )
+
+                # Create parent directories if needed
+                os.makedirs(os.path.dirname(current_key), exist_ok=True)
+
+                # Word may hold the file open (and locked) from a COM call
+                com_pool.release_document(current_key)
+                doc.save(current_key)
+                with self._lock:
+                    self._file_bytes.pop(current_key, None)
+
+    def schedule_save(self, path: str, delay: float = SAVE_COALESCE_DELAY) -> str:
+        """
+        Save an open document shortly, coalescing repeated requests.
 
-        doc = self._documents[current_key]
+        Each call (re)starts a delay-second timer for the document; only when
+        no further request arrives within the window is the document written,
+        once. Pending saves are flushed before save-as, close, and COM
+        operations, and on server shutdown via flush_pending_saves().
 
-        if save_as is not None:
-            # Save-as: save to new path and re-key
-            abs_new = self._normalize_path(save_as)
+        Args:
+            path: Key/path of open document
+            delay: Seconds to wait for further save requests (default: 0.25)
 
-            # Create parent directories if needed
-            Path(abs_new).parent.mkdir(parents=True, exist_ok=True)
+        Returns:
+            Document key the save was scheduled for
 
-            doc.save(abs_new)
+        Raises:
+            ValueError: If document is not open or is untitled
+        """
+        key = self._lookup_key(path)
 
-            # Re-key in dictionary (remove old key, add new)
-            del self._documents[current_key]
-            self._documents[abs_new] = doc
-        else:
-            # Regular save: save to current path
-            if current_key.startswith("Untitled-"):
+        with self._lock:
+            if key not in self._documents:
+                raise ValueError(f"Document not open: {path}")
+            if key in self._untitled_keys:
                 raise ValueError(
                     f"Cannot save untitled document without path. Use save_as parameter."
                 )
 
-            # Create parent directories if needed
-            Path(current_key).parent.mkdir(parents=True, exist_ok=True)
+            timer = self._pending_saves.pop(key, None)
+            if timer is not None:
+                timer.cancel()
+
+            timer = threading.Timer(delay, self._run_pending_save, args=(key,))
+            timer.daemon = True
+            self._pending_saves[key] = timer
+            timer.start()
+
+        return key
+
+    def _run_pending_save(self, key: str):
+        """Timer callback: perform a scheduled save unless it was superseded."""
+        with self._lock:
+            # Timer is a Thread: only the currently registered timer may save
+            if self._pending_saves.get(key) is not threading.current_thread():
+                return
+            del self._pending_saves[key]
+
+        try:
+            self.save_document(key)
+        except Exception as e:
+            logger.error("scheduled_save_failed", path=key, error=str(e), error_type=type(e).__name__)
+
+    def _cancel_pending_save(self, key: str):
+        """Drop a scheduled save without writing."""
+        with self._lock:
+            timer = self._pending_saves.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+    def flush_pending_saves(self, path: Optional[str] = None) -> int:
+        """
+        Write scheduled saves now instead of waiting for their timers.
+
+        Args:
+            path: Key/path of one document, or None for all documents
 
-            doc.save(current_key)
+        Returns:
+            Number of documents saved
+        """
+        with self._lock:
+            if path is None:
+                keys = list(self._pending_saves)
+            else:
+                key = self._lookup_key(path)
+                keys = [key] if key in self._pending_saves else []
+            timers = [self._pending_saves.pop(key) for key in keys]
+
+        saved = 0
+        for key, timer in zip(keys, timers):
+            timer.cancel()
+            try:
+                self.save_document(key)
+                saved += 1
+            except Exception as e:
+                logger.error("scheduled_save_failed", path=key, error=str(e), error_type=type(e).__name__)
+        return saved
 
     def close_document(self, path: str):
         """
@@ -218,12 +547,22 @@ class DocumentManager:
             ValueError: If document is not currently open
         """
         # Normalize path
-        key = path if path.startswith("Untitled-") else self._normalize_path(path)
+        key = self._lookup_key(path)
 
-        if key not in self._documents:
-            raise ValueError(f"Document not open: {path}")
+        # A save requested before closing must still reach disk
+        self.flush_pending_saves(key)
+
+        with self._lock:
+            if key not in self._documents:
+                raise ValueError(f"Document not open: {path}")
+
+            del self._documents[key]
+            self._untitled_keys.discard(key)
+            self._revisions.pop(key, None)
+            self._file_bytes.pop(key, None)
 
-        del self._documents[key]
+        # Stop Word holding the file open for further COM calls
+        com_pool.release_document(key)
 
     def get_document(self, path: str) -> Document:
         """
@@ -239,12 +578,44 @@ class DocumentManager:
             ValueError: If document is not currently open
         """
         # Normalize path
-        key = path if path.startswith("Untitled-") else self._normalize_path(path)
+        key = self._lookup_key(path)
 
-        if key not in self._documents:
+        doc = self._documents.get(key)
+        if doc is None:
             raise ValueError(f"Document not open: {path}")
 
-        return self._documents[key]
+        return doc
+
+    def revision(self, path: str) -> int:
+        """
+        Get the current revision of an open document.
+
+        The revision changes whenever the document is (re)loaded or touch()ed,
+        and a value is never handed out twice.
+
+        Args:
+            path: Key/path of document
+
+        Returns:
+            Revision number, or 0 if the document is not open
+        """
+        return self._revisions.get(self._lookup_key(path), 0)
+
+    def touch(self, path: str):
+        """
+        Record that an open document's in-memory content has changed.
+
+        Tool functions that modify a document call this after the change, so
+        results cached against revision() are invalidated. COM tools need not:
+        reload_document() starts a new revision.
+
+        Args:
+            path: Key/path of document (ignored if not open)
+        """
+        key = self._lookup_key(path)
+        with self._lock:
+            if key in self._documents:
+                self._revisions[key] = next(self._revision_counter)
 
     def list_documents(self) -> list[str]:
         """
@@ -253,7 +624,17 @@ class DocumentManager:
         Returns:
             List of document keys (absolute paths or "Untitled-N" strings)
         """
-        return list(self._documents.keys())
+        with self._lock:
+            return list(self._documents.keys())
+
+    def count(self) -> int:
+        """
+        Count currently open documents without materializing the key list.
+
+        Returns:
+            Number of open documents
+        """
+        return len(self._documents)
 
     def close_all(self):
         """
@@ -262,15 +643,44 @@ class DocumentManager:
         Clears all documents from memory and resets the untitled counter.
         This is called during graceful server shutdown to release resources.
 
-        Note: Unsaved changes are discarded (consistent with close_document behavior).
+        Note: Unsaved changes are discarded (consistent with close_document behavior),
+        and so are scheduled saves: call flush_pending_saves() first to keep them.
         """
-        doc_count = len(self._documents)
-        if doc_count > 0:
-            self._documents.clear()
-            self._untitled_counter = 0
-            return doc_count
-        return 0
+        _resolve_path.cache_clear()
+
+        with self._lock:
+            doc_count = len(self._documents)
+            for timer in self._pending_saves.values():
+                timer.cancel()
+            self._pending_saves.clear()
+
+            if doc_count > 0:
+                self._documents.clear()
+                self._untitled_keys.clear()
+                self._revisions.clear()
+                self._file_bytes.clear()
+                self._untitled_counter = 0
+                return doc_count
+            return 0
 
 
 # Module-level singleton
 document_manager = DocumentManager()
+
+
+def document_locked(func):
+    """
+    Run a tool that reads or edits an open document while holding its document_lock.
+
+    Tool handlers run concurrently on worker threads; this keeps an edit of a
+    document from running while another tool reads, edits or (in a scheduled
+    save) writes out the same tree. The document is the tool's path argument
+    (first parameter).
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        path = args[0] if args else kwargs["path"]
+        with document_manager.document_lock(path):
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -10,6 +10,9 @@ from typing import Optional
 # Maximum document size: 10 MB
 MAX_DOCUMENT_SIZE = 10 * 1024 * 1024  # 10MB in bytes
 
+# Size units indexed by power of 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB")
+
 
 class DocumentTooLargeError(ValueError):
     """Raised when a document exceeds the maximum allowed size.
@@ -41,24 +44,26 @@ def format_size(bytes_count: int) -> str:
     """
     if bytes_count < 1024:
         return f"{bytes_count} B"
-    elif bytes_count < 1024 * 1024:
-        return f"{bytes_count / 1024:.1f} KB"
-    elif bytes_count < 1024 * 1024 * 1024:
-        return f"{bytes_count / (1024 * 1024):.1f} MB"
-    else:
-        return f"{bytes_count / (1024 * 1024 * 1024):.1f} GB"
+    # Each unit is a 10-bit step, so bit_length picks the unit without a ladder
+    index = min((bytes_count.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{bytes_count / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
 
 
-def validate_document_size(path: str) -> None:
+def validate_document_size(path: str, stat_result: Optional[os.stat_result] = None) -> None:
     """Validate that a document does not exceed the maximum size limit.
 
     Args:
         path: Path to the document file
+        stat_result: Optional os.stat() result for path. When the caller has
+            already stat'ed the file, pass it to avoid a second stat call.
 
     Raises:
         DocumentTooLargeError: If the document exceeds MAX_DOCUMENT_SIZE
         OSError: If the file cannot be accessed
     """
-    size = os.path.getsize(path)
+    if stat_result is not None:
+        size = stat_result.st_size
+    else:
+        size = os.path.getsize(path)
     if size > MAX_DOCUMENT_SIZE:
         raise DocumentTooLargeError(path, size, MAX_DOCUMENT_SIZE)
@@ -0,0 +1,163 @@
+"""
+Background jobs for long-running word-mcp tools.
+
+Opening a large document or saving to a slow share can take longer than an MCP
+client is willing to wait for a tool response. JobManager runs such operations
+on a worker pool and, if they do not finish within a short inline wait, hands
+the client a job id to poll instead of blocking the call.
+
+Key design:
+- concurrent.futures.ThreadPoolExecutor workers (tool implementations are sync)
+- Fast operations still return their result directly: the caller only sees a
+  job id when the inline wait expires
+- poll() supports a short blocking wait to cut down on poll round-trips
+- Finished jobs are dropped once their result has been delivered; unpolled
+  finished jobs are pruned beyond max_finished to bound memory
+"""
+
+import asyncio
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class JobManager:
+    """
+    Runs tool implementations in the background and tracks them by job id.
+
+    Usage:
+        result = await job_manager.run(open_document, path)
+        # -> tool result, or "job:<id> ..." if still running after inline_wait
+
+        job_manager.poll(job_id, wait_ms=1000)
+    """
+
+    def __init__(self, max_workers: int = 4, inline_wait: float = 2.0, max_finished: int = 256):
+        """
+        Initialize job manager.
+
+        Args:
+            max_workers: Number of worker threads (default: 4)
+            inline_wait: Seconds run() waits for a result before returning a
+                         job id (default: 2.0)
+            max_finished: Finished-but-unpolled jobs kept before the oldest
+                          are discarded (default: 256)
+        """
+        self.inline_wait = inline_wait
+        self.max_finished = max_finished
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="word-mcp-job")
+        self._jobs: "OrderedDict[str, Future]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, func: Callable[..., str], *args, **kwargs) -> str:
+        """
+        Start func(*args, **kwargs) on a worker thread.
+
+        Returns:
+            Job id (hex string)
+        """
+        future = self._executor.submit(func, *args, **kwargs)
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._jobs[job_id] = future
+            self._prune()
+
+        logger.debug("job_submitted", job_id=job_id, func=getattr(func, "__name__", "unknown"))
+        return job_id
+
+    async def run(self, func: Callable[..., str], *args, **kwargs) -> str:
+        """
+        Run func(*args, **kwargs) in the background, waiting up to inline_wait for it.
+
+        Returns:
+            The tool result if it finished in time, otherwise a message
+            starting with "job:<id>" telling the client to poll
+        """
+        job_id = self.submit(func, *args, **kwargs)
+        with self._lock:
+            future = self._jobs[job_id]
+
+        try:
+            await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), self.inline_wait)
+        except asyncio.TimeoutError:
+            return f"job:{job_id} Operation still running. Use poll_job_tool('{job_id}') to get the result."
+        except Exception:
+            # Failure is reported below through the future
+            pass
+
+        with self._lock:
+            self._jobs.pop(job_id, None)
+        return self._result_text(future)
+
+    def poll(self, job_id: str, wait_ms: int = 0) -> str:
+        """
+        Check on a job, optionally blocking up to wait_ms for it to finish.
+
+        Args:
+            job_id: Id returned by run()/submit()
+            wait_ms: Milliseconds to wait for completion (default: 0)
+
+        Returns:
+            "pending: ..." while running, "done: <result>" on completion, or
+            an "Error: ..." message. A job's result is delivered only once.
+        """
+        with self._lock:
+            future = self._jobs.get(job_id)
+        if future is None:
+            return f"Error: Unknown job id '{job_id}' (it may have already been collected)"
+
+        if wait_ms > 0:
+            try:
+                future.result(timeout=wait_ms / 1000)
+            except FutureTimeoutError:
+                pass
+            except Exception:
+                pass
+
+        if not future.done():
+            return f"pending: job {job_id} is still running"
+
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+        text = self._result_text(future)
+        if text.startswith("Error:"):
+            return text
+        return f"done: {text}"
+
+    def _result_text(self, future: Future) -> str:
+        """Render a finished future as a tool result string."""
+        error = future.exception()
+        if error is not None:
+            logger.error("job_failed", error=str(error), error_type=type(error).__name__)
+            return f"Error: {str(error)}"
+        return future.result()
+
+    def _prune(self):
+        """Drop the oldest finished jobs beyond max_finished (caller holds _lock)."""
+        finished = [job_id for job_id, future in self._jobs.items() if future.done()]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    def shutdown(self):
+        """
+        Wait for running jobs and stop the workers.
+
+        Called during server shutdown before documents are discarded, so an
+        in-flight save is not lost.
+        """
+        with self._lock:
+            pending = sum(1 for future in self._jobs.values() if not future.done())
+        if pending:
+            logger.info("jobs_waiting_on_shutdown", count=pending)
+        self._executor.shutdown(wait=True)
+
+
+# Module-level singleton
+job_manager = JobManager()
@@ -8,6 +8,8 @@ import logging
 import sys
 import structlog
 
+_configured = False
+
 
 def configure_logging() -> None:
     """Configure structlog with JSON rendering for production use.
@@ -18,7 +20,14 @@ def configure_logging() -> None:
     - JSON rendering
 
     Also configures stdlib logging to route through structlog.
+
+    Idempotent: repeated calls (re-imports, test reloads) are no-ops, and an
+    existing root handler is never duplicated.
     """
+    global _configured
+    if _configured:
+        return
+
     structlog.configure(
         processors=[
             structlog.stdlib.filter_by_level,
@@ -36,11 +45,14 @@ def configure_logging() -> None:
     )
 
     # Configure stdlib logging to also use structlog
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stderr,
-        level=logging.INFO,
-    )
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            format="%(message)s",
+            stream=sys.stderr,
+            level=logging.INFO,
+        )
+
+    _configured = True
 
 
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
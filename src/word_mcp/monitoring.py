@@ -12,6 +12,7 @@ Key features:
 - Alert generation for actionable issues
 """
 
+import time
 import psutil
 from typing import Dict, List
 
@@ -21,6 +22,8 @@ from .document_manager import document_manager
 
 logger = get_logger(__name__)
 
+_BYTES_PER_MB = 1024 * 1024
+
 
 class HealthMonitor:
     """
@@ -39,7 +42,8 @@ class HealthMonitor:
     def __init__(
         self,
         memory_threshold_percent: float = 80.0,
-        com_instance_limit: int = 5
+        com_instance_limit: int = 5,
+        sample_ttl: float = 0.5
     ):
         """
         Initialize health monitor with thresholds.
@@ -47,9 +51,24 @@ class HealthMonitor:
         Args:
             memory_threshold_percent: System memory % threshold for unhealthy (default: 80%)
             com_instance_limit: Max active COM instances before unhealthy (default: 5)
+            sample_ttl: Seconds to reuse a memory sample before re-reading it
+                        (default: 0.5)
         """
         self.memory_threshold_percent = memory_threshold_percent
         self.com_instance_limit = com_instance_limit
+        self._degraded_threshold = memory_threshold_percent - 10
+
+        # Reuse one process handle across checks (psutil caches state on it)
+        self._proc = psutil.Process()
+
+        # Rate-limit memory sampling: (monotonic timestamp, value) pairs
+        # reused for sample_ttl seconds so frequent polls don't re-query the OS
+        self.sample_ttl = sample_ttl
+        self._vm_cache = (float("-inf"), 0.0)
+        self._rss_cache = (float("-inf"), 0.0)
+
+        # (inputs fingerprint, result dict) of the last check_health() call
+        self._last_health = (None, None)
 
         logger.debug(
             "health_monitor_initialized",
@@ -57,6 +76,24 @@ class HealthMonitor:
             com_limit=com_instance_limit
         )
 
+    def _system_memory_percent(self) -> float:
+        """Return system memory usage %, re-sampled at most once per sample_ttl."""
+        now = time.monotonic()
+        ts, percent = self._vm_cache
+        if now - ts > self.sample_ttl:
+            percent = psutil.virtual_memory().percent
+            self._vm_cache = (now, percent)
+        return percent
+
+    def _process_memory_mb(self) -> float:
+        """Return process RSS in MB, re-sampled at most once per sample_ttl."""
+        now = time.monotonic()
+        ts, rss_mb = self._rss_cache
+        if now - ts > self.sample_ttl:
+            rss_mb = self._proc.memory_info().rss / _BYTES_PER_MB
+            self._rss_cache = (now, rss_mb)
+        return rss_mb
+
     def check_health(self) -> Dict:
         """
         Check server health and return comprehensive metrics.
@@ -69,14 +106,32 @@ class HealthMonitor:
             - com_pool: Dict with active_instances, total_created, total_failed, pool_size
             - open_documents: Number of documents currently open in memory
             - alerts: List of actionable alert messages (empty if healthy)
+
+            When no input has changed since the previous call, the previous
+            dict is returned as-is (treat the result as read-only).
         """
         # Gather metrics
-        process = psutil.Process()
-        process_memory_mb = process.memory_info().rss / (1024 * 1024)
-        system_memory_percent = psutil.virtual_memory().percent
+        process_memory_mb = self._process_memory_mb()
+        system_memory_percent = self._system_memory_percent()
 
         com_metrics = com_pool.get_metrics()
-        open_documents = len(document_manager.list_documents())
+        open_documents = document_manager.count()
+
+        # Samples are TTL-cached, so back-to-back polls usually see identical
+        # inputs: reuse the last result instead of rebuilding it (and
+        # re-logging the same warning)
+        fingerprint = (
+            process_memory_mb,
+            system_memory_percent,
+            com_metrics["active_count"],
+            com_metrics["total_created"],
+            com_metrics["total_failed"],
+            com_metrics["pool_size"],
+            open_documents,
+        )
+        last_fingerprint, last_result = self._last_health
+        if fingerprint == last_fingerprint:
+            return last_result
 
         # Determine status and alerts
         alerts: List[str] = []
@@ -99,12 +154,11 @@ class HealthMonitor:
 
         # Degraded conditions (if not already unhealthy)
         if status == "healthy":
-            degraded_threshold = self.memory_threshold_percent - 10
-            if system_memory_percent > degraded_threshold:
+            if system_memory_percent > self._degraded_threshold:
                 status = "degraded"
                 alerts.append(
                     f"System memory at {system_memory_percent:.1f}% "
-                    f"(warning threshold: {degraded_threshold:.1f}%)"
+                    f"(warning threshold: {self._degraded_threshold:.1f}%)"
                 )
 
             if com_metrics["total_failed"] > 0:
@@ -126,7 +180,7 @@ class HealthMonitor:
                 alerts=alerts
             )
 
-        return {
+        result = {
             "status": status,
             "process_memory_mb": process_memory_mb,
             "system_memory_percent": system_memory_percent,
@@ -139,6 +193,30 @@ class HealthMonitor:
             "open_documents": open_documents,
             "alerts": alerts,
         }
+        self._last_health = (fingerprint, result)
+        return result
+
+    def check_status(self) -> str:
+        """
+        Return only the health status, without metrics or alerts.
+
+        Applies the same thresholds as check_health() but skips process
+        memory, open document count, alert formatting and the result dict,
+        for callers that only need a go/no-go signal.
+
+        Returns:
+            "healthy" | "degraded" | "unhealthy"
+        """
+        system_memory_percent = self._system_memory_percent()
+        com_metrics = com_pool.get_metrics()
+
+        if (system_memory_percent > self.memory_threshold_percent
+                or com_metrics["active_count"] >= self.com_instance_limit):
+            return "unhealthy"
+        if (system_memory_percent > self._degraded_threshold
+                or com_metrics["total_failed"] > 0):
+            return "degraded"
+        return "healthy"
 
 
 # Module-level singleton
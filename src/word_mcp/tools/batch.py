@@ -0,0 +1,258 @@
+"""Batch execution tool for word-mcp.
+
+Runs a list of tool operations in one MCP call, so multi-step workflows
+(open -> edit -> save) cost one client round-trip instead of one per step.
+Operations run in order: later steps usually depend on earlier ones (a save
+must see the preceding edits), so they are not reordered or overlapped.
+Consecutive tracked edits of the same document run in one tracked edit
+session (see com_session), sharing a single Word open and reload.
+
+execute_bulk covers the other common shape: one operation applied to many
+independent documents. Those calls do not depend on each other, so they run
+concurrently on a thread pool; COM operations are bounded by the COM pool's
+own instance limit.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, List, Optional
+
+from typing_extensions import TypedDict
+
+from ..document_manager import document_manager
+from ..logging_config import get_logger
+from .com_session import tracked_edit_session
+
+logger = get_logger(__name__)
+
+# Most documents execute_bulk works on at once
+BULK_MAX_WORKERS = 8
+
+# Tools that can share a tracked edit session
+TRACKED_EDIT_TOOLS = frozenset({
+    "tracked_add_paragraph",
+    "tracked_edit_paragraph",
+    "tracked_edit_paragraphs",
+    "tracked_delete_paragraph",
+    "tracked_edit_table_cell",
+})
+
+
+class BatchEntry(TypedDict, total=False):
+    """Outcome of one batch operation (see execute_batch)."""
+
+    index: int
+    tool: str
+    ok: bool
+    result: str
+    error: str
+    skipped: bool
+
+
+class BatchResults(TypedDict):
+    """Structured result of batch_execute_tool."""
+
+    results: List[BatchEntry]
+
+
+class BulkEntry(TypedDict, total=False):
+    """Outcome of one document of a bulk operation (see execute_bulk)."""
+
+    index: int
+    path: str
+    ok: bool
+    result: str
+    error: str
+
+
+class BulkResults(TypedDict):
+    """Structured result of bulk_apply_tool."""
+
+    results: List[BulkEntry]
+
+
+def _tracked_edit_path(op: Any) -> Any:
+    """Target path of a tracked edit operation, or None for any other operation."""
+    if not isinstance(op, dict) or not isinstance(op.get("args"), dict):
+        return None
+    name = op.get("tool", "")
+    if isinstance(name, str) and name.endswith("_tool"):
+        name = name[:-len("_tool")]
+    if name not in TRACKED_EDIT_TOOLS:
+        return None
+    path = op["args"].get("path")
+    return path if isinstance(path, str) else None
+
+
+def _tracked_edit_runs(operations: List[Dict[str, Any]]) -> Dict[int, int]:
+    """Map the first index of each run of 2+ tracked edits of one document to its last index."""
+    runs = {}
+    index = 0
+    while index < len(operations):
+        path = _tracked_edit_path(operations[index])
+        end = index
+        if path is not None:
+            while end + 1 < len(operations) and _tracked_edit_path(operations[end + 1]) == path:
+                end += 1
+        if end > index:
+            runs[index] = end
+        index = end + 1
+    return runs
+
+
+def execute_batch(
+    operations: List[Dict[str, Any]],
+    registry: Dict[str, Callable[..., str]],
+    stop_on_error: bool = True
+) -> List[BatchEntry]:
+    """Execute a sequence of tool operations and collect their results.
+
+    Args:
+        operations: List of {"tool": name, "args": {...}} entries. Tool names
+                    are the server tool names with or without the "_tool"
+                    suffix (e.g. "add_paragraph" or "add_paragraph_tool").
+        registry: Mapping of tool name (without suffix) to implementation
+        stop_on_error: If True, skip remaining operations after the first
+                       failure (default: True)
+
+    Returns:
+        List with one entry per operation:
+        {"index", "tool", "ok", "result"} on success,
+        {"index", "tool", "ok", "error"} on failure, or
+        {"index", "tool", "ok", "skipped"} when skipped after a failure.
+        A result string starting with "Error:" counts as a failure.
+
+    Example output:
+        [{"index": 0, "tool": "open_document", "ok": True, "result": "Opened 'a.docx' ..."},
+         {"index": 1, "tool": "add_paragraph", "ok": False, "error": "Error: ..."},
+         {"index": 2, "tool": "save_document", "ok": False, "skipped": True}]
+    """
+    results = []
+    failed = False
+    runs = _tracked_edit_runs(operations)
+    run_end = -1
+
+    with ExitStack() as session:
+        for index, op in enumerate(operations):
+            # Each run of tracked edits shares one session, closed after its
+            # last operation (run or skipped)
+            if index > run_end:
+                session.close()
+                if index in runs:
+                    run_end = runs[index]
+                    session.enter_context(tracked_edit_session(_tracked_edit_path(op)))
+
+            name = op.get("tool", "") if isinstance(op, dict) else ""
+            if name.endswith("_tool"):
+                name = name[:-len("_tool")]
+            entry: BatchEntry = {"index": index, "tool": name, "ok": False}
+
+            if failed and stop_on_error:
+                entry["skipped"] = True
+                results.append(entry)
+                continue
+
+            func = registry.get(name)
+            args = op.get("args", {}) if isinstance(op, dict) else None
+            if func is None:
+                entry["error"] = f"Error: Unknown tool '{name}'"
+            elif not isinstance(args, dict):
+                entry["error"] = f"Error: 'args' for operation {index} must be an object"
+            else:
+                try:
+                    result = func(**args)
+                except Exception as e:
+                    logger.error(
+                        "batch_operation_failed",
+                        index=index,
+                        tool=name,
+                        error=str(e),
+                        error_type=type(e).__name__
+                    )
+                    entry["error"] = f"Error: {str(e)}"
+                else:
+                    if isinstance(result, str) and result.startswith("Error:"):
+                        entry["error"] = result
+                    else:
+                        entry["ok"] = True
+                        entry["result"] = result
+
+            if not entry["ok"]:
+                failed = True
+            results.append(entry)
+
+    return results
+
+
+def _run_one(func: Callable[..., str], name: str, index: int, path: str, args: Dict[str, Any]) -> BulkEntry:
+    """Run one document of a bulk operation, turning failures into an entry."""
+    entry: BulkEntry = {"index": index, "path": path, "ok": False}
+    try:
+        result = func(path=path, **args)
+    except Exception as e:
+        logger.error(
+            "bulk_operation_failed",
+            index=index,
+            tool=name,
+            path=path,
+            error=str(e),
+            error_type=type(e).__name__
+        )
+        entry["error"] = f"Error: {str(e)}"
+    else:
+        if isinstance(result, str) and result.startswith("Error:"):
+            entry["error"] = result
+        else:
+            entry["ok"] = True
+            entry["result"] = result
+    return entry
+
+
+def execute_bulk(
+    paths: List[str],
+    tool: str,
+    args: Optional[Dict[str, Any]],
+    registry: Dict[str, Callable[..., str]],
+) -> List[BulkEntry]:
+    """Apply one tool operation to several documents concurrently.
+
+    Args:
+        paths: Documents to apply the operation to (each passed as "path").
+               A document may appear only once.
+        tool: Tool name, with or without the "_tool" suffix
+        args: The tool's other parameters, the same for every document
+        registry: Mapping of tool name (without suffix) to implementation
+
+    Returns:
+        List with one entry per path, in the order given:
+        {"index", "path", "ok", "result"} on success or
+        {"index", "path", "ok", "error"} on failure. A result string
+        starting with "Error:" counts as a failure. Validation errors
+        (unknown tool, bad args) return a single entry with index -1.
+
+    Example output:
+        [{"index": 0, "path": "a.docx", "ok": True, "result": "Tables in 'a.docx': ..."},
+         {"index": 1, "path": "b.docx", "ok": False, "error": "Error: Document not open: b.docx"}]
+    """
+    name = tool[:-len("_tool")] if tool.endswith("_tool") else tool
+    args = args or {}
+    func = registry.get(name)
+    if func is None:
+        return [{"index": -1, "path": "", "ok": False, "error": f"Error: Unknown tool '{name}'"}]
+    if "path" in args:
+        return [{"index": -1, "path": "", "ok": False,
+                 "error": "Error: 'path' is set per document from 'paths'; remove it from 'args'"}]
+    # The same document edited from two threads at once would race
+    keys = {path if document_manager.is_untitled(path) else document_manager.resolve_path(path) for path in paths}
+    if len(keys) != len(paths):
+        return [{"index": -1, "path": "", "ok": False, "error": "Error: 'paths' contains duplicates"}]
+    if not paths:
+        return []
+
+    workers = min(len(paths), BULK_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="word-mcp-bulk") as executor:
+        futures = [
+            executor.submit(_run_one, func, name, index, path, args)
+            for index, path in enumerate(paths)
+        ]
+        return [future.result() for future in futures]
@@ -0,0 +1,102 @@
+"""Result caching for read-only document tools.
+
+Read-only tools such as list_tables or get_comments walk the python-docx
+object tree on every call, and agents often repeat them (list the tables,
+read one, list them again after a failed edit). @docx_read_cache memoizes a
+tool's result against the document's revision (DocumentManager.revision):
+
+- Every tool that edits a document in memory calls document_manager.touch(),
+  and every COM edit reloads the document; both start a new revision, so a
+  cached result never outlives the content it was computed from
+- Revisions are never reused, so stale entries are simply never hit again;
+  they are evicted least-recently-used once the cache is full
+- "Error:" results and calls on documents that are not open are not cached
+- The cache is bounded both in entries and in memory (WORD_MCP_CACHE_MB,
+  default 256), and close_document drops a document's entries at once
+
+display_name() memoizes the file name tools show for a document path.
+"""
+
+import functools
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, Tuple
+
+from ..document_manager import document_manager
+
+# Cached results across all read-only tools and documents
+READ_CACHE_SIZE = 256
+# Memory the cached results may take up, in bytes
+READ_CACHE_BYTES = int(os.environ.get("WORD_MCP_CACHE_MB", "256")) * 1024 * 1024
+
+_results: "OrderedDict[Tuple[Hashable, ...], str]" = OrderedDict()
+_results_bytes = 0
+_results_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=512)
+def display_name(path: str) -> str:
+    """Name a document is shown under in tool output: its file name, or its Untitled key."""
+    return path if document_manager.is_untitled(path) else Path(path).name
+
+
+def _evict_oldest():
+    """Drop the least recently used result. Caller holds _results_lock."""
+    global _results_bytes
+    _, result = _results.popitem(last=False)
+    _results_bytes -= sys.getsizeof(result)
+
+
+def evict_document(path: str):
+    """Drop the cached results for a document's current revision (e.g. before it is closed)."""
+    global _results_bytes
+    revision = document_manager.revision(path)
+    if not revision:
+        return
+    with _results_lock:
+        for key in [key for key in _results if key[1] == revision]:
+            _results_bytes -= sys.getsizeof(_results.pop(key))
+
+
+def docx_read_cache(func: Callable[..., str]) -> Callable[..., str]:
+    """Cache a read-only tool's result per document revision.
+
+    The decorated function must take the document path as its first
+    argument and return a string. functools.wraps keeps its signature, so
+    the MCP schema derived from it is unchanged.
+    """
+    @functools.wraps(func)
+    def wrapper(path: str, *args: Any, **kwargs: Any) -> str:
+        global _results_bytes
+        revision = document_manager.revision(path) if isinstance(path, str) else 0
+        if not revision:
+            return func(path, *args, **kwargs)
+
+        try:
+            key = (func.__name__, revision, args, frozenset(kwargs.items()))
+            hash(key)
+        except TypeError:
+            # Unhashable argument (e.g. a list): run uncached
+            return func(path, *args, **kwargs)
+
+        with _results_lock:
+            result = _results.get(key)
+            if result is not None:
+                _results.move_to_end(key)
+                return result
+
+        result = func(path, *args, **kwargs)
+        size = sys.getsizeof(result)
+        if not result.startswith("Error:") and size <= READ_CACHE_BYTES:
+            with _results_lock:
+                if key not in _results:
+                    _results[key] = result
+                    _results_bytes += size
+                while len(_results) > READ_CACHE_SIZE or _results_bytes > READ_CACHE_BYTES:
+                    _evict_oldest()
+        return result
+
+    return wrapper
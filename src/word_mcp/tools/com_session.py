@@ -0,0 +1,225 @@
+"""
+Shared COM document sessions for tracked editing in word-mcp.
+
+Each tracked edit normally opens the document in Word, edits it, saves,
+closes, and reloads the python-docx copy. A run of tracked edits on the same
+document (typically inside batch_execute_tool) repeats the open/close and
+reload for every step. Inside tracked_edit_session(path), the tracked editing
+tools instead share one pooled Word instance and one opened document:
+
+- The document is opened on the first edit and closed when the session ends
+- Each successful edit is still saved to disk immediately
+- The python-docx document is reloaded once, at the end of the session
+- The document's lock (document_manager.document_lock) is held throughout,
+  so other tools on the document wait for the session to end
+- Screen updating is off (com_pool.word_fastmode) for the duration of the
+  session; outside a session, for the duration of each call
+
+Tools use com_document(), save_com_document() and sync_document() in place
+of the open / save-and-close / reload steps of the bridge pattern; outside a
+session these behave like those steps, except that the saved document is left
+open in the pool (com_pool.keep_document) for the next COM call on the file.
+
+If an edit raises inside a session, the shared document is closed without
+saving and the remaining edits fall back to the per-call path.
+"""
+
+import threading
+from contextlib import ExitStack, contextmanager
+
+from ..document_manager import document_manager
+from ..com_pool import com_pool, word_fastmode, WD_DO_NOT_SAVE_CHANGES
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Active session of the current thread (tools run on worker threads)
+_local = threading.local()
+
+
+class _Session:
+    """COM state shared by the tracked edits of one tracked_edit_session()."""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.word = None
+        self.com_doc = None
+        self.saved = False
+        self.failed = False
+        self._stack = ExitStack()
+
+    def open(self):
+        """Check out a Word instance and open the document (first edit only)."""
+        try:
+            self.word = self._stack.enter_context(com_pool.get_word_app())
+            self._stack.enter_context(word_fastmode(self.word))
+            self.com_doc = com_pool.open_document(self.word, self.key)
+        except BaseException:
+            self.abandon()
+            raise
+
+    def abandon(self):
+        """Close the document without saving; later edits use the per-call path."""
+        self.failed = True
+        if self.com_doc is not None:
+            try:
+                self.com_doc.Close(SaveChanges=WD_DO_NOT_SAVE_CHANGES)
+            except Exception as e:
+                logger.warning("com_session_close_failed", path=self.key, error=str(e))
+            self.com_doc = None
+        self._release()
+
+    def close(self):
+        """Keep the document open in the pool (edits are already saved) and return the instance."""
+        if self.com_doc is not None:
+            com_pool.keep_document(self.word, self.key, self.com_doc)
+            self.com_doc = None
+        self._release()
+
+    def _release(self):
+        self.word = None
+        self._stack.close()
+
+
+def _document_key(path: str) -> str:
+    """Document key as the tracked tools compute it."""
+    return path if document_manager.is_untitled(path) else document_manager.resolve_path(path)
+
+
+def _active_session(key: str):
+    """The current thread's usable session for key, or None."""
+    session = getattr(_local, "session", None)
+    if session is None or session.failed or session.key != key:
+        return None
+    return session
+
+
+def in_session(key: str) -> bool:
+    """Whether the current thread has a usable session open for key."""
+    return _active_session(key) is not None
+
+
+@contextmanager
+def tracked_edit_session(path: str):
+    """
+    Share one Word instance and opened document across tracked edits of path.
+
+    Sessions do not nest: inside an active session this is a no-op.
+
+    Args:
+        path: Path or key of the open document the edits target
+
+    Example:
+        with tracked_edit_session(key):
+            tracked_edit_paragraph(key, 0, "First")
+            tracked_edit_paragraph(key, 1, "Second")
+    """
+    if getattr(_local, "session", None) is not None:
+        yield
+        return
+
+    key = _document_key(path)
+    # Held until the reload, so an in-memory edit made by another thread
+    # between two COM saves is not replaced by the reloaded document
+    with document_manager.document_lock(key):
+        session = _local.session = _Session(key)
+        try:
+            yield
+        finally:
+            _local.session = None
+            session.close()
+            if session.saved:
+                try:
+                    document_manager.reload_document(session.key)
+                except Exception as e:
+                    logger.error("com_session_reload_failed", path=session.key, error=str(e), error_type=type(e).__name__)
+
+
+@contextmanager
+def com_document(key: str):
+    """
+    Yield (word, com_doc) for a saved document key.
+
+    Outside a session this checks out a pooled Word instance and opens the
+    document (or reuses the copy the pool kept open); inside a session for
+    key it yields the shared ones.
+    """
+    session = _active_session(key)
+    if session is None:
+        with com_pool.get_word_app() as word, word_fastmode(word):
+            com_doc = com_pool.open_document(word, key)
+            yield word, com_doc
+            # Also keep it after an early return (e.g. a refused edit); the
+            # pool closes it instead if it has unsaved changes
+            com_pool.keep_document(word, key, com_doc)
+        return
+
+    if session.com_doc is None:
+        session.open()
+    try:
+        yield session.word, session.com_doc
+    except BaseException:
+        session.abandon()
+        raise
+
+
+def save_com_document(key: str, word, com_doc):
+    """Save an edited COM document; hand it to the pool unless a session keeps it open."""
+    # Revisions are kept; only the undo history (which would grow across
+    # calls while the pool keeps the document open) is dropped
+    com_doc.UndoClear()
+    com_doc.Save()
+    session = _active_session(key)
+    if session is None:
+        com_pool.keep_document(word, key, com_doc)
+    else:
+        session.saved = True
+
+
+def sync_document(key: str):
+    """Reload the python-docx document after an edit, unless a session will."""
+    if _active_session(key) is None:
+        document_manager.reload_document(key)
+
+
+def _at_word_boundary(text: str, i: int) -> bool:
+    """True if position i of text is not inside a word."""
+    return i == 0 or i == len(text) or text[i - 1].isspace() or text[i].isspace()
+
+
+def apply_min_diff(rng, old_text: str, new_text: str):
+    """Replace the text of a COM range, touching only the part that changed.
+
+    rng must cover exactly old_text (no trailing paragraph or cell mark).
+    The common prefix and suffix of old_text and new_text, trimmed back to
+    word boundaries, are left in place, so the tracked Deletion/Insertion
+    covers the changed words rather than the whole text. Identical text is
+    left untouched.
+
+    Word counts UTF-16 code units and can hold content (e.g. field codes)
+    that Range.Text does not show; when the range length does not match
+    old_text, the whole range is replaced.
+    """
+    if old_text == new_text:
+        return
+    if rng.End - rng.Start != len(old_text) or any(ord(c) > 0xFFFF for c in old_text):
+        rng.Text = new_text
+        return
+
+    limit = min(len(old_text), len(new_text))
+    prefix = 0
+    while prefix < limit and old_text[prefix] == new_text[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old_text[-1 - suffix] == new_text[-1 - suffix]:
+        suffix += 1
+
+    # Keep revisions to whole words, as Word's own compare does
+    while prefix and not (_at_word_boundary(old_text, prefix) and _at_word_boundary(new_text, prefix)):
+        prefix -= 1
+    while suffix and not (_at_word_boundary(old_text, len(old_text) - suffix)
+                          and _at_word_boundary(new_text, len(new_text) - suffix)):
+        suffix -= 1
+
+    rng.SetRange(rng.Start + prefix, rng.End - suffix)
+    rng.Text = new_text[prefix:len(new_text) - suffix]
@@ -5,15 +5,67 @@ Provides read-only access to document comments with metadata (author, date, text
 NOTE: python-docx 1.2.0 does not expose comment location/range information. Comments are
 returned with metadata (id, author, date, text, initials) but without information about
 which text range they are anchored to.
+
+Comments are read straight from the w:comment elements of the comments part,
+without building python-docx Comment proxies.
 """
 
-from pathlib import Path
-from ..document_manager import document_manager
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml.ns import qn
+
+from ..document_manager import document_manager, document_locked
 from ..logging_config import get_logger
+from .caches import display_name, docx_read_cache
 
 logger = get_logger(__name__)
 
+# Placeholders for comment properties that are missing or empty
+_UNKNOWN_ID = "?"
+_UNKNOWN_AUTHOR = "Unknown"
+_NO_DATE = "no date"
+
+
+_W_COMMENT = qn("w:comment")
+_W_ID = qn("w:id")
+_W_AUTHOR = qn("w:author")
+_W_INITIALS = qn("w:initials")
+_W_DATE = qn("w:date")
+
+
+def _comments_element(doc):
+    """The document's w:comments element, or None if it has no comments part."""
+    try:
+        return doc.part.part_related_by(RT.COMMENTS).element
+    except KeyError:
+        return None
+
+
+def _format_comment(comment) -> str:
+    """Format one w:comment element as a get_comments output line."""
+    comment_id = comment.get(_W_ID) or _UNKNOWN_ID
+    author = comment.get(_W_AUTHOR) or _UNKNOWN_AUTHOR
+    initials = comment.get(_W_INITIALS)
+    # Paragraph text joined with newlines, as python-docx's Comment.text
+    text = "\n".join(p.text for p in comment.p_lst)
+
+    # w:date is ISO 8601 ("2026-02-13T10:30:00Z"); show "YYYY-MM-DD HH:MM"
+    date = comment.get(_W_DATE)
+    if date and len(date) >= 16:
+        date_str = f"{date[:10]} {date[11:16]}"
+    else:
+        date_str = _NO_DATE
 
+    # Build comment line
+    if initials:
+        author_str = f"{author} (initials: {initials})"
+    else:
+        author_str = author
+
+    return f"[{comment_id}] {author_str} ({date_str}): {text}"
+
+
+@docx_read_cache
+@document_locked
 def get_comments(path: str) -> str:
     """Get all comments in the document with metadata.
 
@@ -42,49 +94,18 @@ def get_comments(path: str) -> str:
         return f"Error: No document open at '{path}'. Use open_document or create_document first."
 
     # Get filename for display
-    if path.startswith("Untitled-"):
-        filename = path
-    else:
-        filename = Path(path).name
+    filename = display_name(path)
 
-    # Access comments collection
-    try:
-        comments = list(doc.comments)
-    except AttributeError:
-        # python-docx version doesn't support comments API
-        return f"Error: Document comments API not available. Requires python-docx 1.2.0 or later."
+    # A document without a comments part has no comments (doc.comments
+    # would add an empty part to it)
+    comments = _comments_element(doc)
+    if comments is None:
+        return f"No comments found in '{filename}'."
 
-    # Check if there are any comments
-    if len(comments) == 0:
+    # One pass: format each comment as it is read, count afterwards.
+    # map() looks _format_comment up once and loops in C
+    lines = list(map(_format_comment, comments.iterchildren(_W_COMMENT)))
+    if not lines:
         return f"No comments found in '{filename}'."
 
-    # Build header
-    lines = [f"Comments in '{filename}': {len(comments)} comment(s)"]
-
-    # Build comment list
-    for comment in comments:
-        # Extract comment properties
-        comment_id = comment.id if hasattr(comment, 'id') else "?"
-        author = comment.author if hasattr(comment, 'author') and comment.author else "Unknown"
-        text = comment.text if hasattr(comment, 'text') and comment.text else ""
-        initials = comment.initials if hasattr(comment, 'initials') and comment.initials else None
-
-        # Format date
-        if hasattr(comment, 'date') and comment.date is not None:
-            try:
-                # Format datetime as "YYYY-MM-DD HH:MM"
-                date_str = comment.date.strftime("%Y-%m-%d %H:%M")
-            except (AttributeError, ValueError):
-                date_str = "no date"
-        else:
-            date_str = "no date"
-
-        # Build comment line
-        if initials:
-            author_str = f"{author} (initials: {initials})"
-        else:
-            author_str = author
-
-        lines.append(f"[{comment_id}] {author_str} ({date_str}): {text}")
-
-    return "\n".join(lines)
+    return f"Comments in '{filename}': {len(lines)} comment(s)\n" + "\n".join(lines)
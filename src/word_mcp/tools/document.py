@@ -8,18 +8,73 @@ All functions follow explicit-save-only semantics (no auto-save) and
 error-on-overwrite for document creation operations.
 """
 
+import functools
 import os
+import re
 import zipfile
-import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Optional
+from typing import Dict, FrozenSet, Optional, Tuple
 
-from ..document_manager import document_manager
+from lxml import etree
+
+from ..document_manager import document_manager, document_locked
 from ..logging_config import get_logger
-from ..errors import validate_document_size, DocumentTooLargeError, format_size
+from ..errors import DocumentTooLargeError, format_size
+from .caches import display_name, evict_document
+from .fast_read import iter_paragraphs
+from .offline_tracked import evict_revision_ids
+from .tracked_editing import evict_index_map
 
 logger = get_logger(__name__)
 
+# get_document_info results per document key, with the (revision, file mtime)
+# they were computed for
+_info_cache: Dict[str, Tuple[Tuple[int, Optional[int]], str]] = {}
+
+# (paragraphs, words, characters, styles in use) per document key, with the
+# revision they were counted at
+_stats_cache: Dict[str, Tuple[int, Tuple[int, int, int, FrozenSet[str]]]] = {}
+
+
+def _document_stats(key: str, doc) -> Tuple[int, int, int, FrozenSet[str]]:
+    """
+    Paragraph, word and character counts and the paragraph styles in use.
+
+    Counted in one pass over the body paragraphs and cached until the
+    document's revision changes, so open_document and get_document_info
+    share the work and repeat calls on an unchanged document are free.
+    """
+    revision = document_manager.revision(key)
+    cached = _stats_cache.get(key)
+    if cached is not None and cached[0] == revision:
+        return cached[1]
+
+    texts = []
+    styles = set()
+    for style_name, text in iter_paragraphs(doc):
+        texts.append(text)
+        if style_name:
+            styles.add(style_name)
+
+    # Count over one joined string so split() and len() each make a single
+    # native pass; the "\n" separators keep words from running together
+    para_count = len(texts)
+    joined = "\n".join(texts)
+    word_count = len(joined.split())
+    char_count = len(joined) - max(para_count - 1, 0)
+
+    stats = (para_count, word_count, char_count, frozenset(styles))
+    _stats_cache[key] = (revision, stats)
+    return stats
+
+
+def _evict_caches(key: str):
+    """Drop per-key cached state for a document key that is no longer open."""
+    _info_cache.pop(key, None)
+    _stats_cache.pop(key, None)
+    evict_index_map(key)
+    evict_revision_ids(key)
+
 
 def create_document(path: Optional[str] = None) -> str:
     """
@@ -47,13 +102,13 @@ def create_document(path: Optional[str] = None) -> str:
     """
     try:
         if path:
-            abs_path = str(Path(path).resolve())
+            abs_path = document_manager.resolve_path(path)
 
         key, doc = document_manager.create_document(path)
 
-        logger.info("document_created", key=key, has_path=not key.startswith("Untitled-"))
+        logger.info("document_created", key=key, has_path=not document_manager.is_untitled(key))
 
-        if key.startswith("Untitled-"):
+        if document_manager.is_untitled(key):
             return f"Created new document '{key}'"
         else:
             return f"Created new document at {key}"
@@ -84,21 +139,19 @@ def open_document(path: str) -> str:
         "Opened 'report.docx' (12 paragraphs, ~350 words)"
     """
     try:
-        abs_path = str(Path(path).resolve())
+        abs_path = document_manager.resolve_path(path)
 
-        # Validate document size before opening
+        # DocumentManager validates document size with the same stat it uses
+        # for the existence check
         try:
-            validate_document_size(abs_path)
+            doc = document_manager.open_document(abs_path)
         except DocumentTooLargeError as e:
             logger.error("document_too_large", tool="open_document", path=abs_path, size_bytes=e.size_bytes, max_bytes=e.max_bytes)
             return f"Error: Document exceeds 10MB size limit ({format_size(e.size_bytes)}). Large documents may cause memory issues."
 
-        doc = document_manager.open_document(abs_path)
-
         # Calculate basic stats
         filename = Path(abs_path).name
-        para_count = len(doc.paragraphs)
-        word_count = sum(len(para.text.split()) for para in doc.paragraphs)
+        para_count, word_count, _, _ = _document_stats(abs_path, doc)
 
         logger.info("document_opened", path=abs_path, paragraphs=para_count, words=word_count)
 
@@ -112,7 +165,7 @@ def open_document(path: str) -> str:
         return f"Error: {str(e)}"
 
 
-def save_document(path: str) -> str:
+def save_document(path: str, deferred: bool = False) -> str:
     """
     Save an open document to its current path.
 
@@ -121,6 +174,9 @@ def save_document(path: str) -> str:
 
     Args:
         path: Path or key of open document to save
+        deferred: If True, schedule the save and return immediately; repeated
+                  deferred saves of the same document within a short window
+                  are coalesced into one write (default: False)
 
     Returns:
         Success message with absolute path, or error message
@@ -131,9 +187,18 @@ def save_document(path: str) -> str:
 
         >>> save_document("C:/Documents/report.docx")
         "Saved document to C:\\Documents\\report.docx"
+
+        >>> save_document("C:/Documents/report.docx", deferred=True)
+        "Scheduled save of C:\\Documents\\report.docx"
     """
     try:
-        abs_path = str(Path(path).resolve()) if not path.startswith("Untitled-") else path
+        abs_path = document_manager.resolve_path(path) if not document_manager.is_untitled(path) else path
+
+        if deferred:
+            document_manager.schedule_save(abs_path)
+            logger.debug("document_save_scheduled", path=abs_path)
+            return f"Scheduled save of {abs_path}"
+
         document_manager.save_document(abs_path)
 
         logger.info("document_saved", path=abs_path)
@@ -151,6 +216,26 @@ def save_document(path: str) -> str:
         return f"Error: {str(e)}"
 
 
+def flush_pending_saves() -> str:
+    """
+    Write all deferred saves to disk now.
+
+    Returns:
+        Number of documents written
+
+    Examples:
+        >>> flush_pending_saves()
+        "Flushed 2 pending save(s)"
+    """
+    try:
+        count = document_manager.flush_pending_saves()
+        logger.info("pending_saves_flushed", count=count)
+        return f"Flushed {count} pending save(s)"
+    except Exception as e:
+        logger.error("flush_pending_saves_failed", tool="flush_pending_saves", error=str(e), error_type=type(e).__name__)
+        return f"Error: {str(e)}"
+
+
 def save_document_as(path: str, new_path: str) -> str:
     """
     Save an open document to a new path (save-as operation).
@@ -173,10 +258,13 @@ def save_document_as(path: str, new_path: str) -> str:
         "Saved document to C:\\Documents\\final.docx (was: C:\\Documents\\draft.docx)"
     """
     try:
-        old_key = str(Path(path).resolve()) if not path.startswith("Untitled-") else path
-        abs_new = str(Path(new_path).resolve())
+        old_key = document_manager.resolve_path(path) if not document_manager.is_untitled(path) else path
+        abs_new = document_manager.resolve_path(new_path)
 
+        # Cached results of the old key's revision can never be hit again
+        evict_document(old_key)
         document_manager.save_document(old_key, save_as=abs_new)
+        _evict_caches(old_key)
 
         logger.info("document_saved_as", old_path=old_key, new_path=abs_new)
 
@@ -205,8 +293,10 @@ def close_document(path: str) -> str:
         "Closed document 'C:\\Documents\\report.docx'. Unsaved changes were discarded."
     """
     try:
-        key = str(Path(path).resolve()) if not path.startswith("Untitled-") else path
+        key = document_manager.resolve_path(path) if not document_manager.is_untitled(path) else path
+        evict_document(key)
         document_manager.close_document(key)
+        _evict_caches(key)
 
         logger.info("document_closed", path=key)
 
@@ -220,6 +310,7 @@ def close_document(path: str) -> str:
         return f"Error: {str(e)}"
 
 
+@document_locked
 def get_document_info(path: str) -> str:
     """
     Get detailed information about an open document.
@@ -261,44 +352,53 @@ def get_document_info(path: str) -> str:
         '''
     """
     try:
-        key = str(Path(path).resolve()) if not path.startswith("Untitled-") else path
+        key = document_manager.resolve_path(path) if not document_manager.is_untitled(path) else path
         doc = document_manager.get_document(key)
 
-        # Basic counts
-        para_count = len(doc.paragraphs)
-        word_count = sum(len(para.text.split()) for para in doc.paragraphs)
-        char_count = sum(len(para.text) for para in doc.paragraphs)
+        # Page count is read from the file on disk as it stands: a deferred
+        # save still pending is not forced (python-docx keeps app.xml as is,
+        # so writing it would not change the count anyway)
 
-        # Styles in use
-        styles = set()
-        for para in doc.paragraphs:
-            if para.style and para.style.name:
-                styles.add(para.style.name)
+        # Nothing edited and the file not rewritten since the last call: the
+        # previous result still holds
+        # One stat serves both the cache check and the page count
+        st = _file_stat(key)
+        cache_key = (document_manager.revision(key), st.st_mtime_ns if st is not None else None)
+        cached = _info_cache.get(key)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        # Basic counts and styles in use (cached per revision, so a save
+        # alone does not recount them)
+        para_count, word_count, char_count, styles = _document_stats(key, doc)
 
         # Page count (requires saved document)
-        page_count = _get_page_count(key)
+        page_count = _get_page_count(key, st)
 
         # Core properties
         title = doc.core_properties.title or "Not set"
         author = doc.core_properties.author or "Not set"
 
         # Format output
-        result = f"Document Information: {key}\n\n"
-        result += f"File: {Path(key).name if not key.startswith('Untitled-') else key}\n"
-        result += f"Paragraphs: {para_count}\n"
-        result += f"Words: ~{word_count:,}\n"
-        result += f"Characters: {char_count:,}\n\n"
+        lines = [
+            f"Document Information: {key}",
+            "",
+            f"File: {display_name(key)}",
+            f"Paragraphs: {para_count}",
+            f"Words: ~{word_count:,}",
+            f"Characters: {char_count:,}",
+            "",
+        ]
 
         if styles:
-            result += "Styles in use:\n"
-            for style in sorted(styles):
-                result += f"  - {style}\n"
-            result += "\n"
+            lines.append("Styles in use:")
+            lines.extend(f"  - {style}" for style in sorted(styles))
+            lines.append("")
 
-        result += f"Page count: {page_count}\n\n"
-        result += f"Title: {title}\n"
-        result += f"Author: {author}"
+        lines += [f"Page count: {page_count}", "", f"Title: {title}", f"Author: {author}"]
+        result = "\n".join(lines)
 
+        _info_cache[key] = (cache_key, result)
         return result
 
     except ValueError:
@@ -309,7 +409,17 @@ def get_document_info(path: str) -> str:
         return f"Error: {str(e)}"
 
 
-def _get_page_count(path: str) -> str:
+def _file_stat(path: str) -> Optional[os.stat_result]:
+    """os.stat() of a saved document, or None if it is untitled or not on disk."""
+    if document_manager.is_untitled(path):
+        return None
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _get_page_count(path: str, st: Optional[os.stat_result]) -> str:
     """
     Extract page count from saved .docx file.
 
@@ -318,29 +428,48 @@ def _get_page_count(path: str) -> str:
 
     Args:
         path: Absolute path to saved .docx file
+        st: _file_stat(path), None for untitled or unsaved documents
 
     Returns:
         Page count as string, or error message if unavailable
     """
-    # Untitled documents haven't been saved yet
-    if path.startswith("Untitled-"):
+    if st is None:
         return "unavailable (save document first)"
 
-    # Check if file exists on disk
-    if not Path(path).exists():
-        return "unavailable (save document first)"
+    return _saved_page_count(path, st.st_mtime_ns, st.st_size)
+
+
+# <Pages> as Word writes it in docProps/app.xml (default namespace)
+_PAGES_RE = re.compile(rb"<Pages>(\d+)</Pages>")
 
+# <Pages> in docProps/app.xml (extended properties namespace), and the parser
+# for that part: libxml2, without entity expansion; used when the regex
+# finds nothing (e.g. a prefixed element)
+_PAGES_PATH = ".//{http://schemas.openxmlformats.org/officeDocument/2006/extended-properties}Pages"
+_APP_XML_PARSER = etree.XMLParser(resolve_entities=False)
+
+
+@functools.lru_cache(maxsize=64)
+def _saved_page_count(path: str, mtime_ns: int, size: int) -> str:
+    """
+    Page count from docProps/app.xml of the file as of (mtime_ns, size).
+
+    Memoized on the file's stamp: the ZIP is only reopened once the file
+    has been rewritten.
+    """
     try:
         # Extract from docProps/app.xml in the .docx ZIP
-        with zipfile.ZipFile(path, 'r') as docx_zip:
+        with zipfile.ZipFile(document_manager.file_source(path), 'r') as docx_zip:
             app_xml = docx_zip.read('docProps/app.xml')
 
-        # Parse XML and find <Pages> element
-        root = ET.fromstring(app_xml)
+        # Word's own output: scan for the element without parsing
+        match = _PAGES_RE.search(app_xml)
+        if match is not None:
+            return match.group(1).decode()
 
-        # Handle namespace in app.xml
-        ns = {'ep': 'http://schemas.openxmlformats.org/officeDocument/2006/extended-properties'}
-        pages_elem = root.find('.//ep:Pages', ns)
+        # Parse XML and find <Pages> element
+        root = etree.fromstring(app_xml, _APP_XML_PARSER)
+        pages_elem = root.find(_PAGES_PATH)
 
         if pages_elem is not None and pages_elem.text:
             return pages_elem.text
@@ -381,21 +510,20 @@ def create_from_template(
         "Created document from template 'report.dotx' at C:\\Documents\\q4-report.docx"
     """
     try:
-        abs_template = str(Path(template_path).resolve())
+        abs_template = document_manager.resolve_path(template_path)
         template_name = Path(abs_template).name
 
-        # Validate template size before opening
+        # DocumentManager validates template size with the same stat it uses
+        # for the existence check
         try:
-            validate_document_size(abs_template)
+            key, doc = document_manager.create_from_template(abs_template, save_path)
         except DocumentTooLargeError as e:
             logger.error("template_too_large", tool="create_from_template", template_path=abs_template, size_bytes=e.size_bytes, max_bytes=e.max_bytes)
             return f"Error: Template exceeds 10MB size limit ({format_size(e.size_bytes)}). Large documents may cause memory issues."
 
-        key, doc = document_manager.create_from_template(abs_template, save_path)
+        logger.info("document_created_from_template", template_path=abs_template, key=key, has_save_path=not document_manager.is_untitled(key))
 
-        logger.info("document_created_from_template", template_path=abs_template, key=key, has_save_path=not key.startswith("Untitled-"))
-
-        if key.startswith("Untitled-"):
+        if document_manager.is_untitled(key):
             return f"Created document from template '{template_name}' as '{key}'"
         else:
             return f"Created document from template '{template_name}' at {key}"
@@ -436,8 +564,6 @@ def list_open_documents() -> str:
     if not docs:
         return "No documents are currently open"
 
-    result = "Open documents:\n"
-    for i, doc_path in enumerate(docs, 1):
-        result += f"  {i}. {doc_path}\n"
-
-    return result.rstrip()
+    lines = ["Open documents:"]
+    lines.extend(f"  {i}. {doc_path}" for i, doc_path in enumerate(docs, 1))
+    return "\n".join(lines)
@@ -0,0 +1,54 @@
+"""Metadata checks on saved .docx files without starting Word.
+
+A .docx file is a ZIP archive of XML parts, so some questions that would
+otherwise need a COM round-trip (and possibly a Word cold start) can be
+answered by scanning the parts directly. Checks here are conservative: when
+a file cannot be read they return None and callers fall back to COM.
+"""
+
+import zipfile
+from typing import BinaryIO, Optional, Union
+
+from lxml import etree
+
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+# Elements that record a tracked change (revision) in WordprocessingML
+_REVISION_TAGS = tuple(
+    f"{{{_W_NS}}}{name}"
+    for name in (
+        "ins", "del", "moveFrom", "moveTo",
+        "cellIns", "cellDel", "cellMerge",
+        "rPrChange", "pPrChange", "sectPrChange", "numberingChange",
+        "tblPrChange", "tblPrExChange", "tblGridChange", "trPrChange", "tcPrChange",
+        "customXmlInsRangeStart", "customXmlDelRangeStart",
+        "customXmlMoveFromRangeStart", "customXmlMoveToRangeStart",
+    )
+)
+
+
+def has_revision_markup(source: Union[str, BinaryIO]) -> Optional[bool]:
+    """Check whether a saved .docx contains any tracked-change markup.
+
+    Scans every XML part under word/ (body, headers, footers, footnotes,
+    styles, ...) and stops at the first revision element.
+
+    Args:
+        source: Path to a .docx file on disk, or a binary file object with
+                its contents (see DocumentManager.file_source)
+
+    Returns:
+        True if revision markup was found, False if none, or None if the
+        file could not be read as a .docx
+    """
+    try:
+        with zipfile.ZipFile(source) as docx_zip:
+            for name in docx_zip.namelist():
+                if not (name.startswith("word/") and name.endswith(".xml")):
+                    continue
+                with docx_zip.open(name) as part:
+                    for _ in etree.iterparse(part, events=("start",), tag=_REVISION_TAGS):
+                        return True
+    except (OSError, zipfile.BadZipFile, etree.XMLSyntaxError):
+        return None
+    return False
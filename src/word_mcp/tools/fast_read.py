@@ -0,0 +1,109 @@
+"""Fast read-only paragraph access for word-mcp.
+
+python-docx resolves ``paragraph.style`` by searching the styles part for the
+paragraph's style id on every access, and builds a Paragraph proxy for every
+body paragraph. Read-only tools that only need (style name, text) per
+paragraph use this module instead: style ids are resolved once per call into
+a dict, and paragraphs are read straight off the in-memory lxml tree.
+
+Results match python-docx: a missing, unknown, or non-paragraph style id
+resolves to the document's default paragraph style, and names use the same
+UI spelling (e.g. "Heading 1").
+
+Tools that address one paragraph by index use ParagraphIndex, which builds a
+Paragraph proxy only for the paragraph actually requested; cell_text() reads
+a table cell the same way.
+"""
+
+from collections.abc import Sequence
+from typing import Dict, Iterator, Optional, Tuple
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.styles import BabelFish
+from docx.text.paragraph import Paragraph
+
+
+def paragraph_style_names(doc) -> Tuple[Dict[str, Optional[str]], Optional[str]]:
+    """Map every style id to the paragraph style name python-docx would report.
+
+    Args:
+        doc: python-docx Document
+
+    Returns:
+        Tuple of (style id -> name, default paragraph style name). Names are
+        None where python-docx's style would be None or unnamed.
+    """
+    default_style = doc.styles.default(WD_STYLE_TYPE.PARAGRAPH)
+    default_name = default_style.name if default_style is not None else None
+
+    names: Dict[str, Optional[str]] = {}
+    for style in doc.styles.element.style_lst:
+        style_id = style.styleId
+        # First match wins, like the styles part lookup
+        if style_id is None or style_id in names:
+            continue
+        if style.type != WD_STYLE_TYPE.PARAGRAPH:
+            names[style_id] = default_name
+        else:
+            raw_name = style.name_val
+            names[style_id] = BabelFish.internal2ui(raw_name) if raw_name is not None else None
+    return names, default_name
+
+
+def iter_paragraphs(doc) -> Iterator[Tuple[Optional[str], str]]:
+    """Yield (style name, text) for each body paragraph, in document order.
+
+    Covers the same paragraphs as ``doc.paragraphs`` (top-level body
+    paragraphs, not those inside tables).
+
+    Args:
+        doc: python-docx Document
+
+    Yields:
+        Tuples of (style name or None, paragraph text)
+    """
+    names, default_name = paragraph_style_names(doc)
+    for p in doc.element.body.p_lst:
+        style_id = p.style
+        name = names.get(style_id, default_name) if style_id is not None else default_name
+        yield name, p.text
+
+
+def cell_text(tc) -> str:
+    """Text of a table cell, as python-docx's ``_Cell.text`` reports it.
+
+    Reads the cell's paragraphs straight off its ``w:tc`` element instead of
+    wrapping each one in a Paragraph proxy.
+
+    Args:
+        tc: The cell's ``w:tc`` element (``cell._tc``)
+
+    Returns:
+        Text of the cell's paragraphs, joined with newlines
+    """
+    return "\n".join(p.text for p in tc.p_lst)
+
+
+class ParagraphIndex(Sequence):
+    """
+    Index-addressable view of a document's body paragraphs.
+
+    Drop-in for ``doc.paragraphs`` where only a few paragraphs are used:
+    ``doc.paragraphs`` wraps every paragraph in a Paragraph proxy on each
+    access, while this view reads the paragraph elements once and wraps on
+    lookup. It is a snapshot: build a new one after adding or removing
+    paragraphs.
+    """
+
+    def __init__(self, doc):
+        self._elements = doc.element.body.p_lst
+        # Same parent doc.paragraphs gives its proxies (the document body)
+        self._parent = doc._body
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Paragraph(p, self._parent) for p in self._elements[index]]
+        return Paragraph(self._elements[index], self._parent)
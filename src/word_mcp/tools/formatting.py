@@ -4,14 +4,58 @@ Provides run-level formatting operations (bold, italic, underline, font, size, c
 All formatting operations work at the Run level to preserve existing formatting on other runs.
 """
 
+import re
 from typing import Optional
-from docx.shared import Pt, RGBColor
-from ..document_manager import document_manager
+from docx.enum.text import WD_UNDERLINE
+from docx.shared import Length, Pt, RGBColor
+from ..document_manager import document_manager, document_locked
 from ..logging_config import get_logger
+from .caches import docx_read_cache
+from .fast_read import ParagraphIndex
 
 logger = get_logger(__name__)
 
+# "#RRGGBB" font colors (int(..., 16) alone would also accept signs, "_" and spaces)
+_HEX_COLOR = re.compile(r"#[0-9A-Fa-f]{6}")
 
+
+def _apply_rpr(
+    r,
+    bold: Optional[bool],
+    italic: Optional[bool],
+    underline: Optional[bool],
+    font_name: Optional[str],
+    size: Optional[Length],
+    color: Optional[RGBColor],
+):
+    """Write the requested run properties into a run's w:rPr in one pass.
+
+    Same XML as the Run/Font property setters (run.bold, run.font.size, ...),
+    which look up or create w:rPr and build a Font proxy for every property
+    written. The element-level helpers used here keep w:rPr children in
+    schema order. None means "don't change", as in format_text.
+
+    Args:
+        r: The run's w:r element (``run._r``)
+    """
+    rPr = r.get_or_add_rPr()
+    if bold is not None:
+        rPr._set_bool_val("b", bold)
+    if italic is not None:
+        rPr._set_bool_val("i", italic)
+    if underline is not None:
+        rPr.u_val = WD_UNDERLINE.SINGLE if underline else WD_UNDERLINE.NONE
+    if font_name is not None:
+        rPr.rFonts_ascii = font_name
+        rPr.rFonts_hAnsi = font_name
+    if size is not None:
+        rPr.sz_val = size
+    if color is not None:
+        rPr._remove_color()
+        rPr.get_or_add_color().val = color
+
+
+@document_locked
 def format_text(
     path: str,
     paragraph_index: int,
@@ -47,67 +91,58 @@ def format_text(
         format_text(key, 1, font_name="Arial", font_size=12.0, run_index=0)  # Format only run 0 in paragraph 1
         format_text(key, 2, font_color="#FF0000")  # Red text for all runs in paragraph 2
     """
+    # Nothing to apply: skip the document lookup and all validation
+    if (bold is None and italic is None and underline is None and font_name is None
+            and font_size is None and font_color is None):
+        return f"No formatting changes specified for paragraph {paragraph_index}."
+
     try:
         doc = document_manager.get_document(path)
     except ValueError:
         return f"Error: No document open at '{path}'. Use open_document or create_document first."
 
-    para_count = len(doc.paragraphs)
+    paragraphs = ParagraphIndex(doc)
+    para_count = len(paragraphs)
 
     # Validate paragraph index
     if paragraph_index < 0 or paragraph_index >= para_count:
         return f"Error: Invalid paragraph index {paragraph_index}. Document has {para_count} paragraphs (valid range: 0-{para_count-1})."
 
-    para = doc.paragraphs[paragraph_index]
+    para = paragraphs[paragraph_index]
 
-    # Check if paragraph has runs
-    if len(para.runs) == 0:
+    # Check if paragraph has runs (on the XML, before building any Run proxy
+    # or parsing the requested formatting)
+    if not para._p.r_lst:
         return f"Error: Paragraph {paragraph_index} has no runs (empty paragraph). Cannot apply formatting."
 
-    # Validate font_color format if provided
+    # para.runs builds new Run proxies on every access: read it once
+    runs = para.runs
+
+    # Validate font_color format if provided, parsing it once for all runs
+    color = None
     if font_color is not None:
         if not (len(font_color) == 7 and font_color[0] == "#"):
             return f"Error: Invalid font_color format '{font_color}'. Expected '#RRGGBB' (e.g., '#FF0000')."
-        try:
-            # Validate hex chars
-            int(font_color[1:3], 16)
-            int(font_color[3:5], 16)
-            int(font_color[5:7], 16)
-        except ValueError:
+        if not _HEX_COLOR.fullmatch(font_color):
             return f"Error: Invalid font_color format '{font_color}'. Expected '#RRGGBB' with valid hex digits."
+        value = int(font_color[1:], 16)
+        color = RGBColor((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
+
+    size = Pt(font_size) if font_size is not None else None
 
     # Determine which runs to format
     if run_index is not None:
         # Validate run_index
-        if run_index < 0 or run_index >= len(para.runs):
-            return f"Error: Invalid run_index {run_index}. Paragraph {paragraph_index} has {len(para.runs)} runs (valid range: 0-{len(para.runs)-1})."
-        runs_to_format = [para.runs[run_index]]
+        if run_index < 0 or run_index >= len(runs):
+            return f"Error: Invalid run_index {run_index}. Paragraph {paragraph_index} has {len(runs)} runs (valid range: 0-{len(runs)-1})."
+        runs_to_format = [runs[run_index]]
         target_desc = f"run {run_index}"
     else:
-        runs_to_format = para.runs
-        target_desc = f"all {len(para.runs)} runs"
-
-    # Apply formatting to each target run
-    changes = []
-    for run in runs_to_format:
-        if bold is not None:
-            run.bold = bold
-        if italic is not None:
-            run.italic = italic
-        if underline is not None:
-            run.underline = underline
-        if font_name is not None:
-            run.font.name = font_name
-        if font_size is not None:
-            run.font.size = Pt(font_size)
-        if font_color is not None:
-            # Parse hex color
-            r = int(font_color[1:3], 16)
-            g = int(font_color[3:5], 16)
-            b = int(font_color[5:7], 16)
-            run.font.color.rgb = RGBColor(r, g, b)
+        runs_to_format = runs
+        target_desc = f"all {len(runs)} runs"
 
     # Build change description
+    changes = []
     if bold is not None:
         changes.append(f"bold={bold}")
     if italic is not None:
@@ -121,13 +156,18 @@ def format_text(
     if font_color is not None:
         changes.append(f"color={font_color}")
 
-    if not changes:
-        return f"No formatting changes specified for paragraph {paragraph_index}."
+    # Apply formatting to each target run
+    for run in runs_to_format:
+        _apply_rpr(run._r, bold, italic, underline, font_name, size, color)
+
+    document_manager.touch(path)
 
     changes_str = ", ".join(changes)
     return f"Applied formatting to paragraph {paragraph_index} ({target_desc}): {changes_str}"
 
 
+@docx_read_cache
+@document_locked
 def get_paragraph_formatting(path: str, paragraph_index: int) -> str:
     """Get formatting details for all runs in a paragraph.
 
@@ -152,22 +192,27 @@ def get_paragraph_formatting(path: str, paragraph_index: int) -> str:
     except ValueError:
         return f"Error: No document open at '{path}'. Use open_document or create_document first."
 
-    para_count = len(doc.paragraphs)
+    paragraphs = ParagraphIndex(doc)
+    para_count = len(paragraphs)
 
     # Validate paragraph index
     if paragraph_index < 0 or paragraph_index >= para_count:
         return f"Error: Invalid paragraph index {paragraph_index}. Document has {para_count} paragraphs (valid range: 0-{para_count-1})."
 
-    para = doc.paragraphs[paragraph_index]
+    para = paragraphs[paragraph_index]
 
-    if len(para.runs) == 0:
+    # Checked on the XML, before building any Run proxy
+    if not para._p.r_lst:
         return f"Paragraph {paragraph_index} has no runs (empty paragraph)."
 
+    # para.runs builds new Run proxies on every access: read it once
+    runs = para.runs
+
     # Build header
-    lines = [f"Paragraph {paragraph_index} formatting ({len(para.runs)} runs):"]
+    lines = [f"Paragraph {paragraph_index} formatting ({len(runs)} runs):"]
 
     # Build per-run details
-    for i, run in enumerate(para.runs):
+    for i, run in enumerate(runs):
         # Text preview: first 30 chars
         text = run.text
         if len(text) > 30:
@@ -175,22 +220,30 @@ def get_paragraph_formatting(path: str, paragraph_index: int) -> str:
         else:
             text_preview = f'"{text}"'
 
-        # Formatting properties (show "inherited" for None values)
-        bold_val = run.bold if run.bold is not None else "inherited"
-        italic_val = run.italic if run.italic is not None else "inherited"
-        underline_val = run.underline if run.underline is not None else "inherited"
+        # Formatting properties (show "inherited" for None values). run.font
+        # builds a new Font proxy per access: read each property once
+        font = run.font
+        bold = font.bold
+        italic = font.italic
+        underline = font.underline
+        name = font.name
+        size = font.size
+        rgb = font.color.rgb
+
+        bold_val = bold if bold is not None else "inherited"
+        italic_val = italic if italic is not None else "inherited"
+        underline_val = underline if underline is not None else "inherited"
 
-        font_name = run.font.name if run.font.name is not None else "inherited"
+        font_name = name if name is not None else "inherited"
 
-        if run.font.size is not None:
+        if size is not None:
             # Convert EMUs to points
-            font_size = f"{run.font.size.pt}pt"
+            font_size = f"{size.pt}pt"
         else:
             font_size = "inherited"
 
-        if run.font.color.rgb is not None:
+        if rgb is not None:
             # Convert RGBColor to hex string
-            rgb = run.font.color.rgb
             font_color = f"#{rgb[0]:02X}{rgb[1]:02X}{rgb[2]:02X}"
         else:
             font_color = "inherited"
@@ -9,12 +9,13 @@ CRITICAL PATTERNS (from research):
 - Use paragraphs[0].text for initial content, not add_paragraph() (Pitfall 5)
 """
 
-from ..document_manager import document_manager
+from ..document_manager import document_manager, document_locked
 from ..logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+@document_locked
 def get_header(path: str, section_index: int = 0, header_type: str = "primary") -> str:
     """Get header content from a section.
 
@@ -79,6 +80,7 @@ def get_header(path: str, section_index: int = 0, header_type: str = "primary")
     return "\n".join(lines)
 
 
+@document_locked
 def set_header(path: str, text: str, section_index: int = 0, header_type: str = "primary") -> str:
     """Set header content for a section.
 
@@ -141,6 +143,7 @@ def set_header(path: str, text: str, section_index: int = 0, header_type: str =
     # CRITICAL: Use paragraphs[0].text for initial content (Pitfall 5)
     # add_paragraph() would leave empty paragraph above
     header.paragraphs[0].text = text
+    document_manager.touch(path)
 
     # Build response message
     text_preview = text[:50] if len(text) <= 50 else text[:50] + "..."
@@ -152,6 +155,7 @@ def set_header(path: str, text: str, section_index: int = 0, header_type: str =
     return response
 
 
+@document_locked
 def get_footer(path: str, section_index: int = 0, footer_type: str = "primary") -> str:
     """Get footer content from a section.
 
@@ -216,6 +220,7 @@ def get_footer(path: str, section_index: int = 0, footer_type: str = "primary")
     return "\n".join(lines)
 
 
+@document_locked
 def set_footer(path: str, text: str, section_index: int = 0, footer_type: str = "primary") -> str:
     """Set footer content for a section.
 
@@ -278,6 +283,7 @@ def set_footer(path: str, text: str, section_index: int = 0, footer_type: str =
     # CRITICAL: Use paragraphs[0].text for initial content (Pitfall 5)
     # add_paragraph() would leave empty paragraph above
     footer.paragraphs[0].text = text
+    document_manager.touch(path)
 
     # Build response message
     text_preview = text[:50] if len(text) <= 50 else text[:50] + "..."
@@ -6,12 +6,15 @@ All images are inserted as InlineShapes (inline with text, not floating).
 
 from pathlib import Path
 from docx.shared import Inches
-from ..document_manager import document_manager
+from ..document_manager import document_manager, document_locked
 from ..logging_config import get_logger
+from .caches import display_name
+from .fast_read import ParagraphIndex
 
 logger = get_logger(__name__)
 
 
+@document_locked
 def insert_image(
     path: str,
     image_path: str,
@@ -61,18 +64,21 @@ def insert_image(
         para = doc.add_paragraph()
         run = para.add_run()
         run.add_picture(str(img_path), width=width_arg, height=height_arg)
-        insert_location = len(doc.paragraphs) - 1
+        insert_location = len(ParagraphIndex(doc)) - 1
     else:
         # Insert in existing paragraph
-        para_count = len(doc.paragraphs)
+        paragraphs = ParagraphIndex(doc)
+        para_count = len(paragraphs)
         if paragraph_index < 0 or paragraph_index >= para_count:
             return f"Error: Invalid paragraph index {paragraph_index}. Document has {para_count} paragraphs (valid range: 0-{para_count-1})."
 
-        para = doc.paragraphs[paragraph_index]
+        para = paragraphs[paragraph_index]
         run = para.add_run()
         run.add_picture(str(img_path), width=width_arg, height=height_arg)
         insert_location = paragraph_index
 
+    document_manager.touch(path)
+
     # Get total inline images count
     total_images = len(doc.inline_shapes)
 
@@ -92,6 +98,7 @@ def insert_image(
     return f"Inserted image '{image_filename}' ({dims}) at paragraph {insert_location}. Document has {total_images} inline images."
 
 
+@document_locked
 def resize_image(
     path: str,
     image_index: int,
@@ -171,6 +178,7 @@ def resize_image(
         shape.width = Inches(width)
     if height is not None:
         shape.height = Inches(height)
+    document_manager.touch(path)
 
     # Get current dimensions for confirmation
     current_width = shape.width.inches
@@ -181,6 +189,7 @@ def resize_image(
     return f"Resized image {image_index} to width={current_width:.2f}in, height={current_height:.2f}in."
 
 
+@document_locked
 def list_images(path: str) -> str:
     """List all inline images in the document with dimensions.
 
@@ -204,10 +213,7 @@ def list_images(path: str) -> str:
         return f"Error: No document open at '{path}'. Use open_document or create_document first."
 
     # Get filename for display
-    if path.startswith("Untitled-"):
-        filename = path
-    else:
-        filename = Path(path).name
+    filename = display_name(path)
 
     # Get inline images
     images = doc.inline_shapes
@@ -9,19 +9,19 @@ All functions use the bridge pattern:
 2. Validate document saved to disk (COM needs file on disk)
 3. Open via COM (WordApplication context manager)
 4. Perform COM-based operation
-5. Save and close via COM
+5. Save via COM (the pool keeps the document open for the next call)
 6. Reload python-docx document to sync state
 """
 
 from pathlib import Path
-from docx import Document
-from ..document_manager import document_manager
+from ..document_manager import document_manager, document_locked
 from ..com_pool import com_pool
 from ..logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+@document_locked
 def reposition_image(
     path: str,
     image_index: int,
@@ -73,13 +73,16 @@ def reposition_image(
     """
     try:
         # Validate document is open in DocumentManager
-        key = path if path.startswith("Untitled-") else str(Path(path).resolve())
+        key = path if document_manager.is_untitled(path) else document_manager.resolve_path(path)
         doc = document_manager.get_document(key)
 
         # Check file exists on disk (COM requires saved file)
-        if key.startswith("Untitled-"):
+        if document_manager.is_untitled(key):
             return "Error: Document must be saved to disk before COM operations. Use save_document_as first."
 
+        # A deferred save must reach disk before COM opens the file
+        document_manager.flush_pending_saves(key)
+
         if not Path(key).exists():
             return "Error: Document must be saved to disk before COM operations. Use save_document first."
 
@@ -90,7 +93,7 @@ def reposition_image(
         # Use COM to reposition image
         try:
             with com_pool.get_word_app() as word:
-                com_doc = word.Documents.Open(key)
+                com_doc = com_pool.open_document(word, key)
 
                 # Convert 0-based to 1-based for COM
                 com_image_index = image_index + 1
@@ -115,16 +118,16 @@ def reposition_image(
                 if height is not None:
                     shape.Height = height * 72
 
-                # Save and close
+                # Save, leaving the document open in the pool for the next call
                 com_doc.Save()
-                com_doc.Close()
+                com_pool.keep_document(word, key, com_doc)
 
         except Exception as e:
             logger.error("tool_operation_failed", tool="unknown", error=str(e), error_type=type(e).__name__)
             return f"Error: COM automation failed: {str(e)}. Ensure Microsoft Word is installed."
 
         # Reload python-docx document to sync in-memory state
-        document_manager._documents[key] = Document(key)
+        document_manager.reload_document(key)
 
         # Build success message
         msg_parts = [f"Repositioned image {image_index} to absolute position"]
@@ -5,6 +5,10 @@ Provides get_server_health() function that returns formatted health report
 for consumption by MCP clients (Claude, etc.).
 """
 
+# (metrics dict, rendered report) of the last call. check_health() returns the
+# same dict object while nothing has changed, so the report is reused as well.
+_last_report = (None, "")
+
 
 def get_server_health() -> str:
     """
@@ -21,9 +25,13 @@ def get_server_health() -> str:
     Returns:
         Formatted multi-line string with health metrics
     """
+    global _last_report
     from ..monitoring import health_monitor
 
     metrics = health_monitor.check_health()
+    last_metrics, last_text = _last_report
+    if metrics is last_metrics:
+        return last_text
 
     # Format as readable string
     lines = [
@@ -46,4 +54,6 @@ def get_server_health() -> str:
         for alert in metrics['alerts']:
             lines.append(f"  - {alert}")
 
-    return "\n".join(lines)
+    text = "\n".join(lines)
+    _last_report = (metrics, text)
+    return text
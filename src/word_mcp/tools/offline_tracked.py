@@ -0,0 +1,250 @@
+"""Tracked paragraph edits written straight into the document XML.
+
+A tracked insertion or deletion of a whole paragraph is plain revision
+markup in WordprocessingML, so it does not need Word: the runs go inside
+<w:ins> / <w:del> (with <w:t> renamed to <w:delText> for deletions) and the
+paragraph mark carries the same revision in its <w:rPr>. With
+WORD_MCP_OFFLINE_TRACKED=1, tracked_add_paragraph (position "end") and
+tracked_delete_paragraph edit the in-memory python-docx document this way
+and save it, instead of opening the file in Word.
+
+The offline path is only taken when the result is what Word would produce;
+otherwise the tools fall back to COM. It is skipped when:
+
+- The paragraph involved holds fields, content controls, hyperlinks or
+  existing revisions, or carries a section break
+- The body holds block-level content controls (python-docx and Word would
+  not agree on paragraph indexes)
+- The new text holds control characters (tabs, line or paragraph breaks)
+- A paragraph would be appended after a table, or the final paragraph of
+  the body would be deleted (Word keeps its mark)
+- A tracked_edit_session is open for the document
+
+Like the COM path, it requires tracking to be on (<w:trackRevisions/> in
+word/settings.xml). Unlike the COM path, which reopens the file from disk,
+the save also writes any in-memory edits not yet saved.
+"""
+
+import copy
+import os
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+from ..document_manager import document_manager
+from .com_session import in_session
+
+# Set WORD_MCP_OFFLINE_TRACKED=1 to use the offline path where it applies
+OFFLINE_TRACKED = os.environ.get("WORD_MCP_OFFLINE_TRACKED") == "1"
+
+# Paragraph children the offline path knows how to mark up
+_PLAIN_PARAGRAPH_CHILDREN = frozenset(
+    qn(tag) for tag in (
+        "w:pPr", "w:r", "w:bookmarkStart", "w:bookmarkEnd", "w:proofErr",
+        "w:commentRangeStart", "w:commentRangeEnd",
+    )
+)
+
+# Markup anywhere in a paragraph that needs Word's own handling
+_UNSUPPORTED_XPATH = (
+    ".//w:fldChar | .//w:instrText | .//w:fldSimple | .//w:sdt"
+    " | .//w:ins | .//w:del | .//w:moveFrom | .//w:moveTo"
+    " | .//w:pPrChange | .//w:rPrChange | ./w:pPr/w:sectPr"
+)
+
+# Next free revision id per document key: (revision it is valid for, id)
+_next_ids: Dict[str, Tuple[int, int]] = {}
+
+
+def offline_enabled(key: str) -> bool:
+    """Whether tracked edits of key may take the offline path."""
+    return OFFLINE_TRACKED and not in_session(key)
+
+
+def tracking_enabled(doc) -> bool:
+    """Whether word/settings.xml turns Track Changes on."""
+    track = doc.settings.element.find(qn("w:trackRevisions"))
+    if track is None:
+        return False
+    return track.get(qn("w:val"), "true") not in ("0", "false", "off")
+
+
+def _supported_paragraph(p) -> bool:
+    """Whether a body paragraph holds only markup the offline path handles."""
+    if any(child.tag not in _PLAIN_PARAGRAPH_CHILDREN for child in p):
+        return False
+    return not p.xpath(_UNSUPPORTED_XPATH)
+
+
+def _body_blocks(doc):
+    """Body block elements (paragraphs, tables, ...), without the final sectPr."""
+    return [child for child in doc.element.body if child.tag != qn("w:sectPr")]
+
+
+def _reserve_revision_ids(key: str, doc, count: int) -> int:
+    """
+    Reserve count consecutive w:id values for new revisions and return the first.
+
+    The first call for a document revision scans document.xml for its
+    highest w:id (revisions, comments and bookmarks); later calls continue
+    from the last reserved id.
+    """
+    revision = document_manager.revision(key)
+    cached = _next_ids.get(key)
+    if cached is not None and cached[0] == revision:
+        first = cached[1]
+    else:
+        first = 0
+        for value in doc.element.xpath("//@w:id"):
+            try:
+                first = max(first, int(value) + 1)
+            except ValueError:
+                pass
+    _next_ids[key] = (revision, first + count)
+    return first
+
+
+def evict_revision_ids(key: str):
+    """Drop the cached next revision id for a document key (e.g. when it is closed)."""
+    _next_ids.pop(key, None)
+
+
+def _revision(tag: str, revision_id: int, author: str, date: str):
+    """A <w:ins> or <w:del> element with its revision attributes."""
+    element = OxmlElement(tag)
+    element.set(qn("w:id"), str(revision_id))
+    element.set(qn("w:author"), author)
+    element.set(qn("w:date"), date)
+    return element
+
+
+def _mark_paragraph_mark(p, revision):
+    """Record a revision on the paragraph mark (pPr/rPr)."""
+    rPr = p.get_or_add_pPr().find(qn("w:rPr"))
+    if rPr is None:
+        rPr = OxmlElement("w:rPr")
+        p.pPr.append(rPr)
+    # Revision markers come first in a paragraph mark's properties
+    rPr.insert(0, revision)
+
+
+def _save(key: str):
+    """Record the in-memory edit and write the document to disk."""
+    document_manager.touch(key)
+    # Ids reserved for this edit stay reserved in the new revision
+    cached = _next_ids.get(key)
+    if cached is not None:
+        _next_ids[key] = (document_manager.revision(key), cached[1])
+    document_manager.save_document(key)
+
+
+def append_tracked_paragraph(key: str, doc, text: str, author: str) -> bool:
+    """
+    Append a paragraph to the end of the body as a tracked insertion, and save.
+
+    Encoded the way Word records Content.InsertAfter("\\r" + text): the
+    previous last paragraph gains an inserted paragraph mark, and the new
+    last paragraph takes its paragraph and run formatting, with the text
+    inside <w:ins>.
+
+    Args:
+        key: Document key
+        doc: The open python-docx document for key
+        text: Text of the new paragraph
+        author: Author recorded on the revision
+
+    Returns:
+        True if the paragraph was added, False if the COM path must be used
+    """
+    if any(ord(ch) < 0x20 for ch in text):
+        return False
+
+    with document_manager.document_lock(key):
+        # Checked under the lock, so no other edit can add content after last
+        blocks = _body_blocks(doc)
+        if not blocks or blocks[-1].tag != qn("w:p") or doc.element.body.find(qn("w:sdt")) is not None:
+            return False
+        last = blocks[-1]
+        if not _supported_paragraph(last):
+            return False
+
+        first_id = _reserve_revision_ids(key, doc, 2)
+        date = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        new_p = OxmlElement("w:p")
+        if last.pPr is not None:
+            new_p.append(copy.deepcopy(last.pPr))
+        # Typing at the end of a paragraph continues its last run's formatting
+        runs = last.r_lst
+        run = new_p.add_r()
+        if runs and runs[-1].rPr is not None:
+            run.insert(0, copy.deepcopy(runs[-1].rPr))
+        run.text = text
+
+        ins = _revision("w:ins", first_id + 1, author, date)
+        run.addprevious(ins)
+        ins.append(run)
+
+        _mark_paragraph_mark(last, _revision("w:ins", first_id, author, date))
+        last.addnext(new_p)
+        _save(key)
+    return True
+
+
+def body_paragraphs(doc) -> List:
+    """The body's w:p elements, in the order python-docx indexes them."""
+    return doc.element.body.findall(qn("w:p"))
+
+
+def can_delete_paragraph(doc, p) -> bool:
+    """Whether delete_tracked_paragraph() can delete body paragraph p."""
+    if doc.element.body.find(qn("w:sdt")) is not None:
+        return False
+    return p is not _body_blocks(doc)[-1] and _supported_paragraph(p)
+
+
+def paragraph_text(p) -> str:
+    """A paragraph's text followed by "\\r", as Word reports a paragraph range."""
+    return "".join(r.text for r in p.r_lst) + "\r"
+
+
+def delete_tracked_paragraph(key: str, doc, p, author: str):
+    """
+    Delete a body paragraph as a tracked deletion, and save.
+
+    Consecutive runs are wrapped in <w:del> with their text moved into
+    <w:delText>, and the paragraph mark is marked deleted, so accepting the
+    revision removes the paragraph and rejecting it restores it unchanged.
+    Check can_delete_paragraph() first.
+
+    Args:
+        key: Document key
+        doc: The open python-docx document for key
+        p: The paragraph's w:p element
+        author: Author recorded on the revision
+    """
+    with document_manager.document_lock(key):
+        groups = []
+        for child in p:
+            if child.tag != qn("w:r"):
+                continue
+            if groups and child.getprevious() is groups[-1][-1]:
+                groups[-1].append(child)
+            else:
+                groups.append([child])
+
+        first_id = _reserve_revision_ids(key, doc, len(groups) + 1)
+        date = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        for offset, runs in enumerate(groups, start=1):
+            deletion = _revision("w:del", first_id + offset, author, date)
+            runs[0].addprevious(deletion)
+            for run in runs:
+                for t in run.findall(qn("w:t")):
+                    t.tag = qn("w:delText")
+                deletion.append(run)
+
+        _mark_paragraph_mark(p, _revision("w:del", first_id, author, date))
+        _save(key)
@@ -4,13 +4,150 @@ Provides text search and find-and-replace functionality with case sensitivity co
 Supports plain text search (default) and optional regex search via use_regex=True.
 """
 
+import functools
 import re
-from ..document_manager import document_manager
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import List, Optional, Set, Tuple
+
+from ..document_manager import document_manager, document_locked
 from ..logging_config import get_logger
 
+try:
+    import hyperscan
+except ImportError:  # optional: regex search falls back to scanning every paragraph
+    hyperscan = None
+
 logger = get_logger(__name__)
 
+# Paragraph text snapshots kept for repeated searches (most recent revisions)
+_SNAPSHOT_CACHE_SIZE = 16
+
+
+class _TextSnapshot:
+    """
+    Paragraph texts of one document revision, with derived forms built on demand.
+
+    A revision number identifies one state of one document (see
+    DocumentManager.revision), so a snapshot stays valid for as long as
+    searches see that revision.
+    """
+
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        self._lowered: Optional[List[str]] = None
+        self._joined: Optional[Tuple[bytes, List[int]]] = None
+
+    def lowered(self) -> List[str]:
+        """Texts lowercased for case-insensitive plain search."""
+        if self._lowered is None:
+            self._lowered = [text.lower() for text in self.texts]
+        return self._lowered
+
+    def joined(self) -> Tuple[bytes, List[int]]:
+        """UTF-8 texts joined with newlines, and each paragraph's byte offset."""
+        if self._joined is None:
+            chunks = [text.encode("utf-8") for text in self.texts]
+            starts = []
+            offset = 0
+            for chunk in chunks:
+                starts.append(offset)
+                offset += len(chunk) + 1
+            self._joined = (b"\n".join(chunks), starts)
+        return self._joined
+
+
+_snapshots: "OrderedDict[int, _TextSnapshot]" = OrderedDict()
+_snapshots_lock = threading.Lock()
+
+
+def _text_snapshot(path: str, doc) -> _TextSnapshot:
+    """Get the paragraph text snapshot for an open document's current revision."""
+    revision = document_manager.revision(path)
+    with _snapshots_lock:
+        snapshot = _snapshots.get(revision)
+        if snapshot is not None:
+            _snapshots.move_to_end(revision)
+            return snapshot
+
+    # Same paragraphs as doc.paragraphs, without building Paragraph proxies
+    snapshot = _TextSnapshot([p.text for p in doc.element.body.p_lst])
+    with _snapshots_lock:
+        _snapshots[revision] = snapshot
+        while len(_snapshots) > _SNAPSHOT_CACHE_SIZE:
+            _snapshots.popitem(last=False)
+    return snapshot
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled_regex(pattern: str, flags: int) -> "re.Pattern":
+    """Compile a user-supplied search regex (memoized; raises re.error)."""
+    return re.compile(pattern, flags)
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled_literal(text: str, flags: int) -> "re.Pattern":
+    """Compile a pattern matching text literally (memoized)."""
+    return re.compile(re.escape(text), flags)
 
+
+def _regex_candidates(snapshot: _TextSnapshot, query: str, case_sensitive: bool) -> Optional[Set[int]]:
+    """Pre-select paragraphs that may match a regex, using Hyperscan if installed.
+
+    All paragraphs are joined with newlines and scanned in one pass with a
+    prefilter-mode database, which may over-report but never misses a match
+    that lies within a single paragraph. Only the reported paragraphs then go
+    through Python's re for exact results.
+
+    Args:
+        snapshot: Paragraph texts of the document being searched
+        query: Regex pattern (already validated with re.compile)
+        case_sensitive: If False, match case-insensitively
+
+    Returns:
+        Set of candidate paragraph indexes, or None when Hyperscan is not
+        installed or cannot compile the pattern (scan every paragraph)
+    """
+    if hyperscan is None or not snapshot.texts:
+        return None
+    # \A and \Z anchors would only match at the ends of the joined buffer
+    if "\\A" in query or "\\Z" in query:
+        return None
+    # Byte offset where each paragraph starts in the joined buffer
+    buffer, starts = snapshot.joined()
+    # Unicode case folding differs between re and Hyperscan; ASCII is identical
+    if not case_sensitive and not (query.isascii() and buffer.isascii()):
+        return None
+
+    flags = (
+        hyperscan.HS_FLAG_PREFILTER
+        | hyperscan.HS_FLAG_MULTILINE  # ^/$ also match at paragraph boundaries
+        | hyperscan.HS_FLAG_UTF8
+        | hyperscan.HS_FLAG_UCP
+    )
+    if not case_sensitive:
+        flags |= hyperscan.HS_FLAG_CASELESS
+
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(expressions=[query.encode("utf-8")], ids=[0], elements=1, flags=[flags])
+    except Exception as e:
+        # Python-only syntax, empty-matching patterns, etc.
+        logger.debug("hyperscan_compile_failed", error=str(e))
+        return None
+
+    candidates: Set[int] = set()
+
+    def on_match(pattern_id, start, end, match_flags, context):
+        # end is exclusive: the last matched byte is end - 1
+        candidates.add(bisect_right(starts, max(end - 1, 0)) - 1)
+
+    db.scan(buffer, match_event_handler=on_match)
+    return candidates
+
+
+@document_locked
 def search_text(path: str, query: str, case_sensitive: bool = False, use_regex: bool = False) -> str:
     """Search for text in document paragraphs.
 
@@ -44,69 +181,59 @@ def search_text(path: str, query: str, case_sensitive: bool = False, use_regex:
     if use_regex:
         flags = 0 if case_sensitive else re.IGNORECASE
         try:
-            compiled = re.compile(query, flags)
+            compiled = _compiled_regex(query, flags)
         except re.error as exc:
             return f"Error: Invalid regex pattern: {exc}"
 
-    paragraphs = doc.paragraphs
+    # Paragraph texts of this revision, reused until the document changes
+    snapshot = _text_snapshot(path, doc)
+    texts = snapshot.texts
     matches = []
     total_matches = 0
 
-    for i, para in enumerate(paragraphs):
-        text = para.text
+    if use_regex:
+        # Paragraph indexes that may match (None: scan every paragraph)
+        candidates = _regex_candidates(snapshot, query, case_sensitive)
+    else:
+        needle = query if case_sensitive else query.lower()
+        haystacks = texts if case_sensitive else snapshot.lowered()
 
+    for i, text in enumerate(texts):
         if use_regex:
-            # Regex path
-            found = compiled.findall(text)
-            match_count = len(found)
-            if match_count > 0:
-                total_matches += match_count
-                m = compiled.search(text)
-                first_match_pos = m.start() if m else 0
-                match_len = len(m.group(0)) if m else len(query)
-
-                if len(text) <= 150:
-                    context = text
-                else:
-                    start = max(0, first_match_pos - 50)
-                    end = min(len(text), first_match_pos + match_len + 50)
-                    context = text[start:end]
-                    if start > 0:
-                        context = "..." + context
-                    if end < len(text):
-                        context = context + "..."
-
-                matches.append((i, match_count, context))
+            # Regex path: one finditer pass yields both the first match and the count
+            if candidates is not None and i not in candidates:
+                continue
+            found = compiled.finditer(text)
+            m = next(found, None)
+            if m is None:
+                continue
+            match_count = 1 + sum(1 for _ in found)
+            first_match_pos = m.start()
+            match_len = len(m.group(0))
         else:
-            # Plain text path (original behavior)
-            if case_sensitive:
-                match_count = text.count(query)
-            else:
-                match_count = text.lower().count(query.lower())
-
-            if match_count > 0:
-                total_matches += match_count
-
-                # Create context: show 50 chars before/after first match, or full paragraph if short
-                if case_sensitive:
-                    first_match_pos = text.find(query)
-                else:
-                    text_lower = text.lower()
-                    query_lower = query.lower()
-                    first_match_pos = text_lower.find(query_lower)
-
-                if len(text) <= 150:
-                    context = text
-                else:
-                    start = max(0, first_match_pos - 50)
-                    end = min(len(text), first_match_pos + len(query) + 50)
-                    context = text[start:end]
-                    if start > 0:
-                        context = "..." + context
-                    if end < len(text):
-                        context = context + "..."
+            # Plain text path (original behavior), on pre-lowered paragraphs
+            haystack = haystacks[i]
+            match_count = haystack.count(needle)
+            if match_count == 0:
+                continue
+            first_match_pos = haystack.find(needle)
+            match_len = len(query)
+
+        total_matches += match_count
+
+        # Create context: show 50 chars before/after first match, or full paragraph if short
+        if len(text) <= 150:
+            context = text
+        else:
+            start = max(0, first_match_pos - 50)
+            end = min(len(text), first_match_pos + match_len + 50)
+            context = text[start:end]
+            if start > 0:
+                context = "..." + context
+            if end < len(text):
+                context = context + "..."
 
-                matches.append((i, match_count, context))
+        matches.append((i, match_count, context))
 
     # Format results
     if total_matches == 0:
@@ -119,6 +246,7 @@ def search_text(path: str, query: str, case_sensitive: bool = False, use_regex:
     return "\n".join(lines)
 
 
+@document_locked
 def replace_text(
     path: str,
     find_text: str,
@@ -182,12 +310,12 @@ def replace_text(
                     new_text = text.replace(find_text, replace_with, 1)
                     count = 1
             else:
-                # Case-insensitive replacement using regex
+                # Case-insensitive replacement using regex (one pass replaces and counts)
+                pattern = _compiled_literal(find_text, re.IGNORECASE)
                 if replace_all:
-                    new_text = re.sub(re.escape(find_text), replace_with, text, flags=re.IGNORECASE)
-                    count = len(re.findall(re.escape(find_text), text, flags=re.IGNORECASE))
+                    new_text, count = pattern.subn(replace_with, text)
                 else:
-                    new_text = re.sub(re.escape(find_text), replace_with, text, count=1, flags=re.IGNORECASE)
+                    new_text = pattern.sub(replace_with, text, count=1)
                     count = 1
 
             # Apply replacement at run level to preserve formatting
@@ -212,4 +340,6 @@ def replace_text(
     if total_replacements == 0:
         return f"No occurrences of '{find_text}' found."
 
+    document_manager.touch(path)
+
     return f"Replaced {total_replacements} occurrence(s) of '{find_text}' with '{replace_with}' in {paragraphs_modified} paragraph(s)."
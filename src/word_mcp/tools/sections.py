@@ -6,12 +6,14 @@ All functions use zero-based indexing for sections.
 
 from docx.enum.section import WD_SECTION_START, WD_ORIENTATION
 from docx.shared import Inches
-from ..document_manager import document_manager
+from ..document_manager import document_manager, document_locked
 from ..logging_config import get_logger
+from .caches import display_name
 
 logger = get_logger(__name__)
 
 
+@document_locked
 def list_sections(path: str) -> str:
     """List all sections in the document.
 
@@ -45,8 +47,7 @@ def list_sections(path: str) -> str:
     section_count = len(sections)
 
     # Get filename for display
-    from pathlib import Path
-    filename = Path(path).name if not path.startswith("Untitled-") else path
+    filename = display_name(path)
 
     if section_count == 0:
         return f"No sections found in '{filename}' (rare but possible)."
@@ -88,6 +89,7 @@ def list_sections(path: str) -> str:
     return "\n".join(lines)
 
 
+@document_locked
 def add_section(path: str, break_type: str = "new_page") -> str:
     """Add a new section to the document.
 
@@ -140,6 +142,7 @@ def add_section(path: str, break_type: str = "new_page") -> str:
     # new sections to unexpectedly inherit first-page header/footer behavior.
     new_section = doc.sections[-1]
     new_section.different_first_page_header_footer = False
+    document_manager.touch(path)
 
     # Get section index (zero-based)
     section_idx = len(doc.sections) - 1
@@ -148,6 +151,7 @@ def add_section(path: str, break_type: str = "new_page") -> str:
     return f"Added section {section_idx} with break type '{break_type}'. Document now has {section_count} section(s)."
 
 
+@document_locked
 def modify_section_properties(
     path: str,
     section_index: int,
@@ -272,6 +276,8 @@ def modify_section_properties(
         section.footer_distance = Inches(footer_distance)
         changes.append(f"footer_distance={footer_distance:.1f}in")
 
+    document_manager.touch(path)
+
     # Check if any properties were specified
     if not changes:
         return "Error: No properties specified to modify."
@@ -4,12 +4,14 @@ Provides paragraph style application including heading styles H1-H9.
 """
 
 from docx.oxml.shared import OxmlElement
-from ..document_manager import document_manager
+from ..document_manager import document_manager, document_locked
 from ..logging_config import get_logger
+from .fast_read import ParagraphIndex
 
 logger = get_logger(__name__)
 
 
+@document_locked
 def apply_heading_style(path: str, index: int, level: int) -> str:
     """Apply a heading style (H1-H9) to a paragraph.
 
@@ -33,7 +35,7 @@ def apply_heading_style(path: str, index: int, level: int) -> str:
     if level < 1 or level > 9:
         return f"Error: Invalid heading level {level}. Valid range is 1-9 (for Heading 1 through Heading 9)."
 
-    paragraphs = doc.paragraphs
+    paragraphs = ParagraphIndex(doc)
     para_count = len(paragraphs)
 
     # Validate index
@@ -46,6 +48,7 @@ def apply_heading_style(path: str, index: int, level: int) -> str:
     # Apply heading style
     style_name = f"Heading {level}"
     para.style = style_name
+    document_manager.touch(path)
 
     # Text preview
     text_preview = text[:50] if len(text) <= 50 else text[:50] + "..."
@@ -53,6 +56,7 @@ def apply_heading_style(path: str, index: int, level: int) -> str:
     return f"Applied '{style_name}' style to paragraph {index}: '{text_preview}'"
 
 
+@document_locked
 def apply_style(path: str, index: int, style_name: str) -> str:
     """Apply a paragraph style by name.
 
@@ -75,7 +79,7 @@ def apply_style(path: str, index: int, style_name: str) -> str:
     if doc is None:
         return f"Error: No document open at '{path}'. Use open_document or create_document first."
 
-    paragraphs = doc.paragraphs
+    paragraphs = ParagraphIndex(doc)
     para_count = len(paragraphs)
 
     # Validate index
@@ -94,4 +98,5 @@ def apply_style(path: str, index: int, style_name: str) -> str:
         logger.error("tool_operation_failed", tool="apply_style", error=f"Style '{style_name}' not found", error_type="KeyError")
         return f"Error: Style '{style_name}' not found. Available paragraph styles: {', '.join(available_styles)}"
 
+    document_manager.touch(path)
     return f"Applied '{style_name}' style to paragraph {index}"
@@ -7,15 +7,29 @@ Note: Row deletion (TBL-05) and column deletion (TBL-07) require COM and are not
 implemented here. See plan 03-03 for deletion operations.
 """
 
-from pathlib import Path
 from typing import Optional, List
 from docx.shared import Inches
-from ..document_manager import document_manager
+from ..document_manager import document_manager, document_locked
 from ..logging_config import get_logger
+from .caches import display_name, docx_read_cache
+from .fast_read import cell_text as fast_cell_text
 
 logger = get_logger(__name__)
 
 
+def _cell_grid(table) -> list:
+    """All cells of a table in row-major order, as table.cell() indexes them.
+
+    table.cell(r, c) rebuilds this list (walking every row, following merged
+    cells) on each call, so filling or reading a whole table through it is
+    quadratic in the cell count. Loops build the grid once and index it as
+    grid[r * len(table.columns) + c]; the grid is only valid until rows or
+    columns are added or removed.
+    """
+    return table._cells
+
+
+@document_locked
 def create_table(
     path: str,
     rows: int,
@@ -65,12 +79,14 @@ def create_table(
 
     # Create table
     table = doc.add_table(rows=rows, cols=cols)
+    document_manager.touch(path)
 
     # Populate with data if provided
     if data is not None:
+        grid = _cell_grid(table)
         for row_idx in range(rows):
             for col_idx in range(cols):
-                table.cell(row_idx, col_idx).text = str(data[row_idx][col_idx])
+                grid[row_idx * cols + col_idx].text = str(data[row_idx][col_idx])
 
     # Apply style if provided
     if style is not None:
@@ -88,6 +104,8 @@ def create_table(
     return f"Created table with {rows} rows x {cols} columns (table index: {table_idx}). Document now has {table_count} table(s)."
 
 
+@docx_read_cache
+@document_locked
 def list_tables(path: str) -> str:
     """List all tables in the document.
 
@@ -114,7 +132,7 @@ def list_tables(path: str) -> str:
     table_count = len(tables)
 
     # Get filename for display
-    filename = Path(path).name if not path.startswith("Untitled-") else path
+    filename = display_name(path)
 
     if table_count == 0:
         return f"No tables found in '{filename}'."
@@ -127,9 +145,10 @@ def list_tables(path: str) -> str:
         row_count = len(table.rows)
         col_count = len(table.columns)
 
-        # Get first cell preview
+        # Get first cell preview (table.cell(0, 0) is the first w:tc; reading
+        # it directly skips building the whole cell grid)
         try:
-            first_cell_text = table.cell(0, 0).text
+            first_cell_text = fast_cell_text(next(table._tbl.iter_tcs()))
             # Truncate if longer than 30 chars
             if len(first_cell_text) > 30:
                 preview = first_cell_text[:30] + "..."
@@ -143,6 +162,8 @@ def list_tables(path: str) -> str:
     return "\n".join(lines)
 
 
+@docx_read_cache
+@document_locked
 def read_table(
     path: str,
     table_index: int,
@@ -202,12 +223,17 @@ def read_table(
     # Build header
     lines = [f"Table {table_index} ({row_count} rows x {col_count} cols):"]
 
-    # Build row content
+    # Build row content (a merged cell repeats in the grid: read it once)
+    grid = _cell_grid(table)
+    texts = {}
     for row_idx in range(start_row, end_row + 1):
         row_cells = []
         for col_idx in range(col_count):
             try:
-                cell_text = table.cell(row_idx, col_idx).text
+                tc = grid[row_idx * col_count + col_idx]._tc
+                cell_text = texts.get(tc)
+                if cell_text is None:
+                    cell_text = texts[tc] = fast_cell_text(tc)
                 # Truncate if longer than 40 chars
                 if len(cell_text) > 40:
                     cell_text = cell_text[:40] + "..."
@@ -224,6 +250,7 @@ def read_table(
     return "\n".join(lines)
 
 
+@document_locked
 def edit_table_cell(path: str, table_index: int, row: int, col: int, text: str) -> str:
     """Edit the content of a specific table cell.
 
@@ -268,6 +295,7 @@ def edit_table_cell(path: str, table_index: int, row: int, col: int, text: str)
 
     # Update cell content
     table.cell(row, col).text = str(text)
+    document_manager.touch(path)
 
     # Preview: first 50 chars
     text_preview = str(text)[:50] if len(str(text)) <= 50 else str(text)[:50] + "..."
@@ -275,6 +303,7 @@ def edit_table_cell(path: str, table_index: int, row: int, col: int, text: str)
     return f"Updated cell ({row}, {col}) in table {table_index}. New content: '{text_preview}'."
 
 
+@document_locked
 def add_table_row(
     path: str,
     table_index: int,
@@ -324,12 +353,77 @@ def add_table_row(
         for col_idx in range(col_count):
             new_row.cells[col_idx].text = str(data[col_idx])
 
+    document_manager.touch(path)
+
     # Get updated dimensions
     new_row_count = len(table.rows)
 
     return f"Added row to table {table_index}. Table now has {new_row_count} rows x {col_count} columns."
 
 
+@document_locked
+def add_table_rows(path: str, table_index: int, rows: List[List]) -> str:
+    """Add several populated rows to the end of an existing table.
+
+    Same rows as calling add_table_row once per row, in one call: the table
+    is looked up and its column widths read once, and each row's cells are
+    filled as they are created (no per-row cell grid).
+
+    Args:
+        path: Document path or key
+        table_index: Zero-based table index
+        rows: List of rows, each a list of cell values with length equal to
+              the column count. Each value is converted to string.
+
+    Returns:
+        Success message with updated table dimensions, or error message
+
+    Example:
+        add_table_rows(key, 0, [["A", "1"], ["B", "2"]])  # Appends two rows
+    """
+    try:
+        doc = document_manager.get_document(path)
+    except ValueError as e:
+        logger.error("tool_operation_failed", tool="add_table_rows", error=str(e), error_type=type(e).__name__)
+        return f"Error: {str(e)}"
+
+    # Validate table index
+    table_count = len(doc.tables)
+    if table_count == 0:
+        return "Error: No tables found in document."
+    if table_index < 0 or table_index >= table_count:
+        return f"Error: Invalid table_index {table_index}. Document has {table_count} table(s) (valid range: 0-{table_count-1})."
+
+    table = doc.tables[table_index]
+    tbl = table._tbl
+    grid_widths = [grid_col.w for grid_col in tbl.tblGrid.gridCol_lst]
+    col_count = len(grid_widths)
+
+    # Validate all rows before adding any
+    if not rows:
+        return "Error: rows must contain at least one row."
+    for row_idx, row_data in enumerate(rows):
+        if len(row_data) != col_count:
+            return f"Error: rows[{row_idx}] has {len(row_data)} items but table has {col_count} columns."
+
+    # Build each row as Table.add_row() does, setting cell text as
+    # _Cell.text does (one paragraph holding one run)
+    for row_data in rows:
+        tr = tbl.add_tr()
+        for width, value in zip(grid_widths, row_data):
+            tc = tr.add_tc()
+            if width is not None:
+                tc.width = width
+            tc.p_lst[0].add_r().text = str(value)
+
+    document_manager.touch(path)
+
+    new_row_count = len(tbl.tr_lst)
+
+    return f"Added {len(rows)} row(s) to table {table_index}. Table now has {new_row_count} rows x {col_count} columns."
+
+
+@document_locked
 def add_table_column(
     path: str,
     table_index: int,
@@ -384,7 +478,10 @@ def add_table_column(
 
     # Populate with data if provided
     if data is not None:
+        grid = _cell_grid(table)
         for row_idx in range(row_count):
-            table.cell(row_idx, new_col_idx).text = str(data[row_idx])
+            grid[row_idx * new_col_count + new_col_idx].text = str(data[row_idx])
+
+    document_manager.touch(path)
 
     return f"Added column to table {table_index}. Table now has {row_count} rows x {new_col_count} columns."
@@ -10,19 +10,20 @@ All functions use the bridge pattern:
 2. Validate document saved to disk (COM needs file on disk)
 3. Open via COM (WordApplication context manager)
 4. Perform COM-based operation
-5. Save and close via COM
+5. Save via COM (the pool keeps the document open for the next call)
 6. Reload python-docx document to sync state
 """
 
 from pathlib import Path
-from docx import Document
-from ..document_manager import document_manager
+from ..document_manager import document_manager, document_locked
 from ..com_pool import com_pool
 from ..logging_config import get_logger
+from .com_session import apply_min_diff, com_document, save_com_document, sync_document
 
 logger = get_logger(__name__)
 
 
+@document_locked
 def delete_table_row(path: str, table_index: int, row_index: int) -> str:
     """
     Delete a row from an existing table using COM automation (TBL-05).
@@ -55,13 +56,16 @@ def delete_table_row(path: str, table_index: int, row_index: int) -> str:
     """
     try:
         # Validate document is open in DocumentManager
-        key = path if path.startswith("Untitled-") else str(Path(path).resolve())
+        key = path if document_manager.is_untitled(path) else document_manager.resolve_path(path)
         doc = document_manager.get_document(key)
 
         # Check file exists on disk (COM requires saved file)
-        if key.startswith("Untitled-"):
+        if document_manager.is_untitled(key):
             return "Error: Document must be saved to disk before COM operations. Use save_document_as first."
 
+        # A deferred save must reach disk before COM opens the file
+        document_manager.flush_pending_saves(key)
+
         if not Path(key).exists():
             return "Error: Document must be saved to disk before COM operations. Use save_document first."
 
@@ -72,7 +76,7 @@ def delete_table_row(path: str, table_index: int, row_index: int) -> str:
         # Use COM to delete row
         try:
             with com_pool.get_word_app() as word:
-                com_doc = word.Documents.Open(key)
+                com_doc = com_pool.open_document(word, key)
 
                 # Convert 0-based to 1-based for COM
                 com_table_index = table_index + 1
@@ -95,16 +99,16 @@ def delete_table_row(path: str, table_index: int, row_index: int) -> str:
                 # Get updated row count
                 updated_row_count = table.Rows.Count
 
-                # Save and close
+                # Save, leaving the document open in the pool for the next call
                 com_doc.Save()
-                com_doc.Close()
+                com_pool.keep_document(word, key, com_doc)
 
         except Exception as e:
             logger.error("tool_operation_failed", tool="unknown", error=str(e), error_type=type(e).__name__)
             return f"Error: COM automation failed: {str(e)}. Ensure Microsoft Word is installed."
 
         # Reload python-docx document to sync in-memory state
-        document_manager._documents[key] = Document(key)
+        document_manager.reload_document(key)
 
         return f"Deleted row {row_index} from table {table_index}. Table now has {updated_row_count} rows."
 
@@ -115,6 +119,7 @@ def delete_table_row(path: str, table_index: int, row_index: int) -> str:
         return f"Error: {str(e)}"
 
 
+@document_locked
 def delete_table_column(path: str, table_index: int, col_index: int) -> str:
     """
     Delete a column from an existing table using COM automation (TBL-07).
@@ -147,13 +152,16 @@ def delete_table_column(path: str, table_index: int, col_index: int) -> str:
     """
     try:
         # Validate document is open in DocumentManager
-        key = path if path.startswith("Untitled-") else str(Path(path).resolve())
+        key = path if document_manager.is_untitled(path) else document_manager.resolve_path(path)
         doc = document_manager.get_document(key)
 
         # Check file exists on disk (COM requires saved file)
-        if key.startswith("Untitled-"):
+        if document_manager.is_untitled(key):
             return "Error: Document must be saved to disk before COM operations. Use save_document_as first."
 
+        # A deferred save must reach disk before COM opens the file
+        document_manager.flush_pending_saves(key)
+
         if not Path(key).exists():
             return "Error: Document must be saved to disk before COM operations. Use save_document first."
 
@@ -164,7 +172,7 @@ def delete_table_column(path: str, table_index: int, col_index: int) -> str:
         # Use COM to delete column
         try:
             with com_pool.get_word_app() as word:
-                com_doc = word.Documents.Open(key)
+                com_doc = com_pool.open_document(word, key)
 
                 # Convert 0-based to 1-based for COM
                 com_table_index = table_index + 1
@@ -187,16 +195,16 @@ def delete_table_column(path: str, table_index: int, col_index: int) -> str:
                 # Get updated column count
                 updated_col_count = table.Columns.Count
 
-                # Save and close
+                # Save, leaving the document open in the pool for the next call
                 com_doc.Save()
-                com_doc.Close()
+                com_pool.keep_document(word, key, com_doc)
 
         except Exception as e:
             logger.error("tool_operation_failed", tool="unknown", error=str(e), error_type=type(e).__name__)
             return f"Error: COM automation failed: {str(e)}. Ensure Microsoft Word is installed."
 
         # Reload python-docx document to sync in-memory state
-        document_manager._documents[key] = Document(key)
+        document_manager.reload_document(key)
 
         return f"Deleted column {col_index} from table {table_index}. Table now has {updated_col_count} columns."
 
@@ -207,6 +215,7 @@ def delete_table_column(path: str, table_index: int, col_index: int) -> str:
         return f"Error: {str(e)}"
 
 
+@document_locked
 def tracked_edit_table_cell(
     path: str, table_index: int, row_index: int, col_index: int,
     new_text: str, author: str = "Claude"
@@ -219,9 +228,10 @@ def tracked_edit_table_cell(
     have tracking enabled first (via enable_tracked_changes).
 
     Cell content replacement works by getting the cell range, trimming the trailing
-    cell end marker (\\r\\x07), and assigning new text to the range. This creates
-    a tracked Deletion of old content and tracked Insertion of new content, visible
-    in Word as strikethrough + colored text.
+    cell end marker (\\r\\x07), and assigning the new text to the part of the range
+    that changed (see com_session.apply_min_diff). This creates a tracked Deletion
+    of the old words and tracked Insertion of the new ones, visible in Word as
+    strikethrough + colored text.
 
     PREREQUISITE: Document must be saved to disk first (COM opens files from disk).
     PREREQUISITE: Tracked changes must be enabled (call enable_tracked_changes first).
@@ -257,13 +267,16 @@ def tracked_edit_table_cell(
     """
     try:
         # Validate document is open in DocumentManager
-        key = path if path.startswith("Untitled-") else str(Path(path).resolve())
+        key = path if document_manager.is_untitled(path) else document_manager.resolve_path(path)
         doc = document_manager.get_document(key)
 
         # Check file exists on disk (COM requires saved file)
-        if key.startswith("Untitled-"):
+        if document_manager.is_untitled(key):
             return "Error: Document must be saved to disk before tracked editing. Use save_document_as first."
 
+        # A deferred save must reach disk before COM opens the file
+        document_manager.flush_pending_saves(key)
+
         if not Path(key).exists():
             return "Error: Document must be saved to disk before tracked editing. Use save_document first."
 
@@ -274,15 +287,14 @@ def tracked_edit_table_cell(
         # Use COM to edit table cell with tracked changes
         old_text = ""
         try:
-            with com_pool.get_word_app() as word:
-                com_doc = word.Documents.Open(key)
+            with com_document(key) as (word, com_doc):
 
                 # Verify tracking is enabled
                 if not com_doc.TrackRevisions:
                     return "Error: Tracked changes are not enabled on this document. Call enable_tracked_changes first."
 
                 # Set author for new revisions
-                word.UserName = author
+                com_pool.set_user_name(word, author)
 
                 # Convert 0-based to 1-based for COM
                 com_table_index = table_index + 1
@@ -315,23 +327,26 @@ def tracked_edit_table_cell(
                 # We must exclude this from the range before setting new text
                 cell_range = cell.Range
                 # Trim trailing markers: strip \r\x07 (2 chars) from the end of the range
-                cell_range.End = cell_range.End - 1  # Exclude cell end marker (\x07)
-                if cell_range.Text.endswith('\r'):
+                cell_text = old_text
+                if cell_text.endswith('\x07'):
+                    cell_range.End = cell_range.End - 1  # Exclude cell end marker (\x07)
+                    cell_text = cell_text[:-1]
+                if cell_text.endswith('\r'):
                     cell_range.End = cell_range.End - 1  # Exclude paragraph mark (\r)
+                    cell_text = cell_text[:-1]
 
-                # Replace text (creates Deletion + Insertion revisions when tracking is on)
-                cell_range.Text = new_text
+                # Replace the changed words (creates Deletion + Insertion revisions when tracking is on)
+                apply_min_diff(cell_range, cell_text, new_text)
 
-                # Save and close
-                com_doc.Save()
-                com_doc.Close()
+                # Save (and close, unless a session keeps it open)
+                save_com_document(key, word, com_doc)
 
         except Exception as e:
             logger.error("tool_operation_failed", tool="unknown", error=str(e), error_type=type(e).__name__)
             return f"Error: COM automation failed: {str(e)}. Ensure Microsoft Word is installed."
 
         # Reload python-docx document to sync in-memory state
-        document_manager._documents[key] = Document(key)
+        sync_document(key)
 
         # Prepare success message with text previews
         old_preview_text = old_text.replace('\r', ' ').replace('\x07', '').strip()
@@ -5,26 +5,53 @@ All functions use zero-based indexing for paragraph operations.
 """
 
 from typing import Optional
-from ..document_manager import document_manager
+from ..document_manager import document_manager, document_locked
 from ..logging_config import get_logger
+from .fast_read import ParagraphIndex, iter_paragraphs
 
 logger = get_logger(__name__)
 
+# Default cap on the paragraph lines read_document returns in one call
+READ_MAX_BYTES = 32768
 
+
+def index_shift_note(from_index: int, delta: int, new_count: Optional[int] = None) -> str:
+    """Machine-readable footer describing how an add/delete moved paragraph indexes.
+
+    Paragraphs that were at from_index or later are now at index + delta, so
+    callers can adjust the indexes they hold instead of re-reading the
+    document. Used by the paragraph add/delete tools, tracked or not.
+
+    Examples:
+        index_shift_note(3, -1, 41)  # "[shift: -1 from index 3, new count 41]"
+        index_shift_note(7, 0)       # "[shift: none]"
+    """
+    shift = f"{delta:+d} from index {from_index}" if delta else "none"
+    if new_count is not None:
+        shift += f", new count {new_count}"
+    return f"[shift: {shift}]"
+
+
+@document_locked
 def read_document(
     path: str,
     start_index: Optional[int] = None,
-    end_index: Optional[int] = None
+    end_index: Optional[int] = None,
+    max_bytes: int = READ_MAX_BYTES
 ) -> str:
     """Read document content as a list of indexed paragraphs.
 
     Returns all paragraphs with their indexes, styles, and text content.
     Supports optional pagination via start_index/end_index (inclusive range).
+    Output stops early once the paragraph lines reach max_bytes, ending with
+    a note giving the start_index to continue from.
 
     Args:
         path: Document path or key
         start_index: Optional starting paragraph index (0-based, inclusive)
         end_index: Optional ending paragraph index (0-based, inclusive)
+        max_bytes: Maximum UTF-8 size of the paragraph lines returned
+                   (default: 32768). At least one paragraph is always returned.
 
     Returns:
         Formatted string with paragraph list or error message
@@ -40,7 +67,8 @@ def read_document(
         logger.error("document_not_open", tool="read_document", path=path)
         return f"Error: No document open at '{path}'. Use open_document or create_document first."
 
-    paragraphs = doc.paragraphs
+    # (style name, text) pairs straight from the XML, one style lookup table
+    paragraphs = list(iter_paragraphs(doc))
     total_count = len(paragraphs)
 
     # Check if document is empty (no paragraphs with content)
@@ -48,7 +76,7 @@ def read_document(
         return "Document is empty (0 paragraphs with content)"
 
     # Count non-empty paragraphs
-    content_count = sum(1 for p in paragraphs if p.text.strip())
+    content_count = sum(1 for _, text in paragraphs if text.strip())
     if content_count == 0:
         return "Document is empty (0 paragraphs with content)"
 
@@ -65,15 +93,19 @@ def read_document(
         return f"Error: Invalid end_index {end_index}. Document has {total_count} paragraphs (valid range: 0-{total_count-1})."
     if start_index > end_index:
         return f"Error: start_index ({start_index}) cannot be greater than end_index ({end_index})."
+    if max_bytes < 1:
+        return f"Error: max_bytes must be positive (got {max_bytes})."
 
-    # Build header
-    lines = [f"Document: {path} | Paragraphs: {total_count} | Showing: {start_index}-{end_index}"]
+    # Header is filled in once the last paragraph shown is known
+    lines = [""]
+    used_bytes = 0
+    next_index = None
 
     # Build paragraph list
     for i in range(start_index, end_index + 1):
-        para = paragraphs[i]
-        text = para.text
-        style_name = para.style.name if para.style else "Normal"
+        style_name, text = paragraphs[i]
+        if style_name is None:
+            style_name = "Normal"
 
         # Text preview: full text up to 200 chars, truncated with char count if longer
         if len(text) > 200:
@@ -81,11 +113,25 @@ def read_document(
         else:
             text_preview = text
 
-        lines.append(f"[{i}] ({style_name}) {text_preview}")
+        line = f"[{i}] ({style_name}) {text_preview}"
+        used_bytes += len(line.encode("utf-8")) + 1
+        if used_bytes > max_bytes and i > start_index:
+            next_index = i
+            break
+        lines.append(line)
+
+    shown_end = end_index if next_index is None else next_index - 1
+    lines[0] = f"Document: {path} | Paragraphs: {total_count} | Showing: {start_index}-{shown_end}"
+    if next_index is not None:
+        lines.append(
+            f"--- Output limit of {max_bytes} bytes reached. "
+            f"Call again with start_index={next_index} to continue. ---"
+        )
 
     return "\n".join(lines)
 
 
+@document_locked
 def add_paragraph(
     path: str,
     text: str,
@@ -103,7 +149,8 @@ def add_paragraph(
         style: Optional paragraph style name (e.g., "Normal", "Heading 1")
 
     Returns:
-        Success message with index and updated count, or error message
+        Success message with index, updated count and index shift footer
+        (see index_shift_note), or error message
 
     Examples:
         add_paragraph(key, "New paragraph")  # Appends to end
@@ -115,7 +162,8 @@ def add_paragraph(
         logger.error("document_not_open", tool="add_paragraph", path=path)
         return f"Error: No document open at '{path}'. Use open_document or create_document first."
 
-    para_count = len(doc.paragraphs)
+    paragraphs = ParagraphIndex(doc)
+    para_count = len(paragraphs)
 
     # Determine insertion behavior
     if position is None:
@@ -131,20 +179,26 @@ def add_paragraph(
         if position < 0 or position > para_count:
             return f"Error: Invalid paragraph position {position}. Document has {para_count} paragraphs (valid range: 0-{para_count})."
 
-        new_para = doc.paragraphs[position].insert_paragraph_before(text)
+        new_para = paragraphs[position].insert_paragraph_before(text)
         if style:
             new_para.style = style
         idx = position
 
-    # Update count
-    new_count = len(doc.paragraphs)
+    document_manager.touch(path)
+
+    # Exactly one paragraph was added
+    new_count = para_count + 1
 
     # Preview: first 50 chars
     text_preview = text[:50] if len(text) <= 50 else text[:50] + "..."
 
-    return f"Added paragraph at index {idx}: '{text_preview}'\nDocument now has {new_count} paragraphs."
+    # Appending moves no existing paragraph; inserting moves those from idx on
+    shift = index_shift_note(idx, 1 if idx < para_count else 0, new_count)
+
+    return f"Added paragraph at index {idx}: '{text_preview}'\nDocument now has {new_count} paragraphs. {shift}"
 
 
+@document_locked
 def edit_paragraph(path: str, index: int, new_text: str) -> str:
     """Edit (replace) the text of an existing paragraph by index.
 
@@ -168,13 +222,14 @@ def edit_paragraph(path: str, index: int, new_text: str) -> str:
         logger.error("document_not_open", tool="edit_paragraph", path=path)
         return f"Error: No document open at '{path}'. Use open_document or create_document first."
 
-    para_count = len(doc.paragraphs)
+    paragraphs = ParagraphIndex(doc)
+    para_count = len(paragraphs)
 
     # Validate index
     if index < 0 or index >= para_count:
         return f"Error: Invalid paragraph index {index}. Document has {para_count} paragraphs (valid range: 0-{para_count-1})."
 
-    para = doc.paragraphs[index]
+    para = paragraphs[index]
     old_text = para.text
 
     # Replace text at run level to preserve formatting
@@ -189,6 +244,8 @@ def edit_paragraph(path: str, index: int, new_text: str) -> str:
         for run in runs[1:]:
             run.text = ""
 
+    document_manager.touch(path)
+
     # Previews: first 50 chars each
     old_preview = old_text[:50] if len(old_text) <= 50 else old_text[:50] + "..."
     new_preview = new_text[:50] if len(new_text) <= 50 else new_text[:50] + "..."
@@ -196,18 +253,20 @@ def edit_paragraph(path: str, index: int, new_text: str) -> str:
     return f"Edited paragraph {index}. Was: '{old_preview}' -> Now: '{new_preview}'\nDocument has {para_count} paragraphs."
 
 
+@document_locked
 def delete_paragraph(path: str, index: int) -> str:
     """Delete a paragraph by index.
 
-    WARNING: After deletion, remaining paragraphs shift indexes.
-    Re-read the document to get updated indexes before further operations.
+    After deletion, later paragraphs move up one index. The result ends with a
+    shift footer (see index_shift_note) so callers can adjust the indexes
+    they hold instead of re-reading the document.
 
     Args:
         path: Document path or key
         index: 0-based paragraph index to delete
 
     Returns:
-        Success message with shift warning, or error message
+        Success message with shift footer, or error message
 
     Example:
         delete_paragraph(key, 2)  # Deletes paragraph at index 2
@@ -217,13 +276,14 @@ def delete_paragraph(path: str, index: int) -> str:
         logger.error("document_not_open", tool="delete_paragraph", path=path)
         return f"Error: No document open at '{path}'. Use open_document or create_document first."
 
-    para_count = len(doc.paragraphs)
+    paragraphs = ParagraphIndex(doc)
+    para_count = len(paragraphs)
 
     # Validate index
     if index < 0 or index >= para_count:
         return f"Error: Invalid paragraph index {index}. Document has {para_count} paragraphs (valid range: 0-{para_count-1})."
 
-    para = doc.paragraphs[index]
+    para = paragraphs[index]
     text = para.text
 
     # Text preview
@@ -231,8 +291,11 @@ def delete_paragraph(path: str, index: int) -> str:
 
     # Delete paragraph (python-docx has no native delete API)
     para._element.getparent().remove(para._element)
+    document_manager.touch(path)
+
+    # Exactly one paragraph was removed
+    new_count = para_count - 1
 
-    # Update count
-    new_count = len(doc.paragraphs)
+    shift = index_shift_note(index + 1, -1, new_count)
 
-    return f"Deleted paragraph {index} ('{text_preview}'). Remaining paragraphs have shifted -- re-read document to get updated indexes. Document now has {new_count} paragraphs."
+    return f"Deleted paragraph {index} ('{text_preview}'). Later paragraphs moved up one index. Document now has {new_count} paragraphs. {shift}"
@@ -10,10 +10,10 @@ can be performed, as COM opens files from disk rather than memory.
 """
 
 from pathlib import Path
-from docx import Document
-from ..document_manager import document_manager
-from ..com_pool import com_pool
+from ..document_manager import document_manager, document_locked
+from ..com_pool import com_pool, word_fastmode
 from ..logging_config import get_logger
+from .fast_meta import has_revision_markup
 
 logger = get_logger(__name__)
 
@@ -45,6 +45,7 @@ REVISION_TYPES = {
 }
 
 
+@document_locked
 def enable_tracked_changes(path: str, author: str = "Claude") -> str:
     """
     Enable tracked changes on a document (TRACK-01).
@@ -66,38 +67,41 @@ def enable_tracked_changes(path: str, author: str = "Claude") -> str:
     """
     try:
         # Validate document is open in DocumentManager
-        key = path if path.startswith("Untitled-") else str(Path(path).resolve())
+        key = path if document_manager.is_untitled(path) else document_manager.resolve_path(path)
         doc = document_manager.get_document(key)
 
         # Check file exists on disk (COM requires saved file)
-        if key.startswith("Untitled-"):
+        if document_manager.is_untitled(key):
             return "Error: Document must be saved to disk before enabling tracked changes. Use save_document_as first."
 
+        # A deferred save must reach disk before COM opens the file
+        document_manager.flush_pending_saves(key)
+
         if not Path(key).exists():
             return "Error: Document must be saved to disk before enabling tracked changes. Use save_document first."
 
         # Use COM to enable tracked changes
         try:
-            with com_pool.get_word_app() as word:
-                com_doc = word.Documents.Open(key)
+            with com_pool.get_word_app() as word, word_fastmode(word):
+                com_doc = com_pool.open_document(word, key)
 
                 # Set author for new revisions
-                word.UserName = author
+                com_pool.set_user_name(word, author)
 
                 # Enable tracked changes
                 com_doc.TrackRevisions = True
                 com_doc.ShowRevisions = True
 
-                # Save and close
+                # Save, leaving the document open in the pool for the next call
                 com_doc.Save()
-                com_doc.Close()
+                com_pool.keep_document(word, key, com_doc)
 
         except Exception as e:
             logger.error("tool_operation_failed", tool="enable_tracked_changes", error=str(e), error_type=type(e).__name__)
             return f"Error: COM automation failed: {str(e)}. Ensure Microsoft Word is installed."
 
         # Reload python-docx document to sync in-memory state
-        document_manager._documents[key] = Document(key)
+        document_manager.reload_document(key)
 
         filename = Path(key).name
         return f"Tracked changes enabled on '{filename}'. Author set to '{author}'. All subsequent COM-based edits will be tracked."
@@ -109,6 +113,7 @@ def enable_tracked_changes(path: str, author: str = "Claude") -> str:
         return f"Error: {str(e)}"
 
 
+@document_locked
 def disable_tracked_changes(path: str) -> str:
     """
     Disable tracked changes on a document (TRACK-02).
@@ -127,34 +132,37 @@ def disable_tracked_changes(path: str) -> str:
     """
     try:
         # Validate document is open in DocumentManager
-        key = path if path.startswith("Untitled-") else str(Path(path).resolve())
+        key = path if document_manager.is_untitled(path) else document_manager.resolve_path(path)
         doc = document_manager.get_document(key)
 
         # Check file exists on disk (COM requires saved file)
-        if key.startswith("Untitled-"):
+        if document_manager.is_untitled(key):
             return "Error: Document must be saved to disk before disabling tracked changes. Use save_document_as first."
 
+        # A deferred save must reach disk before COM opens the file
+        document_manager.flush_pending_saves(key)
+
         if not Path(key).exists():
             return "Error: Document must be saved to disk before disabling tracked changes. Use save_document first."
 
         # Use COM to disable tracked changes
         try:
-            with com_pool.get_word_app() as word:
-                com_doc = word.Documents.Open(key)
+            with com_pool.get_word_app() as word, word_fastmode(word):
+                com_doc = com_pool.open_document(word, key)
 
                 # Disable tracked changes
                 com_doc.TrackRevisions = False
 
-                # Save and close
+                # Save, leaving the document open in the pool for the next call
                 com_doc.Save()
-                com_doc.Close()
+                com_pool.keep_document(word, key, com_doc)
 
         except Exception as e:
             logger.error("tool_operation_failed", tool="disable_tracked_changes", error=str(e), error_type=type(e).__name__)
             return f"Error: COM automation failed: {str(e)}. Ensure Microsoft Word is installed."
 
         # Reload python-docx document to sync in-memory state
-        document_manager._documents[key] = Document(key)
+        document_manager.reload_document(key)
 
         filename = Path(key).name
         return f"Tracked changes disabled on '{filename}'. Future edits will not be tracked. Existing revisions are preserved."
@@ -166,6 +174,7 @@ def disable_tracked_changes(path: str) -> str:
         return f"Error: {str(e)}"
 
 
+@document_locked
 def get_tracked_changes(path: str) -> str:
     """
     Read all tracked changes with metadata (TRACK-04).
@@ -193,36 +202,48 @@ def get_tracked_changes(path: str) -> str:
     """
     try:
         # Validate document is open in DocumentManager
-        key = path if path.startswith("Untitled-") else str(Path(path).resolve())
+        key = path if document_manager.is_untitled(path) else document_manager.resolve_path(path)
         doc = document_manager.get_document(key)
 
         # Check file exists on disk (COM requires saved file)
-        if key.startswith("Untitled-"):
+        if document_manager.is_untitled(key):
             return "Error: Document must be saved to disk before reading tracked changes. Use save_document_as first."
 
+        # A deferred save must reach disk before COM opens the file
+        document_manager.flush_pending_saves(key)
+
         if not Path(key).exists():
             return "Error: Document must be saved to disk before reading tracked changes. Use save_document first."
 
+        # No revision markup in the file: nothing for Word to report, so
+        # skip starting it
+        if has_revision_markup(document_manager.file_source(key)) is False:
+            return f"No tracked changes found in '{Path(key).name}'."
+
         # Use COM to read tracked changes (read-only operation)
         revisions = []
         try:
             with com_pool.get_word_app() as word:
-                com_doc = word.Documents.Open(key)
+                com_doc = com_pool.open_document(word, key)
 
-                # Iterate revisions (1-based indexing in COM!)
-                for i in range(1, com_doc.Revisions.Count + 1):
-                    rev = com_doc.Revisions(i)
+                # Iterate revisions (numbered from 1, as in COM). The collection
+                # enumerator walks them in order; Revisions(i) would look each
+                # one up from the start
+                for i, rev in enumerate(com_doc.Revisions, start=1):
 
-                    # Extract metadata
-                    rev_type = REVISION_TYPES.get(rev.Type, f"Unknown({rev.Type})")
+                    # Extract metadata (each property read is a COM round trip:
+                    # read Type once, not again for the fallback name)
+                    type_code = rev.Type
+                    rev_type = REVISION_TYPES.get(type_code) or f"Unknown({type_code})"
                     author = rev.Author
                     text = rev.Range.Text
 
                     # Format date
+                    rev_date = rev.Date
                     try:
-                        date = rev.Date.strftime('%Y-%m-%d %H:%M:%S')
+                        date = rev_date.strftime('%Y-%m-%d %H:%M:%S')
                     except (AttributeError, ValueError):
-                        date = str(rev.Date)
+                        date = str(rev_date)
 
                     revisions.append({
                         'index': i,
@@ -232,8 +253,8 @@ def get_tracked_changes(path: str) -> str:
                         'text': text
                     })
 
-                # Close without saving (read-only operation)
-                com_doc.Close(SaveChanges=0)
+                # Read-only: leave the unchanged document open in the pool
+                com_pool.keep_document(word, key, com_doc)
 
         except Exception as e:
             logger.error("tool_operation_failed", tool="unknown", error=str(e), error_type=type(e).__name__)
@@ -244,12 +265,12 @@ def get_tracked_changes(path: str) -> str:
         if not revisions:
             return f"No tracked changes found in '{filename}'."
 
-        result = f"Tracked changes in '{filename}': {len(revisions)} revision(s)\n\n"
+        lines = [f"Tracked changes in '{filename}': {len(revisions)} revision(s)\n"]
         for rev in revisions:
-            result += f"[{rev['index']}] {rev['type']} by '{rev['author']}' on {rev['date']}\n"
-            result += f"    Text: \"{rev['text']}\"\n"
+            lines.append(f"[{rev['index']}] {rev['type']} by '{rev['author']}' on {rev['date']}")
+            lines.append(f"    Text: \"{rev['text']}\"")
 
-        return result.rstrip()
+        return "\n".join(lines).rstrip()
 
     except ValueError:
         return f"Error: Document not open: {path}"
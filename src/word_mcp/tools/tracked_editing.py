@@ -14,41 +14,163 @@ All functions use the bridge pattern:
 2. Validate document saved to disk (COM needs file on disk)
 3. Open via COM (WordApplication context manager)
 4. Verify tracking enabled (TrackRevisions == True)
-5. Set UserName to author parameter
+5. Set UserName to author parameter (com_pool.set_user_name)
 6. Perform COM-based edit
-7. Save and close via COM
+7. Save via COM (the pool keeps the document open for the next call)
 8. Reload python-docx document to sync state
 
+Steps 3, 7 and 8 go through com_session, so inside tracked_edit_session() a
+run of edits shares one opened document and a single reload. With
+WORD_MCP_OFFLINE_TRACKED=1, appending and deleting paragraphs write the
+revision markup without Word where possible (see offline_tracked).
+
 Phase 6 addition: _translate_paragraph_index translates python-docx body paragraph
 indexes to COM paragraph indexes, skipping table cell paragraphs. COM's
 Document.Paragraphs includes paragraphs inside table cells; python-docx's
 document.paragraphs does not.
+
+The translation map is built with one pass over the COM paragraphs and cached
+per document, keyed by its revision and the file's mtime/size. Edits that
+keep the paragraph structure (or just insert one paragraph) carry the map
+forward, so consecutive tracked edits do not rescan the document.
 """
 
 from pathlib import Path
-from docx import Document
-from ..document_manager import document_manager
-from ..com_pool import com_pool
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..com_pool import com_pool, file_stamp
+from ..document_manager import document_manager, document_locked
 from ..logging_config import get_logger
+from .com_session import apply_min_diff, com_document, save_com_document, sync_document
+from .offline_tracked import (
+    append_tracked_paragraph, body_paragraphs, can_delete_paragraph,
+    delete_tracked_paragraph, offline_enabled, paragraph_text, tracking_enabled,
+)
+from .text import index_shift_note
 
 logger = get_logger(__name__)
 
 # wdWithInTable constant value for COM Information() call
 _WD_WITH_IN_TABLE = 12
 
+# Characters that start a new paragraph when written to a COM range
+_PARAGRAPH_BREAKS = ("\r", "\n")
+
+# Body paragraph -> COM index maps per document key:
+# ((revision, file stamp), COM paragraph count, map)
+_index_maps: Dict[str, Tuple[Tuple[int, Optional[Tuple[int, int]]], int, List[int]]] = {}
+
+
+def _body_paragraph_map(com_doc) -> List[int]:
+    """
+    Map each body paragraph (not inside a table cell) to its COM 1-based index.
+
+    Walks the COM paragraph collection once, in order. Indexing Paragraphs(i)
+    inside the loop would make Word seek from the start on every step.
+
+    Args:
+        com_doc: Open COM Document object
+
+    Returns:
+        List whose i-th entry is the COM index of python-docx body paragraph i
+    """
+    index_map = []
+    for com_index, para in enumerate(com_doc.Paragraphs, start=1):
+        # Check if this paragraph is inside a table cell.
+        # wdWithInTable (constant value 12) returns True for paragraphs inside tables.
+        try:
+            in_table = para.Range.Information(_WD_WITH_IN_TABLE)
+        except Exception:
+            # If Information() fails for any reason, treat as body paragraph
+            in_table = False
+
+        if not in_table:
+            index_map.append(com_index)
+    return index_map
+
+
+def _document_state(key: str) -> Tuple[int, Optional[Tuple[int, int]]]:
+    """Revision and file (mtime_ns, size) an index map is valid for."""
+    return document_manager.revision(key), file_stamp(key)
+
+
+def _unchanged_index_map(key: str) -> Optional[Tuple[int, List[int]]]:
+    """
+    Get the cached index map if the document revision and file are unchanged, else None.
+
+    Returns:
+        Tuple of (COM paragraph count, index map), or None
+    """
+    cached = _index_maps.get(key)
+    if cached is None or cached[0] != _document_state(key):
+        return None
+    return cached[1], cached[2]
+
+
+def _cached_index_map(key: str, com_doc) -> Optional[Tuple[int, List[int]]]:
+    """
+    Get the cached index map for a document if it is still valid, else None.
+
+    A cached map is valid while the document revision, the file on disk and
+    the COM paragraph count are all unchanged.
+
+    Returns:
+        Tuple of (COM paragraph count, index map), or None
+    """
+    cached = _unchanged_index_map(key)
+    if cached is None or cached[0] != com_doc.Paragraphs.Count:
+        return None
+    return cached
+
 
-def _translate_paragraph_index(com_doc, python_docx_index: int) -> int:
+def _paragraph_index_map(key: str, com_doc) -> Tuple[int, List[int]]:
+    """
+    Get the body -> COM paragraph index map for a document, building it if needed.
+
+    Args:
+        key: Document key
+        com_doc: Open COM Document object for key
+
+    Returns:
+        Tuple of (COM paragraph count, index map)
+    """
+    cached = _cached_index_map(key, com_doc)
+    if cached is not None:
+        return cached
+
+    state = _document_state(key)
+    com_count = com_doc.Paragraphs.Count
+    index_map = _body_paragraph_map(com_doc)
+    _index_maps[key] = (state, com_count, index_map)
+    return com_count, index_map
+
+
+def _remember_index_map(key: str, com_count: int, index_map: List[int]):
+    """
+    Record the index map as valid for the document's current state.
+
+    Called after an edit whose effect on the map is known, once the edit is
+    saved (and synced), so the next tracked edit can skip the rescan.
+    """
+    _index_maps[key] = (_document_state(key), com_count, index_map)
+
+
+def evict_index_map(key: str):
+    """Drop the cached index map for a document key (e.g. when it is closed)."""
+    _index_maps.pop(key, None)
+
+
+def _translate_paragraph_index(index_map: List[int], python_docx_index: int) -> int:
     """
     Translate a python-docx body paragraph index to the correct COM paragraph index.
 
     COM's Document.Paragraphs includes paragraphs inside table cells while
-    python-docx's document.paragraphs excludes them. This function iterates the
-    COM paragraph collection, counts only body-level paragraphs (those NOT inside
-    a table cell), and returns the COM 1-based index corresponding to the
-    python-docx 0-based index.
+    python-docx's document.paragraphs excludes them. This function looks the
+    python-docx 0-based index up in the document's body paragraph map (see
+    _paragraph_index_map) and returns the corresponding COM 1-based index.
 
     Args:
-        com_doc: Open COM Document object
+        index_map: Body paragraph map from _paragraph_index_map()
         python_docx_index: Zero-based body paragraph index (as used by python-docx)
 
     Returns:
@@ -58,37 +180,32 @@ def _translate_paragraph_index(com_doc, python_docx_index: int) -> int:
         IndexError: If python_docx_index is out of range for the body paragraph count
         ValueError: If python_docx_index is negative
     """
+    _check_paragraph_index(len(index_map), python_docx_index)
+    return index_map[python_docx_index]
+
+
+def _check_paragraph_index(body_paragraph_count: int, python_docx_index: int):
+    """
+    Raise IndexError/ValueError (see _translate_paragraph_index) for an invalid body paragraph index.
+    """
     if python_docx_index < 0:
         raise ValueError(f"Paragraph index must be non-negative, got {python_docx_index}")
 
-    total_com_paragraphs = com_doc.Paragraphs.Count
-    body_paragraph_count = 0
+    if python_docx_index >= body_paragraph_count:
+        raise IndexError(
+            f"Paragraph index {python_docx_index} is out of range. "
+            f"Document has {body_paragraph_count} body paragraph(s) "
+            f"(valid range: 0-{body_paragraph_count - 1})."
+        )
 
-    for com_index in range(1, total_com_paragraphs + 1):
-        para = com_doc.Paragraphs(com_index)
 
-        # Check if this paragraph is inside a table cell.
-        # wdWithInTable (constant value 12) returns True for paragraphs inside tables.
-        try:
-            in_table = para.Range.Information(_WD_WITH_IN_TABLE)
-        except Exception:
-            # If Information() fails for any reason, treat as body paragraph
-            in_table = False
-
-        if not in_table:
-            # This is a body-level paragraph
-            if body_paragraph_count == python_docx_index:
-                return com_index
-            body_paragraph_count += 1
-
-    # If we reach here, the index is out of range
-    raise IndexError(
-        f"Paragraph index {python_docx_index} is out of range. "
-        f"Document has {body_paragraph_count} body paragraph(s) "
-        f"(valid range: 0-{body_paragraph_count - 1})."
-    )
+def _added_message(position: str, text: str, author: str, shift: str) -> str:
+    """Success message of tracked_add_paragraph."""
+    text_preview = text[:50] + "..." if len(text) > 50 else text
+    return f"Added tracked paragraph at {position}: '{text_preview}'. Revision will appear as insertion by '{author}'. {shift}"
 
 
+@document_locked
 def tracked_add_paragraph(
     path: str, text: str, position: str = "end", author: str = "Claude",
     expected_text: str = None
@@ -115,27 +232,31 @@ def tracked_add_paragraph(
                        at the wrong location when paragraph indexes have shifted.
 
     Returns:
-        Success message or error message prefixed with "Error:"
+        Success message ending with an index shift footer (see
+        text.index_shift_note), or error message prefixed with "Error:"
 
     Examples:
         >>> tracked_add_paragraph("C:/Documents/report.docx", "New paragraph", "end", "Claude")
-        "Added tracked paragraph at end: 'New paragraph'. Revision will appear as insertion by 'Claude'."
+        "Added tracked paragraph at end: 'New paragraph'. Revision will appear as insertion by 'Claude'. [shift: none, new count 13]"
 
         >>> tracked_add_paragraph("C:/Documents/report.docx", "First", "0", "Claude")
-        "Added tracked paragraph at 0: 'First'. Revision will appear as insertion by 'Claude'."
+        "Added tracked paragraph at 0: 'First'. Revision will appear as insertion by 'Claude'. [shift: +1 from index 0, new count 14]"
 
         >>> tracked_add_paragraph("C:/Documents/report.docx", "New intro", "5", "Claude", expected_text="Introduction")
         "Error: Content verification failed for paragraph 5. Expected text containing 'Introduction' but found: 'Background section content here'. The paragraph may have shifted -- re-read the document."
     """
     try:
         # Validate document is open in DocumentManager
-        key = path if path.startswith("Untitled-") else str(Path(path).resolve())
+        key = path if document_manager.is_untitled(path) else document_manager.resolve_path(path)
         doc = document_manager.get_document(key)
 
         # Check file exists on disk (COM requires saved file)
-        if key.startswith("Untitled-"):
+        if document_manager.is_untitled(key):
             return "Error: Document must be saved to disk before tracked editing. Use save_document_as first."
 
+        # A deferred save must reach disk before COM opens the file
+        document_manager.flush_pending_saves(key)
+
         if not Path(key).exists():
             return "Error: Document must be saved to disk before tracked editing. Use save_document first."
 
@@ -148,34 +269,68 @@ def tracked_add_paragraph(
             except ValueError:
                 return f"Error: Invalid position '{position}'. Must be 'end' or a zero-based integer index."
 
+        # Offline path: append the revision markup without Word
+        if offline_enabled(key):
+            if not tracking_enabled(doc):
+                return "Error: Tracked changes are not enabled on this document. Call enable_tracked_changes first."
+            if position == "end":
+                cached = _unchanged_index_map(key)
+                body_count = len(body_paragraphs(doc))
+                if append_tracked_paragraph(key, doc, text, author):
+                    if cached is not None:
+                        com_count, index_map = cached
+                        _remember_index_map(key, com_count + 1, index_map + [com_count + 1])
+                    return _added_message(position, text, author, index_shift_note(body_count, 0, body_count + 1))
+
         # Use COM to add paragraph with tracked changes
+        # (COM paragraph count, index map) after the insert, when known
+        updated_map = None
+        shift = index_shift_note(0, 0)
         try:
-            with com_pool.get_word_app() as word:
-                com_doc = word.Documents.Open(key)
+            with com_document(key) as (word, com_doc):
 
                 # Verify tracking is enabled
                 if not com_doc.TrackRevisions:
                     return "Error: Tracked changes are not enabled on this document. Call enable_tracked_changes first."
 
                 # Set author for new revisions
-                word.UserName = author
+                com_pool.set_user_name(word, author)
 
                 # Add paragraph
                 if position == "end":
+                    cached = _cached_index_map(key, com_doc)
+                    com_count = cached[0] if cached is not None else com_doc.Paragraphs.Count
+
                     # Append to end: InsertAfter with \r creates new paragraph
                     com_doc.Content.InsertAfter("\r" + text)
+
+                    # New paragraphs (more than one if text has breaks) follow
+                    # the last one, in the body; no existing index moves
+                    added = com_doc.Paragraphs.Count - com_count
+                    if cached is not None:
+                        index_map = cached[1]
+                        updated_map = (
+                            com_count + added,
+                            index_map + [com_count + 1 + k for k in range(added)],
+                        )
+                        shift = index_shift_note(len(index_map), 0, len(index_map) + added)
                 else:
                     position_int = int(position)
 
                     # Translate python-docx index to COM index
                     try:
-                        com_index = _translate_paragraph_index(com_doc, position_int)
+                        com_count, index_map = _paragraph_index_map(key, com_doc)
+                        com_index = _translate_paragraph_index(index_map, position_int)
                     except (IndexError, ValueError) as e:
                         return f"Error: {str(e)}"
 
+                    # Paragraphs(i) makes Word walk from the first paragraph:
+                    # fetch the range once for verification and insertion
+                    para_range = com_doc.Paragraphs(com_index).Range
+
                     # Content verification before inserting
                     if expected_text is not None:
-                        para_text = com_doc.Paragraphs(com_index).Range.Text
+                        para_text = para_range.Text
                         if expected_text not in para_text:
                             actual_preview = para_text[:80].replace('\r', ' ').replace('\x07', '')
                             return (
@@ -184,24 +339,32 @@ def tracked_add_paragraph(
                                 f"'{actual_preview}'. The paragraph may have shifted -- re-read the document."
                             )
 
-                    # Get paragraph range and insert before
-                    para_range = com_doc.Paragraphs(com_index).Range
+                    # Insert before the paragraph
                     para_range.InsertBefore(text + "\r")
 
-                # Save and close
-                com_doc.Save()
-                com_doc.Close()
+                    # The new paragraphs take com_index on; later ones shift by
+                    # as many, so the map is patched rather than rebuilt
+                    added = com_doc.Paragraphs.Count - com_count
+                    updated_map = (
+                        com_count + added,
+                        index_map[:position_int] + [com_index + k for k in range(added)]
+                        + [i + added for i in index_map[position_int:]],
+                    )
+                    shift = index_shift_note(position_int, added, len(index_map) + added)
+
+                # Save (and close, unless a session keeps it open)
+                save_com_document(key, word, com_doc)
 
         except Exception as e:
             logger.error("tool_operation_failed", tool="unknown", error=str(e), error_type=type(e).__name__)
             return f"Error: COM automation failed: {str(e)}. Ensure Microsoft Word is installed."
 
         # Reload python-docx document to sync in-memory state
-        document_manager._documents[key] = Document(key)
+        sync_document(key)
+        if updated_map is not None:
+            _remember_index_map(key, *updated_map)
 
-        # Prepare success message
-        text_preview = text[:50] + "..." if len(text) > 50 else text
-        return f"Added tracked paragraph at {position}: '{text_preview}'. Revision will appear as insertion by '{author}'."
+        return _added_message(position, text, author, shift)
 
     except ValueError:
         return f"Error: Document not open: {path}"
@@ -210,6 +373,7 @@ def tracked_add_paragraph(
         return f"Error: {str(e)}"
 
 
+@document_locked
 def tracked_edit_paragraph(
     path: str, index: int, new_text: str, author: str = "Claude",
     expected_text: str = None
@@ -251,32 +415,36 @@ def tracked_edit_paragraph(
     """
     try:
         # Validate document is open in DocumentManager
-        key = path if path.startswith("Untitled-") else str(Path(path).resolve())
+        key = path if document_manager.is_untitled(path) else document_manager.resolve_path(path)
         doc = document_manager.get_document(key)
 
         # Check file exists on disk (COM requires saved file)
-        if key.startswith("Untitled-"):
+        if document_manager.is_untitled(key):
             return "Error: Document must be saved to disk before tracked editing. Use save_document_as first."
 
+        # A deferred save must reach disk before COM opens the file
+        document_manager.flush_pending_saves(key)
+
         if not Path(key).exists():
             return "Error: Document must be saved to disk before tracked editing. Use save_document first."
 
         # Use COM to edit paragraph with tracked changes
         old_text = ""
+        updated_map = None
         try:
-            with com_pool.get_word_app() as word:
-                com_doc = word.Documents.Open(key)
+            with com_document(key) as (word, com_doc):
 
                 # Verify tracking is enabled
                 if not com_doc.TrackRevisions:
                     return "Error: Tracked changes are not enabled on this document. Call enable_tracked_changes first."
 
                 # Set author for new revisions
-                word.UserName = author
+                com_pool.set_user_name(word, author)
 
                 # Translate python-docx index to COM index
                 try:
-                    com_index = _translate_paragraph_index(com_doc, index)
+                    com_count, index_map = _paragraph_index_map(key, com_doc)
+                    com_index = _translate_paragraph_index(index_map, index)
                 except (IndexError, ValueError) as e:
                     return f"Error: {str(e)}"
 
@@ -298,22 +466,30 @@ def tracked_edit_paragraph(
 
                 # Strip trailing paragraph mark from range for replacement
                 # Range.Text includes \r at the end, we need to exclude it for clean replacement
-                if para_range.Text.endswith('\r'):
+                # (old_text is that text: no second read across COM)
+                body_text = old_text
+                if old_text.endswith('\r'):
                     para_range.End = para_range.End - 1
+                    body_text = old_text[:-1]
 
-                # Replace text (creates Deletion + Insertion revisions when tracking is on)
-                para_range.Text = new_text
+                # Replace the changed words (creates Deletion + Insertion revisions when tracking is on)
+                apply_min_diff(para_range, body_text, new_text)
 
-                # Save and close
-                com_doc.Save()
-                com_doc.Close()
+                # Paragraph structure is unchanged unless new_text adds breaks
+                if not any(mark in new_text for mark in _PARAGRAPH_BREAKS):
+                    updated_map = (com_count, index_map)
+
+                # Save (and close, unless a session keeps it open)
+                save_com_document(key, word, com_doc)
 
         except Exception as e:
             logger.error("tool_operation_failed", tool="unknown", error=str(e), error_type=type(e).__name__)
             return f"Error: COM automation failed: {str(e)}. Ensure Microsoft Word is installed."
 
         # Reload python-docx document to sync in-memory state
-        document_manager._documents[key] = Document(key)
+        sync_document(key)
+        if updated_map is not None:
+            _remember_index_map(key, *updated_map)
 
         # Prepare success message with text previews
         old_preview = old_text[:50].strip() + "..." if len(old_text) > 50 else old_text.strip()
@@ -327,6 +503,193 @@ def tracked_edit_paragraph(
         return f"Error: {str(e)}"
 
 
+@document_locked
+def tracked_edit_paragraphs(
+    path: str, edits: List[Dict[str, Any]], author: str = "Claude"
+) -> str:
+    """
+    Edit several paragraphs as tracked changes with one COM open and one save.
+
+    Equivalent to calling tracked_edit_paragraph once per edit, but the
+    document is opened, saved and reloaded once for the whole list. All edits
+    are validated first (index in range, no duplicates, expected_text match);
+    if any fails, nothing is changed and every failure is reported.
+
+    Indexes refer to the document as it is before the call: edits are applied
+    from the last paragraph to the first, so an edit whose new_text contains
+    paragraph breaks does not shift the others.
+
+    Args:
+        path: Path or key of open document
+        edits: List of edits, each a dict with:
+               - index: Zero-based paragraph index (python-docx body paragraph index)
+               - new_text: New text content for the paragraph
+               - expected_text: Optional content verification string (see
+                 tracked_edit_paragraph)
+        author: Author name for the tracked changes (default: "Claude")
+
+    Returns:
+        Summary listing each edit, or error message prefixed with "Error:"
+        listing every edit that failed validation
+
+    Examples:
+        >>> tracked_edit_paragraphs("C:/Documents/report.docx", [
+        ...     {"index": 0, "new_text": "New title"},
+        ...     {"index": 3, "new_text": "Revised intro", "expected_text": "Introduction"},
+        ... ])
+        '''Edited 2 tracked paragraph(s). Changes tracked as revisions by 'Claude'.
+          [0] paragraph 0: 'Old title' -> 'New title'
+          [1] paragraph 3: 'Introduction text' -> 'Revised intro'
+        '''
+
+        >>> tracked_edit_paragraphs("C:/Documents/report.docx", [{"index": 99, "new_text": "x"}])
+        '''Error: No edits applied. 1 of 1 edit(s) failed validation:
+          [0] Paragraph index 99 is out of range. Document has 12 body paragraph(s) (valid range: 0-11).
+        '''
+    """
+    try:
+        # Validate document is open in DocumentManager
+        key = path if document_manager.is_untitled(path) else document_manager.resolve_path(path)
+        doc = document_manager.get_document(key)
+
+        # Check file exists on disk (COM requires saved file)
+        if document_manager.is_untitled(key):
+            return "Error: Document must be saved to disk before tracked editing. Use save_document_as first."
+
+        # A deferred save must reach disk before COM opens the file
+        document_manager.flush_pending_saves(key)
+
+        if not Path(key).exists():
+            return "Error: Document must be saved to disk before tracked editing. Use save_document first."
+
+        if not edits:
+            return "Error: No edits given."
+
+        # Check the shape of each edit before touching COM
+        failures = []
+        seen = set()
+        for position, edit in enumerate(edits):
+            if not (isinstance(edit, dict) and isinstance(edit.get("index"), int)
+                    and isinstance(edit.get("new_text"), str)):
+                failures.append((position, "Each edit needs an integer 'index' and a string 'new_text'."))
+            elif edit["index"] in seen:
+                failures.append((position, f"Paragraph {edit['index']} is edited more than once."))
+            else:
+                seen.add(edit["index"])
+        if failures:
+            return _edit_failures(failures, len(edits))
+
+        # Use COM to edit the paragraphs with tracked changes
+        changes = []
+        updated_map = None
+        try:
+            with com_document(key) as (word, com_doc):
+
+                # Verify tracking is enabled
+                if not com_doc.TrackRevisions:
+                    return "Error: Tracked changes are not enabled on this document. Call enable_tracked_changes first."
+
+                com_count, index_map = _paragraph_index_map(key, com_doc)
+
+                # Validate every edit, capturing the current text
+                targets = []
+                for position, edit in enumerate(edits):
+                    index = edit["index"]
+                    try:
+                        com_index = _translate_paragraph_index(index_map, index)
+                    except (IndexError, ValueError) as e:
+                        failures.append((position, str(e)))
+                        continue
+
+                    para_range = com_doc.Paragraphs(com_index).Range
+                    old_text = para_range.Text
+                    expected_text = edit.get("expected_text")
+                    if expected_text is not None and expected_text not in old_text:
+                        actual_preview = old_text[:80].replace('\r', ' ').replace('\x07', '')
+                        failures.append((
+                            position,
+                            f"Content verification failed for paragraph {index}. "
+                            f"Expected text containing '{expected_text}' but found: '{actual_preview}'."
+                        ))
+                        continue
+                    targets.append((com_index, position, para_range, old_text))
+
+                if failures:
+                    return _edit_failures(failures, len(edits))
+
+                # Set author for new revisions
+                com_pool.set_user_name(word, author)
+
+                # Last paragraph first, so breaks in new_text shift nothing still to edit
+                for com_index, position, para_range, old_text in sorted(targets, reverse=True, key=lambda t: t[0]):
+                    new_text = edits[position]["new_text"]
+
+                    # Exclude the trailing paragraph mark from the replacement
+                    body_text = old_text
+                    if old_text.endswith('\r'):
+                        para_range.End = para_range.End - 1
+                        body_text = old_text[:-1]
+
+                    # Replace the changed words (creates Deletion + Insertion revisions when tracking is on)
+                    apply_min_diff(para_range, body_text, new_text)
+                    changes.append((position, old_text, new_text))
+
+                # Paragraph structure is unchanged unless some new_text adds breaks
+                if not any(mark in edit["new_text"] for edit in edits for mark in _PARAGRAPH_BREAKS):
+                    updated_map = (com_count, index_map)
+
+                # Save once for all edits (and close, unless a session keeps it open)
+                save_com_document(key, word, com_doc)
+
+        except Exception as e:
+            logger.error("tool_operation_failed", tool="tracked_edit_paragraphs", error=str(e), error_type=type(e).__name__)
+            return f"Error: COM automation failed: {str(e)}. Ensure Microsoft Word is installed."
+
+        # Reload python-docx document to sync in-memory state
+        sync_document(key)
+        if updated_map is not None:
+            _remember_index_map(key, *updated_map)
+
+        # Summary in request order
+        lines = [f"Edited {len(changes)} tracked paragraph(s). Changes tracked as revisions by '{author}'."]
+        for position, old_text, new_text in sorted(changes):
+            old_preview = old_text[:50].strip() + "..." if len(old_text) > 50 else old_text.strip()
+            new_preview = new_text[:50] + "..." if len(new_text) > 50 else new_text
+            lines.append(f"  [{position}] paragraph {edits[position]['index']}: '{old_preview}' -> '{new_preview}'")
+        return "\n".join(lines)
+
+    except ValueError:
+        return f"Error: Document not open: {path}"
+    except Exception as e:
+        logger.error("tool_operation_failed", tool="unknown", error=str(e), error_type=type(e).__name__)
+        return f"Error: {str(e)}"
+
+
+def _edit_failures(failures: List[Tuple[int, str]], total: int) -> str:
+    """Format the validation failures of tracked_edit_paragraphs as one error message."""
+    lines = [f"Error: No edits applied. {len(failures)} of {total} edit(s) failed validation:"]
+    for position, message in failures:
+        lines.append(f"  [{position}] {message}")
+    return "\n".join(lines)
+
+
+def _verification_error(index: int, expected_text: str, para_text: str) -> str:
+    """Error returned when expected_text is not in the paragraph to delete."""
+    actual_preview = para_text[:80].replace('\r', ' ').replace('\x07', '')
+    return (
+        f"Error: Content verification failed for paragraph {index}. "
+        f"Expected text containing '{expected_text}' but found: "
+        f"'{actual_preview}'. The paragraph may have shifted -- re-read the document."
+    )
+
+
+def _deleted_message(index: int, deleted_text: str, author: str) -> str:
+    """First sentences of tracked_delete_paragraph's success message."""
+    text_preview = deleted_text[:50].strip() + "..." if len(deleted_text) > 50 else deleted_text.strip()
+    return f"Deleted tracked paragraph {index} ('{text_preview}'). Deletion tracked as revision by '{author}'."
+
+
+@document_locked
 def tracked_delete_paragraph(
     path: str, index: int, author: str = "Claude", expected_text: str = None
 ) -> str:
@@ -341,8 +704,11 @@ def tracked_delete_paragraph(
     paragraph indexes to COM paragraph indexes, so that documents with tables are
     handled correctly.
 
-    INDEX SHIFT WARNING: After deletion, remaining paragraphs shift down.
-    Re-read the document before performing additional operations.
+    INDEX SHIFT: With tracking on, Word keeps the deleted paragraph (shown as a
+    tracked deletion) until the revision is accepted, so indexes normally do not
+    change. The result ends with a shift footer (see text.index_shift_note)
+    stating what moved; if Word reports an unexpected paragraph count, the
+    result says to re-read the document instead.
 
     Args:
         path: Path or key of open document
@@ -359,39 +725,67 @@ def tracked_delete_paragraph(
 
     Examples:
         >>> tracked_delete_paragraph("C:/Documents/report.docx", 2, "Claude")
-        "Deleted tracked paragraph 2 ('Old text'). Deletion tracked as revision by 'Claude'. Remaining paragraphs have shifted -- re-read document to get updated indexes."
+        "Deleted tracked paragraph 2 ('Old text'). Deletion tracked as revision by 'Claude'. The paragraph stays in place as a tracked deletion until accepted. [shift: none, new count 12]"
 
         >>> tracked_delete_paragraph("C:/Documents/report.docx", 5, "Claude", expected_text="Obsolete section")
         "Error: Content verification failed for paragraph 5. Expected text containing 'Obsolete section' but found: 'Introduction text here'. The paragraph may have shifted -- re-read the document."
     """
     try:
         # Validate document is open in DocumentManager
-        key = path if path.startswith("Untitled-") else str(Path(path).resolve())
+        key = path if document_manager.is_untitled(path) else document_manager.resolve_path(path)
         doc = document_manager.get_document(key)
 
         # Check file exists on disk (COM requires saved file)
-        if key.startswith("Untitled-"):
+        if document_manager.is_untitled(key):
             return "Error: Document must be saved to disk before tracked editing. Use save_document_as first."
 
+        # A deferred save must reach disk before COM opens the file
+        document_manager.flush_pending_saves(key)
+
         if not Path(key).exists():
             return "Error: Document must be saved to disk before tracked editing. Use save_document first."
 
+        # Offline path: mark the paragraph deleted without Word
+        if offline_enabled(key):
+            if not tracking_enabled(doc):
+                return "Error: Tracked changes are not enabled on this document. Call enable_tracked_changes first."
+            paragraphs = body_paragraphs(doc)
+            try:
+                _check_paragraph_index(len(paragraphs), index)
+            except (IndexError, ValueError) as e:
+                return f"Error: {str(e)}"
+            p = paragraphs[index]
+            if can_delete_paragraph(doc, p):
+                deleted_text = paragraph_text(p)
+                if expected_text is not None and expected_text not in deleted_text:
+                    return _verification_error(index, expected_text, deleted_text)
+                cached = _unchanged_index_map(key)
+                delete_tracked_paragraph(key, doc, p, author)
+                if cached is not None:
+                    _remember_index_map(key, *cached)
+                return (
+                    f"{_deleted_message(index, deleted_text, author)} The paragraph stays in place "
+                    f"as a tracked deletion until accepted. {index_shift_note(index + 1, 0, len(paragraphs))}"
+                )
+
         # Use COM to delete paragraph with tracked changes
         deleted_text = ""
+        updated_map = None
+        shift = None
         try:
-            with com_pool.get_word_app() as word:
-                com_doc = word.Documents.Open(key)
+            with com_document(key) as (word, com_doc):
 
                 # Verify tracking is enabled
                 if not com_doc.TrackRevisions:
                     return "Error: Tracked changes are not enabled on this document. Call enable_tracked_changes first."
 
                 # Set author for new revisions
-                word.UserName = author
+                com_pool.set_user_name(word, author)
 
                 # Translate python-docx index to COM index
                 try:
-                    com_index = _translate_paragraph_index(com_doc, index)
+                    com_count, index_map = _paragraph_index_map(key, com_doc)
+                    com_index = _translate_paragraph_index(index_map, index)
                 except (IndexError, ValueError) as e:
                     return f"Error: {str(e)}"
 
@@ -404,30 +798,43 @@ def tracked_delete_paragraph(
                 # Content verification before deleting
                 if expected_text is not None:
                     if expected_text not in deleted_text:
-                        actual_preview = deleted_text[:80].replace('\r', ' ').replace('\x07', '')
-                        return (
-                            f"Error: Content verification failed for paragraph {index}. "
-                            f"Expected text containing '{expected_text}' but found: "
-                            f"'{actual_preview}'. The paragraph may have shifted -- re-read the document."
-                        )
+                        return _verification_error(index, expected_text, deleted_text)
 
                 # Delete (creates Deletion revision when tracking is on)
                 para_range.Delete()
 
-                # Save and close
-                com_doc.Save()
-                com_doc.Close()
+                # A tracked deletion normally keeps the paragraph until the
+                # revision is accepted; patch the map for whatever Word did
+                removed = com_count - com_doc.Paragraphs.Count
+                if removed == 0:
+                    updated_map = (com_count, index_map)
+                    shift = index_shift_note(index + 1, 0, len(index_map))
+                elif removed == 1:
+                    updated_map = (
+                        com_count - 1,
+                        index_map[:index] + [i - 1 for i in index_map[index + 1:]],
+                    )
+                    shift = index_shift_note(index + 1, -1, len(index_map) - 1)
+
+                # Save (and close, unless a session keeps it open)
+                save_com_document(key, word, com_doc)
 
         except Exception as e:
             logger.error("tool_operation_failed", tool="unknown", error=str(e), error_type=type(e).__name__)
             return f"Error: COM automation failed: {str(e)}. Ensure Microsoft Word is installed."
 
         # Reload python-docx document to sync in-memory state
-        document_manager._documents[key] = Document(key)
-
-        # Prepare success message with text preview and index shift warning
-        text_preview = deleted_text[:50].strip() + "..." if len(deleted_text) > 50 else deleted_text.strip()
-        return f"Deleted tracked paragraph {index} ('{text_preview}'). Deletion tracked as revision by '{author}'. Remaining paragraphs have shifted -- re-read document to get updated indexes."
+        sync_document(key)
+        if updated_map is not None:
+            _remember_index_map(key, *updated_map)
+
+        # Prepare success message with text preview and index shift footer
+        message = _deleted_message(index, deleted_text, author)
+        if updated_map is None:
+            return f"{message} Remaining paragraphs have shifted -- re-read document to get updated indexes."
+        if updated_map[0] == com_count:
+            return f"{message} The paragraph stays in place as a tracked deletion until accepted. {shift}"
+        return f"{message} Later paragraphs moved up one index. {shift}"
 
     except ValueError:
         return f"Error: Document not open: {path}"